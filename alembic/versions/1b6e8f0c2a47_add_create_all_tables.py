@@ -0,0 +1,269 @@
+"""add_create_all_tables
+
+Tables that predate the first migration, as the models defined them when
+the schema was still created with Base.metadata.create_all. 77cbf9c54007
+only added notifications, so databases built by create_all already have
+these; each table is created only if it is missing.
+
+Revision ID: 1b6e8f0c2a47
+Revises: 77cbf9c54007
+Create Date: 2026-10-17 20:05:31.447192
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b6e8f0c2a47'
+down_revision = '77cbf9c54007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables from create_all databases are already there; an empty database
+    # skips 77cbf9c54007 (see app/db/migrations.py) and gets notifications here.
+    # Offline SQL runs the whole chain, so 77cbf9c54007 has made notifications.
+    if context.is_offline_mode():
+        existing = {'notifications'}
+    else:
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'students' not in existing:
+        op.create_table('students',
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('forename', sa.String(length=100), nullable=False),
+        sa.Column('surname', sa.String(length=100), nullable=False),
+        sa.Column('cohort', sa.String(length=50), nullable=True),
+        sa.Column('course_code', sa.String(length=20), nullable=True),
+        sa.Column('quercus_course_name', sa.String(length=200), nullable=True),
+        sa.Column('subject_area', sa.String(length=100), nullable=True),
+        sa.Column('programme_of_study', sa.String(length=200), nullable=True),
+        sa.Column('mode', sa.String(length=50), nullable=True),
+        sa.Column('international_student', sa.Boolean(), nullable=True),
+        sa.Column('previous_ehu_student', sa.Boolean(), nullable=True),
+        sa.Column('previous_ehu_undergraduate', sa.Boolean(), nullable=True),
+        sa.Column('previous_ehu_pgt_student', sa.Boolean(), nullable=True),
+        sa.Column('previous_ehu_mres_student', sa.Boolean(), nullable=True),
+        sa.Column('previous_institution', sa.String(length=200), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('student_notes', sa.Text(), nullable=True, comment='General notes about the student - special circumstances or important background information'),
+        sa.PrimaryKeyConstraint('student_number')
+        )
+        op.create_index(op.f('ix_students_student_number'), 'students', ['student_number'], unique=False)
+    if 'supervisors' not in existing:
+        op.create_table('supervisors',
+        sa.Column('supervisor_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('supervisor_name', sa.String(length=150), nullable=False),
+        sa.Column('email', sa.String(length=100), nullable=True),
+        sa.Column('department', sa.String(length=100), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('supervisor_notes', sa.Text(), nullable=True, comment='Notes about supervisor specializations - availability or supervisory preferences'),
+        sa.PrimaryKeyConstraint('supervisor_id')
+        )
+        op.create_index(op.f('ix_supervisors_supervisor_id'), 'supervisors', ['supervisor_id'], unique=False)
+    if 'users' not in existing:
+        op.create_table('users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=100), nullable=False),
+        sa.Column('email', sa.String(length=100), nullable=False),
+        sa.Column('hashed_password', sa.String(length=255), nullable=False),
+        sa.Column('role', sa.String(length=50), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('first_name', sa.String(length=100), nullable=True),
+        sa.Column('last_name', sa.String(length=100), nullable=True),
+        sa.Column('department', sa.String(length=100), nullable=True),
+        sa.Column('phone_number', sa.String(length=20), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+        op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+        op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    if 'notifications' not in existing:
+        op.create_table('notifications',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.Enum('EMAIL', 'SMS', 'IN_APP', 'PUSH', name='notificationtype'), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('action_type', sa.String(length=100), nullable=False),
+        sa.Column('related_entity_type', sa.String(length=50), nullable=True),
+        sa.Column('related_entity_id', sa.Integer(), nullable=True),
+        sa.Column('priority', sa.Enum('LOW', 'NORMAL', 'HIGH', 'URGENT', name='notificationpriority'), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'SENT', 'FAILED', 'DELIVERED', name='notificationstatus'), nullable=True),
+        sa.Column('recipient_email', sa.String(length=255), nullable=True),
+        sa.Column('recipient_phone', sa.String(length=20), nullable=True),
+        sa.Column('scheduled_at', sa.DateTime(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.Column('delivered_at', sa.DateTime(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('retry_count', sa.Integer(), nullable=True),
+        sa.Column('max_retries', sa.Integer(), nullable=True),
+        sa.Column('extra_data', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_notifications_id'), 'notifications', ['id'], unique=False)
+    if 'appraisals' not in existing:
+        op.create_table('appraisals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('academic_year', sa.String(length=10), nullable=False),
+        sa.Column('appraisal_period', sa.String(length=50), nullable=True),
+        sa.Column('due_date', sa.Date(), nullable=True),
+        sa.Column('student_submission_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('dos_submission_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('review_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('student_progress_report', sa.Text(), nullable=True),
+        sa.Column('student_achievements', sa.Text(), nullable=True),
+        sa.Column('student_challenges', sa.Text(), nullable=True),
+        sa.Column('student_goals', sa.Text(), nullable=True),
+        sa.Column('student_development_needs', sa.Text(), nullable=True),
+        sa.Column('dos_comments', sa.Text(), nullable=True),
+        sa.Column('dos_progress_rating', sa.String(length=20), nullable=True),
+        sa.Column('dos_recommendations', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'STUDENT_SUBMITTED', 'DOS_SUBMITTED', 'UNDER_REVIEW', 'APPROVED', 'UNSATISFACTORY', 'RESUBMISSION_REQUIRED', name='appraisalstatus'), nullable=True),
+        sa.Column('reviewer_id', sa.Integer(), nullable=True),
+        sa.Column('reviewer_comments', sa.Text(), nullable=True),
+        sa.Column('approved_by', sa.Integer(), nullable=True),
+        sa.Column('action_required', sa.Boolean(), nullable=True),
+        sa.Column('action_description', sa.Text(), nullable=True),
+        sa.Column('action_deadline', sa.Date(), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['approved_by'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['reviewer_id'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['student_number'], ['students.student_number'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_appraisals_id'), 'appraisals', ['id'], unique=False)
+    if 'registrations' not in existing:
+        op.create_table('registrations',
+        sa.Column('registration_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('registration_status', sa.String(length=50), nullable=True),
+        sa.Column('original_registration_deadline', sa.Date(), nullable=True),
+        sa.Column('registration_extension_request_date', sa.Date(), nullable=True),
+        sa.Column('date_of_registration_extension_approval', sa.Date(), nullable=True),
+        sa.Column('registration_extension_length_days', sa.Integer(), nullable=True),
+        sa.Column('revised_registration_deadline', sa.Date(), nullable=True),
+        sa.Column('date_pgr_moved_to_new_blackboard_group', sa.Date(), nullable=True),
+        sa.Column('pgr_registration_process_completed', sa.Boolean(), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['student_number'], ['students.student_number'], ),
+        sa.PrimaryKeyConstraint('registration_id')
+        )
+        op.create_index(op.f('ix_registrations_registration_id'), 'registrations', ['registration_id'], unique=False)
+    if 'student_supervisors' not in existing:
+        op.create_table('student_supervisors',
+        sa.Column('student_supervisor_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('supervisor_id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=50), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=True),
+        sa.Column('end_date', sa.Date(), nullable=True),
+        sa.Column('supervision_notes', sa.Text(), nullable=True, comment='Notes about the supervision arrangement - changes in roles or specific supervision requirements'),
+        sa.ForeignKeyConstraint(['student_number'], ['students.student_number'], ),
+        sa.ForeignKeyConstraint(['supervisor_id'], ['supervisors.supervisor_id'], ),
+        sa.PrimaryKeyConstraint('student_supervisor_id')
+        )
+        op.create_index(op.f('ix_student_supervisors_student_supervisor_id'), 'student_supervisors', ['student_supervisor_id'], unique=False)
+    if 'submissions' not in existing:
+        op.create_table('submissions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('submission_type', sa.Enum('REGISTRATION', 'VIVA_DOCUMENT', 'THESIS', 'CORRECTION', 'ANNUAL_REPORT', name='submissiontype'), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('file_path', sa.String(length=500), nullable=True),
+        sa.Column('file_name', sa.String(length=200), nullable=True),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('mime_type', sa.String(length=100), nullable=True),
+        sa.Column('status', sa.Enum('DRAFT', 'SUBMITTED', 'UNDER_REVIEW', 'APPROVED', 'REJECTED', 'REVISION_REQUIRED', name='submissionstatus'), nullable=True),
+        sa.Column('submission_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('review_deadline', sa.Date(), nullable=True),
+        sa.Column('reviewed_by', sa.Integer(), nullable=True),
+        sa.Column('review_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('review_comments', sa.Text(), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['reviewed_by'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['student_number'], ['students.student_number'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_submissions_id'), 'submissions', ['id'], unique=False)
+    if 'timelines' not in existing:
+        op.create_table('timelines',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('stage', sa.Enum('PROPOSAL', 'PROGRESSION', 'FINAL', name='timelinestage'), nullable=False),
+        sa.Column('milestone_name', sa.String(length=100), nullable=False),
+        sa.Column('planned_date', sa.Date(), nullable=True),
+        sa.Column('actual_date', sa.Date(), nullable=True),
+        sa.Column('status', sa.String(length=50), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['student_number'], ['students.student_number'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_timelines_id'), 'timelines', ['id'], unique=False)
+    if 'viva_teams' not in existing:
+        op.create_table('viva_teams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('student_number', sa.String(length=20), nullable=False),
+        sa.Column('stage', sa.Enum('REGISTRATION', 'PROGRESSION', 'FINAL', name='vivastage'), nullable=False),
+        sa.Column('status', sa.Enum('PROPOSED', 'APPROVED', 'REJECTED', 'SCHEDULED', 'COMPLETED', name='vivastatus'), nullable=True),
+        sa.Column('internal_examiner_1_id', sa.Integer(), nullable=True),
+        sa.Column('internal_examiner_2_id', sa.Integer(), nullable=True),
+        sa.Column('external_examiner_name', sa.String(length=150), nullable=True),
+        sa.Column('external_examiner_email', sa.String(length=100), nullable=True),
+        sa.Column('external_examiner_institution', sa.String(length=200), nullable=True),
+        sa.Column('proposed_date', sa.Date(), nullable=True),
+        sa.Column('scheduled_date', sa.Date(), nullable=True),
+        sa.Column('actual_date', sa.Date(), nullable=True),
+        sa.Column('location', sa.String(length=200), nullable=True),
+        sa.Column('outcome', sa.String(length=50), nullable=True),
+        sa.Column('outcome_notes', sa.Text(), nullable=True),
+        sa.Column('proposed_by', sa.Integer(), nullable=True),
+        sa.Column('approved_by', sa.Integer(), nullable=True),
+        sa.Column('approval_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['approved_by'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['internal_examiner_1_id'], ['supervisors.supervisor_id'], ),
+        sa.ForeignKeyConstraint(['internal_examiner_2_id'], ['supervisors.supervisor_id'], ),
+        sa.ForeignKeyConstraint(['proposed_by'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['student_number'], ['students.student_number'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_viva_teams_id'), 'viva_teams', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_viva_teams_id'), table_name='viva_teams')
+    op.drop_table('viva_teams')
+    op.drop_index(op.f('ix_timelines_id'), table_name='timelines')
+    op.drop_table('timelines')
+    op.drop_index(op.f('ix_submissions_id'), table_name='submissions')
+    op.drop_table('submissions')
+    op.drop_index(op.f('ix_student_supervisors_student_supervisor_id'), table_name='student_supervisors')
+    op.drop_table('student_supervisors')
+    op.drop_index(op.f('ix_registrations_registration_id'), table_name='registrations')
+    op.drop_table('registrations')
+    op.drop_index(op.f('ix_appraisals_id'), table_name='appraisals')
+    op.drop_table('appraisals')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_supervisors_supervisor_id'), table_name='supervisors')
+    op.drop_table('supervisors')
+    op.drop_index(op.f('ix_students_student_number'), table_name='students')
+    op.drop_table('students')
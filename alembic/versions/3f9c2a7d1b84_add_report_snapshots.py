@@ -0,0 +1,35 @@
+"""add_report_snapshots
+
+Revision ID: 3f9c2a7d1b84
+Revises: 1b6e8f0c2a47
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2a7d1b84'
+down_revision = '1b6e8f0c2a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('report_snapshots',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('report_name', sa.String(length=100), nullable=False),
+    sa.Column('params_key', sa.String(length=255), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('generated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_report_snapshots_id'), 'report_snapshots', ['id'], unique=False)
+    op.create_index('ix_report_snapshots_lookup', 'report_snapshots', ['report_name', 'params_key', 'generated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_snapshots_lookup', table_name='report_snapshots')
+    op.drop_index(op.f('ix_report_snapshots_id'), table_name='report_snapshots')
+    op.drop_table('report_snapshots')
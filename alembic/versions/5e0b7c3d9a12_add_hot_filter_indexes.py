@@ -0,0 +1,56 @@
+"""add_hot_filter_indexes
+
+Revision ID: 5e0b7c3d9a12
+Revises: a91d4c6e2b57
+Create Date: 2026-10-17 19:14:08.602733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b7c3d9a12'
+down_revision = 'a91d4c6e2b57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_submissions_student_number_id', 'submissions', ['student_number', 'id'], unique=False)
+    op.create_index('ix_submissions_status_id', 'submissions', ['status', 'id'], unique=False)
+    op.create_index('ix_submissions_type_status', 'submissions', ['submission_type', 'status'], unique=False)
+    op.create_index('ix_submissions_submission_date', 'submissions', ['submission_date'], unique=False)
+    op.create_index('ix_timelines_student_number_id', 'timelines', ['student_number', 'id'], unique=False)
+    op.create_index('ix_timelines_status_planned_date', 'timelines', ['status', 'planned_date'], unique=False)
+    op.create_index('ix_viva_teams_student_number_id', 'viva_teams', ['student_number', 'id'], unique=False)
+    op.create_index('ix_viva_teams_status_id', 'viva_teams', ['status', 'id'], unique=False)
+    op.create_index('ix_appraisals_student_number_id', 'appraisals', ['student_number', 'id'], unique=False)
+    op.create_index('ix_appraisals_academic_year_status', 'appraisals', ['academic_year', 'status'], unique=False)
+    op.create_index('ix_appraisals_status', 'appraisals', ['status'], unique=False)
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_notifications_status_scheduled', 'notifications', ['status', 'scheduled_at', 'id'], unique=False)
+    op.create_index('ix_registrations_student_number', 'registrations', ['student_number'], unique=False)
+    op.create_index('ix_registrations_status_id', 'registrations', ['registration_status', 'registration_id'], unique=False)
+    op.create_index('ix_student_supervisors_student_number', 'student_supervisors', ['student_number'], unique=False)
+    op.create_index('ix_student_supervisors_supervisor_id', 'student_supervisors', ['supervisor_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_student_supervisors_supervisor_id', table_name='student_supervisors')
+    op.drop_index('ix_student_supervisors_student_number', table_name='student_supervisors')
+    op.drop_index('ix_registrations_status_id', table_name='registrations')
+    op.drop_index('ix_registrations_student_number', table_name='registrations')
+    op.drop_index('ix_notifications_status_scheduled', table_name='notifications')
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_index('ix_appraisals_status', table_name='appraisals')
+    op.drop_index('ix_appraisals_academic_year_status', table_name='appraisals')
+    op.drop_index('ix_appraisals_student_number_id', table_name='appraisals')
+    op.drop_index('ix_viva_teams_status_id', table_name='viva_teams')
+    op.drop_index('ix_viva_teams_student_number_id', table_name='viva_teams')
+    op.drop_index('ix_timelines_status_planned_date', table_name='timelines')
+    op.drop_index('ix_timelines_student_number_id', table_name='timelines')
+    op.drop_index('ix_submissions_submission_date', table_name='submissions')
+    op.drop_index('ix_submissions_type_status', table_name='submissions')
+    op.drop_index('ix_submissions_status_id', table_name='submissions')
+    op.drop_index('ix_submissions_student_number_id', table_name='submissions')
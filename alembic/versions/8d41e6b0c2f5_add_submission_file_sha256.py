@@ -0,0 +1,24 @@
+"""add_submission_file_sha256
+
+Revision ID: 8d41e6b0c2f5
+Revises: 3f9c2a7d1b84
+Create Date: 2026-10-17 14:03:52.771920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41e6b0c2f5'
+down_revision = '3f9c2a7d1b84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('submissions', sa.Column('file_sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('submissions', 'file_sha256')
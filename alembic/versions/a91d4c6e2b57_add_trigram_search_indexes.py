@@ -0,0 +1,38 @@
+"""add_trigram_search_indexes
+
+Revision ID: a91d4c6e2b57
+Revises: c7a3f19e5d20
+Create Date: 2026-10-17 18:02:41.530117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a91d4c6e2b57'
+down_revision = 'c7a3f19e5d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # pg_trgm GIN indexes serve ILIKE '%term%'; other databases keep scanning
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_students_full_name_trgm', 'students', [sa.text("(forename || ' ' || surname) gin_trgm_ops")], unique=False, postgresql_using='gin')
+    op.create_index('ix_students_student_number_trgm', 'students', ['student_number'], unique=False, postgresql_using='gin', postgresql_ops={'student_number': 'gin_trgm_ops'})
+    op.create_index('ix_students_programme_of_study_trgm', 'students', ['programme_of_study'], unique=False, postgresql_using='gin', postgresql_ops={'programme_of_study': 'gin_trgm_ops'})
+    op.create_index('ix_supervisors_supervisor_name_trgm', 'supervisors', ['supervisor_name'], unique=False, postgresql_using='gin', postgresql_ops={'supervisor_name': 'gin_trgm_ops'})
+    op.create_index('ix_supervisors_email_trgm', 'supervisors', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_supervisors_email_trgm', table_name='supervisors')
+    op.drop_index('ix_supervisors_supervisor_name_trgm', table_name='supervisors')
+    op.drop_index('ix_students_programme_of_study_trgm', table_name='students')
+    op.drop_index('ix_students_student_number_trgm', table_name='students')
+    op.drop_index('ix_students_full_name_trgm', table_name='students')
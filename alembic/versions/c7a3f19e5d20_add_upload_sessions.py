@@ -0,0 +1,53 @@
+"""add_upload_sessions
+
+Revision ID: c7a3f19e5d20
+Revises: 8d41e6b0c2f5
+Create Date: 2026-10-17 16:27:05.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a3f19e5d20'
+down_revision = '8d41e6b0c2f5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('upload_sessions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('submission_id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('file_name', sa.String(length=200), nullable=False),
+    sa.Column('mime_type', sa.String(length=100), nullable=True),
+    sa.Column('total_size', sa.BigInteger(), nullable=True),
+    sa.Column('reserved_bytes', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('status', sa.Enum('ACTIVE', 'COMPLETED', 'ABORTED', name='uploadsessionstatus'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_upload_sessions_id'), 'upload_sessions', ['id'], unique=False)
+    op.create_index(op.f('ix_upload_sessions_submission_id'), 'upload_sessions', ['submission_id'], unique=False)
+    op.create_table('upload_session_parts',
+    sa.Column('upload_id', sa.Integer(), nullable=False),
+    sa.Column('part_number', sa.Integer(), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('file_name', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['upload_id'], ['upload_sessions.id'], ),
+    sa.PrimaryKeyConstraint('upload_id', 'part_number')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('upload_session_parts')
+    op.drop_index(op.f('ix_upload_sessions_submission_id'), table_name='upload_sessions')
+    op.drop_index(op.f('ix_upload_sessions_id'), table_name='upload_sessions')
+    op.drop_table('upload_sessions')
+    sa.Enum(name='uploadsessionstatus').drop(op.get_bind(), checkfirst=True)
@@ -1,18 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import page_json
 from app.services.auth_service import AuthService
 from app.schemas.auth import RegisterRequest, LoginRequest, PasswordChangeRequest, AdminPasswordReset
 from app.schemas.user import User as UserResponse, Token, UserUpdate, AdminUserUpdate
-from typing import List
+from typing import List, Optional
 from app.core.dependencies import get_current_user
 
 router = APIRouter()
 
 @router.post("/register", response_model=UserResponse)
-def register(user: RegisterRequest, db: Session = Depends(get_db)):
+async def register(user: RegisterRequest, db: Session = Depends(get_db)):
     try:
-        db_user = AuthService.create_user(db, user)
+        db_user = await AuthService.create_user(db, user)
         return db_user
     except ValueError as e:
         raise HTTPException(
@@ -21,8 +22,8 @@ def register(user: RegisterRequest, db: Session = Depends(get_db)):
         )
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(login_data: LoginRequest, db: Session = Depends(get_db)):
-    user = AuthService.authenticate_user(db, login_data.username, login_data.password)
+async def login_for_access_token(login_data: LoginRequest, db: Session = Depends(get_db)):
+    user = await AuthService.authenticate_user(db, login_data.username, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,14 +55,14 @@ def update_user_profile(
         )
 
 @router.put("/change-password")
-def change_password(
+async def change_password(
     password_data: PasswordChangeRequest,
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Change current user's password"""
     try:
-        success = AuthService.change_password(
+        success = await AuthService.change_password(
             db, 
             current_user.id, 
             password_data.current_password, 
@@ -81,13 +82,14 @@ def change_password(
 def get_all_users(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all users (system admin only)"""
     try:
-        users = AuthService.get_all_users(db, current_user, skip, limit)
-        return users
+        page = AuthService.get_all_users(db, current_user, skip, limit, cursor)
+        return page_json(page, UserResponse)
     except ValueError as e:
         raise HTTPException(
             status_code=403,
@@ -130,7 +132,7 @@ def admin_update_user(
         )
 
 @router.put("/admin/users/{user_id}/reset-password")
-def admin_reset_user_password(
+async def admin_reset_user_password(
     user_id: int,
     password_reset: AdminPasswordReset,
     current_user = Depends(get_current_user),
@@ -138,7 +140,7 @@ def admin_reset_user_password(
 ):
     """Reset user's password (system admin only)"""
     try:
-        success = AuthService.admin_reset_password(
+        success = await AuthService.admin_reset_password(
             db, 
             user_id, 
             password_reset.new_password, 
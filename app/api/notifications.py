@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from app.db.session import get_db
-from app.core.dependencies import get_current_user
-from app.services.notification_service import NotificationService
+from app.db.async_session import get_async_db
+from app.core.dependencies import get_current_user, get_current_user_async
+from app.core.pagination import page_json
+from app.services.notification_service import AsyncNotificationService, NotificationService
 from app.schemas.notification import (
     NotificationCreate,
     Notification as NotificationResponse,
@@ -52,22 +55,30 @@ def get_user_notifications(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[NotificationStatus] = None,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get notifications for a specific user"""
-    return NotificationService.get_user_notifications(db, user_id, current_user, skip, limit, status)
+    return page_json(
+        NotificationService.get_user_notifications(db, user_id, current_user, skip, limit, status, cursor),
+        NotificationResponse
+    )
 
 @router.get("/me", response_model=List[NotificationResponse])
 def get_my_notifications(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: Optional[NotificationStatus] = None,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get current user's notifications"""
-    return NotificationService.get_user_notifications(db, current_user.id, current_user, skip, limit, status)
+    return page_json(
+        NotificationService.get_user_notifications(db, current_user.id, current_user, skip, limit, status, cursor),
+        NotificationResponse
+    )
 
 @router.put("/{notification_id}/mark-read", response_model=NotificationResponse)
 def mark_notification_as_read(
@@ -83,7 +94,7 @@ def retry_failed_notifications(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Retry sending failed notifications (admin only)"""
+    """Re-queue failed notifications for the delivery worker (admin only)"""
     return NotificationService.retry_failed_notifications(db, current_user)
 
 @router.get("/templates")
@@ -187,3 +198,35 @@ def notify_supervisor_assigned(
     return NotificationService.create_from_template(
         db, "supervisor_assigned", student_user_id, template_data, current_user
     )
+
+# Async variants of the inbox routes, registered ahead of the sync ones when ASYNC_DB_ENABLED is set
+async_router = APIRouter()
+
+@async_router.get("/user/{user_id}", response_model=List[NotificationResponse])
+async def get_user_notifications_async(
+    user_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    status: Optional[NotificationStatus] = None,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
+):
+    return page_json(
+        await AsyncNotificationService.get_user_notifications(db, user_id, current_user, skip, limit, status, cursor),
+        NotificationResponse
+    )
+
+@async_router.get("/me", response_model=List[NotificationResponse])
+async def get_my_notifications_async(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    status: Optional[NotificationStatus] = None,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
+):
+    return page_json(
+        await AsyncNotificationService.get_user_notifications(db, current_user.id, current_user, skip, limit, status, cursor),
+        NotificationResponse
+    )
@@ -5,6 +5,7 @@ from app.db.session import get_db
 from app.models.user import User
 from app.core.dependencies import require_roles, get_current_active_user
 from app.schemas.registration import RegistrationCreate, RegistrationUpdate, Registration
+from app.core.pagination import page_json
 from app.services.registration_service import RegistrationService
 
 router = APIRouter()
@@ -23,10 +24,14 @@ def get_registrations(
     limit: int = Query(100, ge=1, le=1000),
     student_number: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    return RegistrationService.get_registrations(db, current_user, skip, limit, student_number, status)
+    return page_json(
+        RegistrationService.get_registrations(db, current_user, skip, limit, student_number, status, cursor),
+        Registration
+    )
 
 @router.get("/{registration_id}", response_model=Registration)
 def get_registration(
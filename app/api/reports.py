@@ -1,82 +1,99 @@
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
 from datetime import date
 from app.db.session import get_db
+from app.db.async_session import get_async_db
 from app.models.user import User
-from app.core.dependencies import require_roles
+from app.core.dependencies import require_roles, require_roles_async
+from app.core.responses import ORJSONResponse
 from app.services.report_service import ReportService
+from app.services.report_snapshot_service import AsyncReportSnapshotService, ReportSnapshotService
 
 router = APIRouter()
 
-@router.get("/student-overview")
+@router.get("/student-overview", response_model=Dict[str, Any])
 def get_student_overview_report(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get student overview report with statistics"""
-    return ReportService.get_student_overview_report(db)
+    return ORJSONResponse(ReportSnapshotService.get_report(db, "student-overview", fresh=fresh))
 
-@router.get("/supervisor-workload")
+@router.get("/supervisor-workload", response_model=Dict[str, Any])
 def get_supervisor_workload_report(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get supervisor workload report"""
-    return ReportService.get_supervisor_workload_report(db)
+    return ORJSONResponse(ReportSnapshotService.get_report(db, "supervisor-workload", fresh=fresh))
 
-@router.get("/submission-analytics")
+@router.get("/submission-analytics", response_model=Dict[str, Any])
 def get_submission_analytics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get submission analytics report"""
-    return ReportService.get_submission_analytics(db, start_date, end_date)
+    return ORJSONResponse(ReportSnapshotService.get_report(
+        db, "submission-analytics", {"start_date": start_date, "end_date": end_date}, fresh=fresh
+    ))
 
-@router.get("/timeline-compliance")
+@router.get("/timeline-compliance", response_model=Dict[str, Any])
 def get_timeline_compliance_report(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get timeline compliance report"""
-    return ReportService.get_timeline_compliance_report(db)
+    return ORJSONResponse(ReportSnapshotService.get_report(db, "timeline-compliance", fresh=fresh))
 
-@router.get("/appraisal-completion")
+@router.get("/appraisal-completion", response_model=Dict[str, Any])
 def get_appraisal_completion_rates(
     academic_year: Optional[str] = Query(None),
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get appraisal completion rates"""
-    return ReportService.get_appraisal_completion_rates(db, academic_year)
+    return ORJSONResponse(ReportSnapshotService.get_report(
+        db, "appraisal-completion", {"academic_year": academic_year}, fresh=fresh
+    ))
 
-@router.get("/programme-statistics")
+@router.get("/programme-statistics", response_model=Dict[str, Any])
 def get_programme_statistics(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get programme statistics"""
-    return ReportService.get_programme_statistics(db)
+    return ORJSONResponse(ReportSnapshotService.get_report(db, "programme-statistics", fresh=fresh))
 
-@router.get("/department-dashboard")
+@router.get("/department-dashboard", response_model=Dict[str, Any])
 def get_department_dashboard(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get department dashboard data"""
-    return ReportService.get_department_dashboard(db)
+    return ORJSONResponse(ReportSnapshotService.get_report(db, "department-dashboard", fresh=fresh))
 
-@router.get("/weekly-activity")
+@router.get("/weekly-activity", response_model=Dict[str, Any])
 def get_weekly_activity_report(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get weekly activity report"""
-    return ReportService.get_weekly_activity_report(db)
+    return ORJSONResponse(ReportSnapshotService.get_report(db, "weekly-activity", fresh=fresh))
 
-@router.get("/custom")
+@router.get("/custom", response_model=Dict[str, Any])
 def get_custom_report(
     degree_type: Optional[str] = Query(None),
     programme: Optional[str] = Query(None),
@@ -84,7 +101,7 @@ def get_custom_report(
     supervisor: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin", "dos"]))
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Get custom report with filters"""
     filters = {}
     if degree_type:
@@ -96,23 +113,99 @@ def get_custom_report(
     if supervisor:
         filters["supervisor"] = supervisor
     
-    return ReportService.get_custom_report(db, filters)
+    return ORJSONResponse(ReportService.get_custom_report(db, filters))
 
 @router.get("/export/student-data")
 def export_student_data(
+    request: Request,
     db: Session = Depends(get_db),
     _: User = Depends(require_roles(["system_admin", "gbos_admin"]))
 ):
-    """Export student data as CSV"""
-    # This would generate CSV data
-    csv_content = "student_number,programme,status,supervisor\n"  # Header
-    custom_report = ReportService.get_custom_report(db, {})
-    
-    for record in custom_report["data"]:
-        csv_content += f"{record['student_number']},{record['programme']},{record['status']},{record.get('supervisor', '')}\n"
-    
-    return Response(
-        content=csv_content,
+    """Export student data as CSV, streamed in chunks and gzipped when accepted"""
+    compress = "gzip" in request.headers.get("accept-encoding", "").lower()
+    headers = {"Content-Disposition": "attachment; filename=student_data.csv"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+
+    return StreamingResponse(
+        ReportService.stream_student_data_csv(db, {}, compress=compress),
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=student_data.csv"}
+        headers=headers
     )
+
+# Async variants of the snapshot-backed reports, registered ahead of the sync
+# ones when ASYNC_DB_ENABLED is set
+async_router = APIRouter()
+report_reader = require_roles_async(["system_admin", "gbos_admin", "dos"])
+
+@async_router.get("/student-overview", response_model=Dict[str, Any])
+async def get_student_overview_report_async(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(db, "student-overview", fresh=fresh))
+
+@async_router.get("/supervisor-workload", response_model=Dict[str, Any])
+async def get_supervisor_workload_report_async(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(db, "supervisor-workload", fresh=fresh))
+
+@async_router.get("/submission-analytics", response_model=Dict[str, Any])
+async def get_submission_analytics_async(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(
+        db, "submission-analytics", {"start_date": start_date, "end_date": end_date}, fresh=fresh
+    ))
+
+@async_router.get("/timeline-compliance", response_model=Dict[str, Any])
+async def get_timeline_compliance_report_async(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(db, "timeline-compliance", fresh=fresh))
+
+@async_router.get("/appraisal-completion", response_model=Dict[str, Any])
+async def get_appraisal_completion_rates_async(
+    academic_year: Optional[str] = Query(None),
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(
+        db, "appraisal-completion", {"academic_year": academic_year}, fresh=fresh
+    ))
+
+@async_router.get("/programme-statistics", response_model=Dict[str, Any])
+async def get_programme_statistics_async(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(db, "programme-statistics", fresh=fresh))
+
+@async_router.get("/department-dashboard", response_model=Dict[str, Any])
+async def get_department_dashboard_async(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(db, "department-dashboard", fresh=fresh))
+
+@async_router.get("/weekly-activity", response_model=Dict[str, Any])
+async def get_weekly_activity_report_async(
+    fresh: bool = Query(False, description="Bypass the report snapshot and recompute"),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(report_reader)
+) -> ORJSONResponse:
+    return ORJSONResponse(await AsyncReportSnapshotService.get_report(db, "weekly-activity", fresh=fresh))
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from app.models.user import User
+from app.core.config import settings
+from app.core.dependencies import get_current_active_user
+from app.core.typeahead import typeahead_index
+from app.schemas.search import TypeaheadKind, TypeaheadMatch
+
+router = APIRouter()
+
+@router.get("/typeahead", response_model=List[TypeaheadMatch])
+async def typeahead(
+    q: str = Query(..., min_length=1, max_length=100),
+    kind: Optional[List[TypeaheadKind]] = Query(None, description="Restrict matches to these kinds"),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Top people matching a partial name, number or email, served from memory"""
+    if current_user.role == "student":
+        raise HTTPException(status_code=403, detail="Not authorized to search people")
+    if not settings.TYPEAHEAD_ENABLED:
+        raise HTTPException(status_code=503, detail="Typeahead search is disabled")
+
+    kinds = set(kind or TypeaheadKind)
+    # User accounts are only visible to system admins, as in /auth/admin/users
+    if current_user.role != "system_admin":
+        if kind and TypeaheadKind.USER in kinds:
+            raise HTTPException(status_code=403, detail="Not authorized to search user accounts")
+        kinds.discard(TypeaheadKind.USER)
+
+    return [
+        TypeaheadMatch(kind=entry.kind, id=entry.id, label=entry.label, detail=entry.detail)
+        for entry in typeahead_index.search(q, [k.value for k in kinds], limit)
+    ]
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.session import get_db
 from app.core.dependencies import get_current_user
+from app.core.pagination import page_json
 from app.services.student_supervisor_service import StudentSupervisorService
 from app.schemas.student_supervisor import (
     StudentSupervisorCreate,
@@ -65,8 +66,11 @@ def remove_supervisor_assignment(
 def get_all_assignments(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get all supervisor assignments (admin only)"""
-    return StudentSupervisorService.get_all_assignments(db, current_user, skip, limit)
+    return page_json(
+        StudentSupervisorService.get_all_assignments(db, current_user, skip, limit, cursor), StudentSupervisorResponse
+    )
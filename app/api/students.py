@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.session import get_db
+from app.db.async_session import get_async_db
 from app.models.user import User
-from app.core.dependencies import require_roles, get_current_active_user
-from app.services.student_service import StudentService
+from app.core.dependencies import require_roles, get_current_active_user, get_current_active_user_async
+from app.core.pagination import page_json
+from app.services.student_service import AsyncStudentService, StudentService
 from app.schemas.student import StudentCreate, StudentUpdate, Student
 
 router = APIRouter()
@@ -25,17 +28,23 @@ def create_student(
 @router.get("/", response_model=List[Student])
 def get_students(
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: int = Query(100, ge=1, description="Page size, capped at MAX_PAGE_SIZE"),
     search: Optional[str] = Query(None),
     programme: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    with_total: bool = Query(False, description="Also return the number of matching rows in X-Total-Count"),
+    stream: bool = Query(False, description="Stream every matching row as one JSON array instead of a page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
+    if stream and current_user.role != "student":
+        return StudentService.stream_students(db, search, programme)
+
     if search:
-        return StudentService.search_students(db, search)
+        return page_json(StudentService.search_students(db, search, limit, cursor, with_total), Student)
     
     if programme:
-        return StudentService.get_students_by_programme(db, programme)
+        return page_json(StudentService.get_students_by_programme(db, programme, limit, cursor, with_total), Student)
 
     if current_user.role == "student":
         # Students can only see their own record
@@ -43,7 +52,7 @@ def get_students(
         return [student] if student else []
     
     # For other roles, return paginated list
-    return StudentService.get_students(db, skip, limit)
+    return page_json(StudentService.get_students(db, skip, limit, cursor, with_total), Student)
 
 @router.get("/{student_number}", response_model=Student)
 def get_student(
@@ -84,3 +93,49 @@ def delete_student(
         raise HTTPException(status_code=404, detail="Student not found")
     
     return {"message": "Student deleted successfully"}
+
+# Async variants of the read routes, served from the async data layer when
+# ASYNC_DB_ENABLED is set (main.py registers them ahead of the sync routes)
+async_router = APIRouter()
+
+@async_router.get("/", response_model=List[Student])
+async def get_students_async(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, description="Page size, capped at MAX_PAGE_SIZE"),
+    search: Optional[str] = Query(None),
+    programme: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    with_total: bool = Query(False, description="Also return the number of matching rows in X-Total-Count"),
+    stream: bool = Query(False, description="Stream every matching row as one JSON array instead of a page"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    if stream and current_user.role != "student":
+        return AsyncStudentService.stream_students(db, search, programme)
+
+    if search:
+        return page_json(await AsyncStudentService.search_students(db, search, limit, cursor, with_total), Student)
+
+    if programme:
+        return page_json(await AsyncStudentService.get_students_by_programme(db, programme, limit, cursor, with_total), Student)
+
+    if current_user.role == "student":
+        student = await AsyncStudentService.get_student_by_number(db, current_user.username)
+        return [student] if student else []
+
+    return page_json(await AsyncStudentService.get_students(db, skip, limit, cursor, with_total), Student)
+
+@async_router.get("/{student_number}", response_model=Student)
+async def get_student_async(
+    student_number: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    student = await AsyncStudentService.get_student_by_number(db, student_number)
+    if not student:
+        raise HTTPException(status_code=404, detail="Student not found")
+
+    if current_user.role == "student" and student.student_number != current_user.username:
+        raise HTTPException(status_code=403, detail="Not authorized to view this student")
+
+    return student
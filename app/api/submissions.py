@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request, Response
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 from app.db.session import get_db
+from app.db.async_session import get_async_db
 from app.models.user import User
-from app.core.dependencies import require_roles, get_current_active_user
+from app.core.dependencies import require_roles, get_current_active_user, get_current_active_user_async
+from app.core.pagination import page_json
 from app.schemas.submission import SubmissionCreate, SubmissionUpdate, Submission
-from app.services.submission_service import SubmissionService
+from app.schemas.upload_session import UploadSessionCreate, UploadSession, UploadPart
+from app.services.submission_service import AsyncSubmissionService, SubmissionService
+from app.services.upload_session_service import UploadSessionService
 
 router = APIRouter()
 
@@ -22,10 +30,20 @@ def get_submissions(
     student_number: Optional[str] = None,
     submission_type: Optional[str] = None,
     status: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, description="Page size, capped at MAX_PAGE_SIZE"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    with_total: bool = Query(False, description="Also return the number of matching rows in X-Total-Count"),
+    stream: bool = Query(False, description="Stream every matching row as one JSON array instead of a page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    return SubmissionService.get_submissions(db, current_user, student_number, submission_type, status)
+    if stream:
+        return SubmissionService.stream_submissions(db, current_user, student_number, submission_type, status)
+    page = SubmissionService.get_submissions(
+        db, current_user, student_number, submission_type, status, skip, limit, cursor, with_total
+    )
+    return page_json(page, Submission)
 
 @router.get("/{submission_id}", response_model=Submission)
 def get_submission(
@@ -35,6 +53,58 @@ def get_submission(
 ):
     return SubmissionService.get_submission_by_id(db, submission_id, current_user)
 
+@router.get("/{submission_id}/file")
+def download_file(
+    submission_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Serve the submission's file with Range support and conditional GET"""
+    submission = SubmissionService.get_submission_file(db, submission_id, current_user)
+
+    # Authenticated content: let browsers keep a copy but revalidate every time
+    headers = {"Cache-Control": "private, no-cache"}
+    if submission.file_sha256:
+        headers["ETag"] = f'"{submission.file_sha256}"'
+    last_modified = submission.updated_date or submission.submission_date
+    if last_modified:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = formatdate(last_modified.timestamp(), usegmt=True)
+
+    if _not_modified(request, headers.get("ETag"), last_modified):
+        return Response(status_code=304, headers=headers)
+
+    # FileResponse handles Range/If-Range and uses zero-copy sends where the server supports them
+    return FileResponse(
+        submission.file_path,
+        media_type=submission.mime_type,
+        filename=submission.file_name,
+        content_disposition_type="inline",
+        headers=headers
+    )
+
+def _not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+        if not etag:
+            return False
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
 @router.post("/{submission_id}/upload")
 async def upload_file(
     submission_id: int,
@@ -44,6 +114,63 @@ async def upload_file(
 ):
     return await SubmissionService.upload_file(db, submission_id, file, current_user)
 
+@router.post("/{submission_id}/uploads", response_model=UploadSession)
+def initiate_upload(
+    submission_id: int,
+    upload: UploadSessionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Start a resumable upload"""
+    return UploadSessionService.initiate(db, submission_id, upload, current_user)
+
+@router.get("/{submission_id}/uploads/{upload_id}", response_model=UploadSession)
+def get_upload(
+    submission_id: int,
+    upload_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Resumable upload progress, listing the parts already received"""
+    return UploadSessionService.get_session(db, submission_id, upload_id, current_user)
+
+@router.put("/{submission_id}/uploads/{upload_id}/parts/{part_number}", response_model=UploadPart)
+async def upload_part(
+    submission_id: int,
+    upload_id: int,
+    part_number: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Upload one part as the raw request body; send Content-Length so parts can upload in parallel"""
+    content_length = request.headers.get("content-length")
+    return await UploadSessionService.upload_part(
+        db, submission_id, upload_id, part_number, request.stream(), current_user,
+        int(content_length) if content_length and content_length.isdigit() else None
+    )
+
+@router.post("/{submission_id}/uploads/{upload_id}/complete", response_model=Submission)
+async def complete_upload(
+    submission_id: int,
+    upload_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Assemble the uploaded parts into the submission's file"""
+    return await UploadSessionService.complete(db, submission_id, upload_id, current_user)
+
+@router.delete("/{submission_id}/uploads/{upload_id}")
+def abort_upload(
+    submission_id: int,
+    upload_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Cancel a resumable upload"""
+    UploadSessionService.abort(db, submission_id, upload_id, current_user)
+    return {"message": "Upload aborted"}
+
 @router.put("/{submission_id}", response_model=Submission)
 def update_submission(
     submission_id: int,
@@ -80,3 +207,34 @@ def review_submission(
     current_user: User = Depends(require_roles(["system_admin", "gbos_admin", "dos", "examiner"]))
 ):
     return SubmissionService.review_submission(db, submission_id, review_data, current_user)
+
+# Async variants of the read routes, registered ahead of the sync ones when ASYNC_DB_ENABLED is set
+async_router = APIRouter()
+
+@async_router.get("/", response_model=List[Submission])
+async def get_submissions_async(
+    student_number: Optional[str] = None,
+    submission_type: Optional[str] = None,
+    status: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, description="Page size, capped at MAX_PAGE_SIZE"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    with_total: bool = Query(False, description="Also return the number of matching rows in X-Total-Count"),
+    stream: bool = Query(False, description="Stream every matching row as one JSON array instead of a page"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    if stream:
+        return AsyncSubmissionService.stream_submissions(db, current_user, student_number, submission_type, status)
+    page = await AsyncSubmissionService.get_submissions(
+        db, current_user, student_number, submission_type, status, skip, limit, cursor, with_total
+    )
+    return page_json(page, Submission)
+
+@async_router.get("/{submission_id}", response_model=Submission)
+async def get_submission_async(
+    submission_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    return await AsyncSubmissionService.get_submission_by_id(db, submission_id, current_user)
@@ -4,6 +4,7 @@ from typing import List, Optional
 from app.db.session import get_db
 from app.models.user import User
 from app.core.dependencies import require_roles, get_current_active_user
+from app.core.pagination import page_json
 from app.services.supervisor_service import SupervisorService
 from app.schemas.supervisor import SupervisorCreate, SupervisorUpdate, Supervisor
 
@@ -20,19 +21,25 @@ def create_supervisor(
 @router.get("/", response_model=List[Supervisor])
 def get_supervisors(
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: int = Query(100, ge=1, description="Page size, capped at MAX_PAGE_SIZE"),
     search: Optional[str] = Query(None),
     department: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    with_total: bool = Query(False, description="Also return the number of matching rows in X-Total-Count"),
+    stream: bool = Query(False, description="Stream every matching row as one JSON array instead of a page"),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_active_user)
 ):
+    if stream:
+        return SupervisorService.stream_supervisors(db, search, department)
+
     if search:
-        return SupervisorService.search_supervisors(db, search)
+        return page_json(SupervisorService.search_supervisors(db, search, limit, cursor, with_total), Supervisor)
     
     if department:
-        return SupervisorService.get_supervisors_by_department(db, department)
+        return page_json(SupervisorService.get_supervisors_by_department(db, department, limit, cursor, with_total), Supervisor)
     
-    return SupervisorService.get_supervisors(db, skip, limit)
+    return page_json(SupervisorService.get_supervisors(db, skip, limit, cursor, with_total), Supervisor)
 
 @router.get("/{supervisor_id}", response_model=Supervisor)
 def get_supervisor(
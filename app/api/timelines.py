@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.session import get_db
 from app.models.user import User
 from app.core.dependencies import require_roles, get_current_active_user
 from app.schemas.timeline import TimelineCreate, TimelineUpdate, Timeline
+from app.core.pagination import page_json
 from app.services.timeline_service import TimelineService
 from datetime import date
 
@@ -33,10 +34,14 @@ def get_timelines(
     student_number: Optional[str] = None,
     stage: Optional[str] = None,
     status: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    return TimelineService.get_timelines(db, current_user, skip, limit, student_number, stage, status)
+    return page_json(
+        TimelineService.get_timelines(db, current_user, skip, limit, student_number, stage, status, cursor),
+        Timeline
+    )
 
 @router.get("/{timeline_id}", response_model=Timeline)
 def get_timeline(
@@ -5,6 +5,7 @@ from app.db.session import get_db
 from app.models.user import User
 from app.core.dependencies import require_roles, get_current_active_user
 from app.schemas.viva_team import VivaTeamCreate, VivaTeamUpdate, VivaTeam
+from app.core.pagination import page_json
 from app.services.viva_team_service import VivaTeamService
 from datetime import date
 
@@ -25,10 +26,14 @@ def get_viva_teams(
     student_number: Optional[str] = Query(None),
     stage: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    return VivaTeamService.get_viva_teams(db, current_user, skip, limit, student_number, stage, status)
+    return page_json(
+        VivaTeamService.get_viva_teams(db, current_user, skip, limit, student_number, stage, status, cursor),
+        VivaTeam
+    )
 
 @router.get("/{viva_team_id}", response_model=VivaTeam)
 def get_viva_team(
@@ -0,0 +1,60 @@
+"""Management commands.
+
+Usage:
+    python -m app.cli migrate [--revision head] [--sql]
+    python -m app.cli check
+    python -m app.cli current
+    python -m app.cli stamp REVISION
+    python -m app.cli expire-uploads
+"""
+import argparse
+import logging
+import sys
+from app.db import migrations
+from app.db.session import get_engine
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="EdgeHill PGR management commands")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subcommands.add_parser("migrate", help="Apply Alembic migrations")
+    migrate.add_argument("--revision", default="head")
+    migrate.add_argument("--sql", action="store_true", help="Print the SQL instead of running it")
+    subcommands.add_parser("check", help="Exit non-zero unless the database is at the latest migration")
+    subcommands.add_parser("current", help="Show the database and code schema revisions")
+    stamp = subcommands.add_parser("stamp", help="Record a revision without running migrations")
+    stamp.add_argument("revision")
+    subcommands.add_parser("expire-uploads", help="Abort stale resumable uploads and delete their parts")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "migrate":
+        try:
+            migrations.upgrade(args.revision, sql=args.sql)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+    elif args.command == "stamp":
+        migrations.stamp(args.revision)
+    elif args.command == "current":
+        print(f"database: {', '.join(sorted(migrations.current_revisions(get_engine()))) or '(none)'}")
+        print(f"code:     {', '.join(sorted(migrations.head_revisions()))}")
+    elif args.command == "check":
+        problem = migrations.schema_revision_problem(get_engine())
+        if problem:
+            print(problem, file=sys.stderr)
+            return 1
+        print("Database schema is up to date")
+    elif args.command == "expire-uploads":
+        from app.db.session import SessionLocal
+        from app.services.upload_session_service import UploadSessionService
+        db = SessionLocal()
+        try:
+            print(f"Expired {UploadSessionService.expire_stale_sessions(db)} upload sessions")
+        finally:
+            db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
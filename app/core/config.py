@@ -7,21 +7,91 @@ class Settings:
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
     TEST_DATABASE_URL: str = os.getenv("TEST_DATABASE_URL", "")
 
+    # Connection pool sizing (per worker process) and per-statement timeout (0 disables)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+    # Startup only compares the database's Alembic revision with the code's
+    # (strict refuses to start, warn logs, off skips); `python -m app.cli migrate` applies migrations
+    SCHEMA_REVISION_CHECK: str = os.getenv("SCHEMA_REVISION_CHECK", "warn").lower()
+
+    # Serve the hot read routes from the async data layer (asyncpg/aiosqlite). The async URL
+    # is derived from DATABASE_URL unless ASYNC_DATABASE_URL is set
+    ASYNC_DB_ENABLED: bool = os.getenv("ASYNC_DB_ENABLED", "False").lower() == "true"
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "edgehillukSTUDENT")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+    # Password hashing: bcrypt cost factor and the bounded pool that runs it.
+    # Requests beyond workers + queue size are rejected with 429.
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+
+    # Authenticated principal cache (0 disables caching)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
+    # In-memory typeahead index (rebuild interval picks up other workers' writes; 0 disables rebuilds)
+    TYPEAHEAD_ENABLED: bool = os.getenv("TYPEAHEAD_ENABLED", "True").lower() == "true"
+    TYPEAHEAD_REBUILD_SECONDS: int = int(os.getenv("TYPEAHEAD_REBUILD_SECONDS", "300"))
+
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
     ALLOWED_HOSTS: list = os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
 
+    # Production server (gunicorn.conf.py). WEB_CONCURRENCY=0 sizes workers from the
+    # CPUs available to the process; THREADPOOL_SIZE bounds concurrent sync (`def`) routes per worker
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "0"))
+    WEB_CONCURRENCY_MAX: int = int(os.getenv("WEB_CONCURRENCY_MAX", "8"))
+    THREADPOOL_SIZE: int = int(os.getenv("THREADPOOL_SIZE", "40"))
+    WORKER_TIMEOUT_SECONDS: int = int(os.getenv("WORKER_TIMEOUT_SECONDS", "60"))
+    GRACEFUL_TIMEOUT_SECONDS: int = int(os.getenv("GRACEFUL_TIMEOUT_SECONDS", "30"))
+    KEEPALIVE_SECONDS: int = int(os.getenv("KEEPALIVE_SECONDS", "5"))
+    MAX_REQUESTS: int = int(os.getenv("MAX_REQUESTS", "10000"))
+    MAX_REQUESTS_JITTER: int = int(os.getenv("MAX_REQUESTS_JITTER", "1000"))
+
+    # List endpoints: page size when none is given and the largest allowed
+    DEFAULT_PAGE_SIZE: int = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+    MAX_PAGE_SIZE: int = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+    # File uploads: streamed to disk in chunks and rejected once over the limit
+    UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads")
+    MAX_UPLOAD_SIZE_BYTES: int = int(os.getenv("MAX_UPLOAD_SIZE_BYTES", str(200 * 1024 * 1024)))
+    UPLOAD_CHUNK_SIZE_BYTES: int = int(os.getenv("UPLOAD_CHUNK_SIZE_BYTES", str(1024 * 1024)))
+    # "content_addressed" dedupes identical files via hard links; "local" stores each upload verbatim
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "content_addressed")
+    # Resumable uploads left untouched this long are aborted and their parts deleted
+    UPLOAD_SESSION_EXPIRE_HOURS: int = int(os.getenv("UPLOAD_SESSION_EXPIRE_HOURS", "24"))
+
     # Email settings
     SMTP_SERVER: str = os.getenv("SMTP_SERVER", "smtp.gmail.com")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
     SMTP_USERNAME: str = os.getenv("SMTP_USERNAME", "")
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
     FROM_EMAIL: str = os.getenv("FROM_EMAIL", "")
+    SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "True").lower() == "true"
+    SMTP_TIMEOUT_SECONDS: float = float(os.getenv("SMTP_TIMEOUT_SECONDS", "10"))
+    # Persistent SMTP sessions shared by notification delivery
+    SMTP_POOL_SIZE: int = int(os.getenv("SMTP_POOL_SIZE", "4"))
+    SMTP_MAX_IDLE_SECONDS: float = float(os.getenv("SMTP_MAX_IDLE_SECONDS", "60"))
+
+    # Notification worker: rows claimed per batch and idle poll interval
+    NOTIFICATION_WORKER_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_WORKER_BATCH_SIZE", "50"))
+    NOTIFICATION_WORKER_POLL_SECONDS: float = float(os.getenv("NOTIFICATION_WORKER_POLL_SECONDS", "5"))
+    NOTIFICATION_WORKER_IN_PROCESS: bool = os.getenv("NOTIFICATION_WORKER_IN_PROCESS", "True").lower() == "true"
+
+    # Report snapshots: background refresh interval (0 disables the refresher) and
+    # the oldest snapshot served before a request recomputes the report inline
+    REPORT_SNAPSHOT_REFRESH_SECONDS: int = int(os.getenv("REPORT_SNAPSHOT_REFRESH_SECONDS", "300"))
+    REPORT_SNAPSHOT_MAX_AGE_SECONDS: int = int(os.getenv("REPORT_SNAPSHOT_MAX_AGE_SECONDS", "900"))
 
     APP_NAME: str = "EdgeHill PGR Management System"
     APP_VERSION: str = "1.0.0"
@@ -1,35 +1,67 @@
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.db.async_session import get_async_db
 from app.models.user import User
 from app.schemas.user import UserRole
 from app.core.config import settings
-from typing import List
+from app.core.principal_cache import principal_cache, snapshot_user, restore_user, restore_user_async
+from typing import Any, List, Tuple
 
 security = HTTPBearer()
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+def _token_subject(credentials: HTTPAuthorizationCredentials) -> Tuple[str, Any]:
+    """Username and issued-at of a valid bearer token"""
     try:
         token = credentials.credentials
 
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
-            raise credentials_exception
+            raise _credentials_exception()
+        return username, payload.get("iat")
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+    username, issued_at = _token_subject(credentials)
+
+    cached = principal_cache.get(username, issued_at)
+    if cached is not None:
+        return restore_user(db, cached)
 
     user = db.query(User).filter(User.username == username).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    principal_cache.set(username, issued_at, snapshot_user(user))
+    return user
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_current_user for async routes, loading the user through the async session"""
+    username, issued_at = _token_subject(credentials)
+
+    cached = principal_cache.get(username, issued_at)
+    if cached is not None:
+        return await restore_user_async(db, cached)
+
+    user = await db.scalar(select(User).where(User.username == username))
+    if user is None:
+        raise _credentials_exception()
+    principal_cache.set(username, issued_at, snapshot_user(user))
     return user
 
 def get_current_active_user(current_user: User = Depends(get_current_user)):
@@ -37,15 +69,26 @@ def get_current_active_user(current_user: User = Depends(get_current_user)):
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_active_user_async(current_user: User = Depends(get_current_user_async)):
+    return get_current_active_user(current_user)
+
+def _check_roles(current_user: User, allowed_roles: List[str]) -> User:
+    if current_user.role not in allowed_roles:
+        valid_roles = ", ".join([role.value for role in UserRole])
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not enough permissions. Your role: '{current_user.role}'. Valid roles for this endpoint: {', '.join(allowed_roles)}. All available system roles: {valid_roles}"
+        )
+    return current_user
+
 def require_roles(allowed_roles: List[str]):
     def role_checker(current_user: User = Depends(get_current_active_user)):
-        if current_user.role not in allowed_roles:
-            valid_roles = ", ".join([role.value for role in UserRole])
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Not enough permissions. Your role: '{current_user.role}'. Valid roles for this endpoint: {', '.join(allowed_roles)}. All available system roles: {valid_roles}"
-            )
-        return current_user
+        return _check_roles(current_user, allowed_roles)
+    return role_checker
+
+def require_roles_async(allowed_roles: List[str]):
+    async def role_checker(current_user: User = Depends(get_current_active_user_async)):
+        return _check_roles(current_user, allowed_roles)
     return role_checker
 
 def require_admin(current_user: User = Depends(get_current_active_user)):
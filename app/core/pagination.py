@@ -0,0 +1,197 @@
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Type
+import base64
+import json
+from fastapi import HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from app.core.config import settings
+from app.core.serialization import json_list_response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: Optional[str]
+    total: Optional[int] = None
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Apply the default page size and the server-side maximum"""
+    if not limit or limit < 1:
+        return settings.DEFAULT_PAGE_SIZE
+    return min(limit, settings.MAX_PAGE_SIZE)
+
+def count_rows(query: Query) -> int:
+    """COUNT(*) over the query's filters, without its ordering or row loading"""
+    return query.order_by(None).with_entities(func.count()).scalar()
+
+def keyset_paginate(
+    query: Query,
+    keys: Sequence[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    skip: int = 0,
+    with_total: bool = False,
+    row_keys: Optional[Callable[[Any], Sequence[Any]]] = None,
+) -> Page:
+    """Page through query ordered by keys, resuming after the cursor's row.
+
+    keys must uniquely identify a row (end with the primary key) so the
+    order is stable. Filtering on the sort keys instead of OFFSET keeps
+    every page an index range scan however deep it is. skip is still
+    honoured on the first page for callers using offset pagination.
+    limit is capped at MAX_PAGE_SIZE; with_total adds a COUNT of every
+    matching row. Keys may be SQL expressions such as a search rank, in
+    which case row_keys extracts their values from a fetched row.
+    """
+    limit = clamp_limit(limit)
+    total = count_rows(query) if with_total else None
+    rows = _keyset_window(query, keys, limit, cursor, descending, skip).all()
+    return _keyset_page(rows, keys, limit, total, row_keys)
+
+async def keyset_paginate_async(
+    db: AsyncSession,
+    statement: Select,
+    keys: Sequence[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    skip: int = 0,
+    with_total: bool = False,
+    row_keys: Optional[Callable[[Any], Sequence[Any]]] = None,
+) -> Page:
+    """keyset_paginate for a select() run on an AsyncSession.
+
+    Single-entity selects yield the entities themselves; anything else
+    yields rows, as with a Query.
+    """
+    limit = clamp_limit(limit)
+    total = None
+    if with_total:
+        total = await db.scalar(
+            statement.order_by(None).with_only_columns(func.count(), maintain_column_froms=True)
+        )
+    result = await db.execute(_keyset_window(statement, keys, limit, cursor, descending, skip))
+    rows = result.scalars().all() if len(statement.column_descriptions) == 1 else result.all()
+    return _keyset_page(rows, keys, limit, total, row_keys)
+
+def _keyset_window(statement, keys, limit, cursor, descending, skip):
+    """Apply the cursor (or offset), ordering and limit + 1 to a Query or select()"""
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        if len(keys) == 1:
+            position, after = keys[0], values[0]
+        else:
+            position, after = tuple_(*keys), tuple_(*values)
+        statement = statement.filter(position < after if descending else position > after)
+    elif skip:
+        statement = statement.offset(skip)
+
+    statement = statement.order_by(*[key.desc() if descending else key.asc() for key in keys])
+    return statement.limit(limit + 1)
+
+def _keyset_page(rows, keys, limit, total, row_keys) -> Page:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(row_keys(last) if row_keys else [getattr(last, key.key) for key in keys])
+    return Page(list(rows), next_cursor, total)
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque, URL-safe cursor for a row's sort key values"""
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match the sort keys")
+        return [_parse_value(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def page_json(page: Page, schema: Type[BaseModel]) -> Response:
+    """The page's schema items as pre-serialised JSON, with its cursor and total headers"""
+    return json_list_response(schema, page.items, page_headers(page))
+
+def page_headers(page: Page) -> Dict[str, str]:
+    headers = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        headers[TOTAL_COUNT_HEADER] = str(page.total)
+    return headers
+
+def stream_json_array(
+    db: Session,
+    query: Query,
+    keys: Sequence[Any],
+    serialize: Callable[[Any], str],
+    batch_size: int = 500,
+) -> StreamingResponse:
+    """Stream every row of query as one JSON array, batch_size rows per chunk.
+
+    For callers that genuinely need a whole result set: rows are fetched
+    with yield_per and encoded as they go, so memory stays flat. The session
+    is closed when the stream ends, since request-scoped dependencies have
+    already exited by the time the body is sent.
+    """
+    query = query.order_by(*keys).yield_per(batch_size)
+
+    def generate() -> Iterator[bytes]:
+        try:
+            separator = "["
+            chunk = []
+            for row in query:
+                chunk.append(separator + serialize(row))
+                separator = ","
+                if len(chunk) >= batch_size:
+                    yield "".join(chunk).encode("utf-8")
+                    chunk = []
+            chunk.append("]" if separator == "," else "[]")
+            yield "".join(chunk).encode("utf-8")
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+def stream_json_array_async(
+    db: AsyncSession,
+    statement: Select,
+    keys: Sequence[Any],
+    serialize: Callable[[Any], str],
+    batch_size: int = 500,
+) -> StreamingResponse:
+    """stream_json_array for a single-entity select() on an AsyncSession"""
+    statement = statement.order_by(*keys).execution_options(yield_per=batch_size)
+
+    async def generate() -> AsyncIterator[bytes]:
+        try:
+            separator = "["
+            async for partition in (await db.stream_scalars(statement)).partitions():
+                chunk = []
+                for row in partition:
+                    chunk.append(separator + serialize(row))
+                    separator = ","
+                yield "".join(chunk).encode("utf-8")
+            yield b"]" if separator == "," else b"[]"
+        finally:
+            await db.close()
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+def _parse_value(key: Any, value: Any) -> Any:
+    python_type = key.type.python_type
+    if value is not None and python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+    return value
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+import time
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.models.user import User
+from app.core.config import settings
+
+class PrincipalCache:
+    """In-process cache of authenticated users keyed by (username, token iat).
+
+    Entries expire after ttl_seconds and are dropped explicitly whenever a
+    user's profile, role, active flag or password changes. The cache is per
+    process, so with several workers the TTL bounds how long another worker
+    can serve a stale principal.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Any], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._keys_by_username: Dict[str, set] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, username: str, issued_at: Any) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        key = (username, issued_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, username: str, issued_at: Any, values: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        key = (username, issued_at)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, values)
+            self._entries.move_to_end(key)
+            self._keys_by_username.setdefault(username, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, *usernames: str) -> None:
+        """Drop every cached token for the given usernames"""
+        with self._lock:
+            for username in usernames:
+                for key in self._keys_by_username.pop(username, set()):
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_username.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, key: Tuple[str, Any]) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_username.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_username[key[0]]
+
+def snapshot_user(user: User) -> Dict[str, Any]:
+    """Column values of a loaded user, safe to keep beyond its session"""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+def restore_user(db: Session, values: Dict[str, Any]) -> User:
+    """Attach a cached user to the session as a persistent instance without a SELECT"""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+async def restore_user_async(db: AsyncSession, values: Dict[str, Any]) -> User:
+    user = User(**values)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_TTL_SECONDS, settings.PRINCIPAL_CACHE_MAX_ENTRIES)
@@ -0,0 +1,18 @@
+from typing import Any
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """The application's default response class, rendered with orjson.
+
+    orjson writes datetimes, dates, UUIDs and Enum members (by value) itself,
+    in the same form the stdlib encoder produced. Anything it does not know,
+    such as Decimal from a SQL aggregate or a pydantic model inside a dict,
+    falls back to jsonable_encoder. Non-string keys are stringified as
+    json.dumps does.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
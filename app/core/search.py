@@ -0,0 +1,28 @@
+from typing import Sequence
+from sqlalchemy import case, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# Match quality, best first; used as the leading keyset sort key
+EXACT, PREFIX, CONTAINS = 0, 1, 2
+
+def escape_like(term: str) -> str:
+    """Treat LIKE wildcards in user input literally"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def contains_any(columns: Sequence[ColumnElement], term: str) -> ColumnElement:
+    """Case-insensitive substring match against any of columns.
+
+    On PostgreSQL the searched columns carry pg_trgm GIN indexes, which serve
+    ILIKE '%term%' directly; elsewhere this is a scan.
+    """
+    pattern = f"%{escape_like(term)}%"
+    return or_(*[column.ilike(pattern, escape="\\") for column in columns])
+
+def match_rank(columns: Sequence[ColumnElement], term: str) -> ColumnElement:
+    """EXACT, PREFIX or CONTAINS for the best match of term across columns"""
+    prefix = f"{escape_like(term)}%"
+    return case(
+        (or_(*[func.lower(column) == term.lower() for column in columns]), EXACT),
+        (or_(*[column.ilike(prefix, escape="\\") for column in columns]), PREFIX),
+        else_=CONTAINS,
+    )
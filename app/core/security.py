@@ -1,10 +1,92 @@
 from datetime import datetime, timedelta
-from typing import Union
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with any other cost factor are flagged for rehash on next login
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing pool and its queue are full"""
+
+class PasswordHashingPool:
+    """Size-limited thread pool for bcrypt work.
+
+    bcrypt releases the GIL while hashing, so threads hash in parallel
+    without a process pool. Bounding them stops a login storm from tying up
+    every request thread and CPU core: at most max_workers hashes run at
+    once, max_queue more may wait, and anything beyond that fails fast with
+    PasswordHashingBusy. Async callers await run_async, so neither the event
+    loop nor a request thread waits while bcrypt runs.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        self._slots = BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = Lock()
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn in the pool and block the calling thread until it returns"""
+        return self._submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn in the pool and await its result"""
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHashingBusy("Password hashing capacity exceeded, please retry shortly")
+
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(self._execute, fn, *args)
+        except BaseException:
+            self._finish()
+            raise
+        # The slot is freed when the work ends, even if an awaiting request was cancelled
+        future.add_done_callback(self._finish)
+        return future
+
+    def _finish(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _execute(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+hashing_pool = PasswordHashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None):
     to_encode = data.copy()
@@ -12,15 +94,25 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return hashing_pool.run(pwd_context.verify, plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return hashing_pool.run(pwd_context.hash, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run_async(pwd_context.verify, plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password, returning a replacement hash when the stored one uses an outdated cost"""
+    return await hashing_pool.run_async(pwd_context.verify_and_update, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await hashing_pool.run_async(pwd_context.hash, password)
 
 def verify_token(token: str) -> Union[dict, None]:
     try:
@@ -0,0 +1,175 @@
+from email.message import Message
+from threading import BoundedSemaphore, Lock
+from typing import Dict, List, Optional
+import smtplib
+import time
+from app.core.config import settings
+
+class SMTPConnectionPool:
+    """Pool of authenticated SMTP sessions reused across messages.
+
+    Connecting, STARTTLS and AUTH happen once per session rather than once per
+    message. At most `size` sessions are open at a time; idle sessions are
+    checked with NOOP before reuse and replaced when the server has dropped
+    them or they have been idle longer than max_idle_seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        timeout: float = 10,
+        size: int = 4,
+        max_idle_seconds: float = 60,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.size = max(1, size)
+        self.max_idle_seconds = max_idle_seconds
+        self._slots = BoundedSemaphore(self.size)
+        self._idle: List[tuple] = []
+        self._lock = Lock()
+        self.connections_opened = 0
+        self.messages_sent = 0
+        self.reconnects = 0
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.host and self.username and self.password)
+
+    def send(self, message: Message) -> None:
+        error = self.send_batch([message])[0]
+        if error is not None:
+            raise error
+
+    def send_batch(self, messages: List[Message]) -> List[Optional[Exception]]:
+        """Send messages over one session, returning None or the error for each.
+
+        A dropped connection is re-established and the message retried once;
+        errors about a single message (e.g. refused recipients) do not stop
+        the rest of the batch. If the session is lost for good (the reconnect
+        fails, the server drops it again, a socket error or timeout), that
+        message and the unsent rest get the error; messages already sent keep
+        their result so callers do not send them again.
+        """
+        results: List[Optional[Exception]] = []
+        self._slots.acquire()
+        server = None
+        try:
+            try:
+                server = self._checkout()
+            except (smtplib.SMTPException, OSError) as e:
+                return [e] * len(messages)
+            for index, message in enumerate(messages):
+                try:
+                    try:
+                        server.send_message(message)
+                    except smtplib.SMTPServerDisconnected:
+                        server.close()
+                        server = None
+                        with self._lock:
+                            self.reconnects += 1
+                        server = self._connect()
+                        server.send_message(message)
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                    self._reset(server)
+                    results.append(e)
+                    continue
+                except (smtplib.SMTPException, OSError) as e:
+                    results.extend([e] * (len(messages) - index))
+                    break
+                results.append(None)
+                with self._lock:
+                    self.messages_sent += 1
+            else:
+                self._checkin(server)
+                server = None
+        finally:
+            if server is not None:
+                self._quit(server)
+            self._slots.release()
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._quit(server)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "connections_opened": self.connections_opened,
+                "reconnects": self.reconnects,
+                "messages_sent": self.messages_sent,
+            }
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, idle_since = self._idle.pop()
+            if time.monotonic() - idle_since <= self.max_idle_seconds and self._is_alive(server):
+                return server
+            self._quit(server)
+        return self._connect()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            self._quit(server)
+            raise
+        with self._lock:
+            self.connections_opened += 1
+        return server
+
+    def _checkin(self, server: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((server, time.monotonic()))
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _reset(server: smtplib.SMTP) -> None:
+        try:
+            server.rset()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+smtp_pool = SMTPConnectionPool(
+    settings.SMTP_SERVER,
+    settings.SMTP_PORT,
+    settings.SMTP_USERNAME,
+    settings.SMTP_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    timeout=settings.SMTP_TIMEOUT_SECONDS,
+    size=settings.SMTP_POOL_SIZE,
+    max_idle_seconds=settings.SMTP_MAX_IDLE_SECONDS,
+)
@@ -0,0 +1,276 @@
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+import heapq
+import logging
+import re
+import time
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.models.student import Student
+from app.models.supervisor import Supervisor
+from app.models.user import User
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("student", "supervisor", "user")
+
+class TypeaheadEntry(NamedTuple):
+    kind: str
+    id: str
+    label: str
+    detail: Optional[str]
+    tokens: FrozenSet[str]
+
+EntryKey = Tuple[str, str]
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return [token for token in re.split(r"[^0-9a-z]+", (text or "").lower()) if token]
+
+def student_entry(student_number: str, forename: str, surname: str) -> TypeaheadEntry:
+    label = f"{forename} {surname}"
+    return TypeaheadEntry("student", student_number, label, student_number,
+                          frozenset(tokenize(label) + tokenize(student_number)))
+
+def supervisor_entry(supervisor_id: int, supervisor_name: str, email: Optional[str]) -> TypeaheadEntry:
+    return TypeaheadEntry("supervisor", str(supervisor_id), supervisor_name, email,
+                          frozenset(tokenize(supervisor_name) + tokenize(email)))
+
+def user_entry(user_id: int, username: str, email: str, first_name: Optional[str], last_name: Optional[str]) -> TypeaheadEntry:
+    label = " ".join(name for name in (first_name, last_name) if name) or username
+    return TypeaheadEntry("user", str(user_id), label, email,
+                          frozenset(tokenize(label) + tokenize(username) + tokenize(email)))
+
+class TypeaheadIndex:
+    """In-process prefix index over students, supervisors and users.
+
+    Every prefix of every token (up to max_prefix_length characters) maps to
+    the entries containing it, so a lookup is one set intersection per query
+    word and never touches the database. Committed ORM changes are applied
+    through mapper events; writes made by other processes or by bulk
+    statements only appear after the next rebuild.
+    """
+
+    def __init__(self, max_prefix_length: int = 12, max_cached_queries: int = 1024):
+        self.max_prefix_length = max_prefix_length
+        self.max_cached_queries = max_cached_queries
+        self._entries: Dict[EntryKey, TypeaheadEntry] = {}
+        self._prefixes: Dict[str, Set[EntryKey]] = {}
+        self._tokens: Dict[str, Set[EntryKey]] = {}
+        self._order: Dict[EntryKey, Tuple[int, str, str]] = {}
+        # Top-k results per query; any write clears it
+        self._results: "OrderedDict[Tuple[Tuple[str, ...], FrozenSet[str], int], List[TypeaheadEntry]]" = OrderedDict()
+        self._lock = Lock()
+        self.built_at: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+        self.lookups = 0
+
+    def build(self, db: Session) -> int:
+        """Replace the index contents with every student, supervisor and user"""
+        started = time.perf_counter()
+        entries = [
+            *(student_entry(*row) for row in db.query(
+                Student.student_number, Student.forename, Student.surname).yield_per(1000)),
+            *(supervisor_entry(*row) for row in db.query(
+                Supervisor.supervisor_id, Supervisor.supervisor_name, Supervisor.email).yield_per(1000)),
+            *(user_entry(*row) for row in db.query(
+                User.id, User.username, User.email, User.first_name, User.last_name).yield_per(1000)),
+        ]
+        fresh = TypeaheadIndex(self.max_prefix_length)
+        for entry in entries:
+            fresh._add(entry)
+        with self._lock:
+            self._entries, self._prefixes = fresh._entries, fresh._prefixes
+            self._tokens, self._order = fresh._tokens, fresh._order
+            self._results.clear()
+            self.built_at = time.time()
+            self.build_seconds = time.perf_counter() - started
+        return len(entries)
+
+    def upsert(self, entry: TypeaheadEntry) -> None:
+        with self._lock:
+            self._remove((entry.kind, entry.id))
+            self._add(entry)
+
+    def remove(self, kind: str, entry_id: str) -> None:
+        with self._lock:
+            self._remove((kind, entry_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._prefixes.clear()
+            self._tokens.clear()
+            self._order.clear()
+            self._results.clear()
+
+    def search(self, query: str, kinds: Iterable[str] = KINDS, limit: int = 10) -> List[TypeaheadEntry]:
+        """Top matches where every query word prefixes a token, exact words and short labels first"""
+        words = tokenize(query)
+        if not words:
+            return []
+        kinds = frozenset(kinds)
+        cache_key = (tuple(words), kinds, limit)
+        long_words = [word for word in words if len(word) > self.max_prefix_length]
+        with self._lock:
+            self.lookups += 1
+            cached = self._results.get(cache_key)
+            if cached is not None:
+                self._results.move_to_end(cache_key)
+                return cached
+
+            candidates = sorted((self._prefixes.get(word[:self.max_prefix_length], set()) for word in words), key=len)
+            keys = candidates[0].intersection(*candidates[1:]) if len(candidates) > 1 else candidates[0]
+            if len(kinds) < len(KINDS):
+                keys = [key for key in keys if key[0] in kinds]
+            # Words longer than the indexed prefixes still need checking in full
+            if long_words:
+                keys = [key for key in keys if all(
+                    any(token.startswith(word) for token in self._entries[key].tokens) for word in long_words
+                )]
+            # Rank on keys and precomputed orderings; only the top entries are materialised
+            exact = [self._tokens.get(word, set()) for word in words]
+            order = self._order
+            top = heapq.nsmallest(limit, keys, key=lambda key: (-sum(key in tokens for tokens in exact), order[key]))
+            results = [self._entries[key] for key in top]
+
+            self._results[cache_key] = results
+            if len(self._results) > self.max_cached_queries:
+                self._results.popitem(last=False)
+            return results
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "prefixes": len(self._prefixes),
+                "lookups": self.lookups,
+                "cached_queries": len(self._results),
+                "built_at": self.built_at,
+                "build_seconds": self.build_seconds,
+            }
+
+    def _add(self, entry: TypeaheadEntry) -> None:
+        key = (entry.kind, entry.id)
+        self._results.clear()
+        self._entries[key] = entry
+        self._order[key] = (len(entry.label), entry.label.lower(), entry.id)
+        for token in entry.tokens:
+            self._tokens.setdefault(token, set()).add(key)
+        for prefix in self._token_prefixes(entry.tokens):
+            self._prefixes.setdefault(prefix, set()).add(key)
+
+    def _remove(self, key: EntryKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._results.clear()
+        del self._order[key]
+        self._discard(self._tokens, entry.tokens, key)
+        self._discard(self._prefixes, self._token_prefixes(entry.tokens), key)
+
+    @staticmethod
+    def _discard(mapping: Dict[str, Set[EntryKey]], names: Iterable[str], key: EntryKey) -> None:
+        for name in names:
+            keys = mapping.get(name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del mapping[name]
+
+    def _token_prefixes(self, tokens: Iterable[str]) -> Set[str]:
+        return {token[:length] for token in tokens for length in range(1, min(len(token), self.max_prefix_length) + 1)}
+
+class TypeaheadRebuilder:
+    """Background thread that periodically rebuilds the index from the database"""
+
+    def __init__(self, index: TypeaheadIndex, session_factory: Callable[[], Session], interval_seconds: int):
+        self.index = index
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="typeahead-rebuilder", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def rebuild_once(self) -> int:
+        db = self.session_factory()
+        try:
+            return self.index.build(db)
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.rebuild_once()
+            except Exception as e:
+                logger.error(f"Typeahead index rebuild failed: {e}")
+
+typeahead_index = TypeaheadIndex()
+
+# Changes are queued on the session during flush, tagged with the transaction
+# or savepoint that made them, and applied only once the outermost transaction
+# commits, so rolled-back writes never reach the index.
+_PENDING_KEY = "typeahead_pending"
+
+def _queue(target, change: Tuple[str, object]) -> None:
+    session = object_session(target)
+    if session is not None and settings.TYPEAHEAD_ENABLED:
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        session.info.setdefault(_PENDING_KEY, []).append((transaction, change))
+
+def _entry_for(target) -> TypeaheadEntry:
+    if isinstance(target, Student):
+        return student_entry(target.student_number, target.forename, target.surname)
+    if isinstance(target, Supervisor):
+        return supervisor_entry(target.supervisor_id, target.supervisor_name, target.email)
+    return user_entry(target.id, target.username, target.email, target.first_name, target.last_name)
+
+def _on_upsert(mapper, connection, target) -> None:
+    _queue(target, ("upsert", _entry_for(target)))
+
+def _on_delete(mapper, connection, target) -> None:
+    entry = _entry_for(target)
+    _queue(target, ("remove", (entry.kind, entry.id)))
+
+for _model in (Student, Supervisor, User):
+    event.listen(_model, "after_insert", _on_upsert)
+    event.listen(_model, "after_update", _on_upsert)
+    event.listen(_model, "after_delete", _on_delete)
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    for _, (action, value) in session.info.pop(_PENDING_KEY, ()):
+        if action == "upsert":
+            typeahead_index.upsert(value)
+        else:
+            typeahead_index.remove(*value)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    pending = session.info.get(_PENDING_KEY)
+    if pending:
+        session.info[_PENDING_KEY] = [
+            (transaction, change) for transaction, change in pending
+            if not _within(transaction, previous_transaction)
+        ]
+
+def _within(transaction, ancestor) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
@@ -0,0 +1,83 @@
+from typing import Any, AsyncIterator, BinaryIO, Iterable, NamedTuple
+import hashlib
+import os
+import tempfile
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+class StoredFile(NamedTuple):
+    path: str
+    size: int
+    sha256: str
+
+async def save_stream(chunks: AsyncIterator[bytes], destination: str, max_size: int = None) -> StoredFile:
+    """Write a stream of chunks to destination without blocking the event loop.
+
+    Chunks are hashed and written to a temporary file in the destination
+    directory on the threadpool, then the file is atomically renamed into
+    place, so readers never see a partial file. Streams larger than max_size
+    are aborted mid-stream with a 413 and leave nothing behind.
+    """
+    max_size = max_size or settings.MAX_UPLOAD_SIZE_BYTES
+    directory = os.path.dirname(destination)
+    await run_in_threadpool(os.makedirs, directory, exist_ok=True)
+    fd, temp_path = await run_in_threadpool(tempfile.mkstemp, dir=directory, prefix=".upload-", suffix=".tmp")
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds the maximum upload size of {max_size} bytes"
+                    )
+                await run_in_threadpool(_write_chunk, buffer, digest, chunk)
+            await run_in_threadpool(_flush, buffer)
+        await run_in_threadpool(os.replace, temp_path, destination)
+    except BaseException:
+        _remove_quietly(temp_path)
+        raise
+
+    return StoredFile(destination, size, digest.hexdigest())
+
+async def iter_upload(file: UploadFile, chunk_size: int = None) -> AsyncIterator[bytes]:
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_BYTES
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+async def iter_files(paths: Iterable[str], chunk_size: int = None) -> AsyncIterator[bytes]:
+    """Read files back to back in chunks on the threadpool"""
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE_BYTES
+    for path in paths:
+        with await run_in_threadpool(open, path, "rb") as source:
+            while True:
+                chunk = await run_in_threadpool(source.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+def safe_filename(filename: str) -> str:
+    """Strip any client-supplied directory components from an upload name"""
+    name = os.path.basename((filename or "").replace("\\", "/"))
+    return name if name not in ("", ".", "..") else "upload"
+
+def _write_chunk(buffer: BinaryIO, digest: Any, chunk: bytes) -> None:
+    digest.update(chunk)
+    buffer.write(chunk)
+
+def _flush(buffer: BinaryIO) -> None:
+    buffer.flush()
+    os.fsync(buffer.fileno())
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,81 @@
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Optional
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.db.session import PoolMetrics, engine_options
+
+# Async drivers used in place of the configured sync ones
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+def async_database_url(database_url: Optional[str] = None) -> URL:
+    """The async equivalent of a database URL (ASYNC_DATABASE_URL wins when set)"""
+    if database_url is None and settings.ASYNC_DATABASE_URL:
+        return make_url(settings.ASYNC_DATABASE_URL)
+    url = make_url(database_url or settings.DATABASE_URL)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend} databases")
+    url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    if backend == "postgresql" and "sslmode" in url.query:
+        # asyncpg spells libpq's sslmode as ssl
+        query = dict(url.query)
+        query["ssl"] = query.pop("sslmode")
+        url = url.set(query=query)
+    return url
+
+def create_async_db_engine(database_url: Optional[str] = None, **overrides: Any) -> AsyncEngine:
+    """Async counterpart of create_db_engine with the same pool settings and metrics"""
+    url = async_database_url(database_url)
+    options, capacity = engine_options(url, **overrides)
+    engine = create_async_engine(url, **options)
+    engine.sync_engine.pool_metrics = PoolMetrics()
+    engine.sync_engine.pool_metrics.attach(engine.sync_engine, capacity)
+    return engine
+
+_async_engine: Optional[AsyncEngine] = None
+_async_engine_lock = Lock()
+
+def get_async_engine() -> AsyncEngine:
+    """The application's async engine, created on first use like get_engine()"""
+    global _async_engine
+    if _async_engine is None:
+        with _async_engine_lock:
+            if _async_engine is None:
+                _async_engine = create_async_db_engine()
+    return _async_engine
+
+async def dispose_async_engine() -> None:
+    global _async_engine
+    engine, _async_engine = _async_engine, None
+    if engine is not None:
+        await engine.dispose()
+
+def reset_async_engine() -> None:
+    """Forget the engine without closing its connections, for forked children"""
+    global _async_engine
+    with _async_engine_lock:
+        if _async_engine is not None:
+            _async_engine.sync_engine.dispose(close=False)
+            _async_engine = None
+
+def get_async_pool_metrics() -> Dict[str, Any]:
+    if _async_engine is None:
+        return {"connects": 0, "checkouts": 0, "pool": "not created"}
+    bind = _async_engine.sync_engine
+    return bind.pool_metrics.snapshot(bind)
+
+class LazyAsyncSessionMaker(async_sessionmaker):
+    """async_sessionmaker that binds to the application's async engine on first use"""
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            self.configure(bind=get_async_engine())
+        return super().__call__(**local_kw)
+
+# Objects stay usable after commit: attribute refreshes would need an await
+AsyncSessionLocal = LazyAsyncSessionMaker(autoflush=False, expire_on_commit=False)
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,15 +1,22 @@
 from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
+class ModelDefaults:
+    # Server-generated columns (created_date, updated_date, ...) are returned by the
+    # INSERT/UPDATE itself via RETURNING, so a written row never needs a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+Base = declarative_base(cls=ModelDefaults)
 
 # Import all models here so Alembic can detect them
 from app.models.user import User
 from app.models.notification import Notification
+from app.models.report_snapshot import ReportSnapshot
 from app.models.student import Student
 from app.models.supervisor import Supervisor
 from app.models.student_supervisor import StudentSupervisor
 from app.models.registration import Registration
 from app.models.submission import Submission
+from app.models.upload_session import UploadSession, UploadSessionPart
 from app.models.timeline import Timeline
 from app.models.appraisal import Appraisal
 from app.models.viva_team import VivaTeam
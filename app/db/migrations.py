@@ -0,0 +1,109 @@
+from pathlib import Path
+from typing import Optional, Set
+import logging
+import os
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# The revision whose schema matches what the old startup create_all built;
+# migrate stamps databases created that way here before upgrading them
+CREATE_ALL_REVISION = "77cbf9c54007"
+
+# Tables create_all could have built; anything else means the schema is not
+# one migrate knows how to adopt
+CREATE_ALL_TABLES = frozenset({
+    "users", "students", "supervisors", "notifications", "student_supervisors",
+    "registrations", "submissions", "timelines", "appraisals", "viva_teams",
+})
+
+def alembic_config() -> Config:
+    """Alembic config for this project; env.py takes the URL from DATABASE_URL"""
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    return config
+
+def head_revisions() -> Set[str]:
+    return set(ScriptDirectory.from_config(alembic_config()).get_heads())
+
+def current_revisions(bind: Engine) -> Set[str]:
+    with bind.connect() as connection:
+        return set(MigrationContext.configure(connection).get_current_heads())
+
+def schema_revision_problem(bind: Engine) -> Optional[str]:
+    """Why the database is not at the latest migration, or None if it is"""
+    current, heads = current_revisions(bind), head_revisions()
+    if current == heads:
+        return None
+    if not current:
+        if unversioned_schema(bind):
+            return unversioned_schema_message()
+        return "Database has no schema revision; run `python -m app.cli migrate`"
+    return (f"Database schema is at {', '.join(sorted(current))} but the code expects "
+            f"{', '.join(sorted(heads))}; run `python -m app.cli migrate`")
+
+def verify_schema_revision(bind: Engine, mode: str) -> None:
+    """Startup check: one read of alembic_version, no reflection.
+
+    mode is "strict" (refuse to start), "warn" (log and continue) or "off".
+    """
+    if mode == "off":
+        return
+    problem = schema_revision_problem(bind)
+    if problem is None:
+        return
+    if mode == "strict":
+        raise RuntimeError(problem)
+    logger.warning(problem)
+
+def unversioned_schema(bind: Engine) -> bool:
+    """True for a database with application tables but no alembic_version, i.e. built by create_all"""
+    with bind.connect() as connection:
+        tables = set(inspect(connection).get_table_names())
+    return "alembic_version" not in tables and "students" in tables
+
+def unversioned_schema_message() -> str:
+    return ("Database has tables but no schema revision (it was created by create_all); "
+            f"run `python -m app.cli migrate`, which stamps it at {CREATE_ALL_REVISION} first")
+
+def stamp_unversioned(bind: Engine) -> None:
+    """Give a database without alembic_version a starting revision before upgrading it.
+
+    create_all databases are stamped at CREATE_ALL_REVISION; 1b6e8f0c2a47
+    then only adds the tables they are missing. An empty database is stamped
+    there too, because 77cbf9c54007 references users without creating it and
+    1b6e8f0c2a47 creates both.
+    """
+    with bind.connect() as connection:
+        tables = set(inspect(connection).get_table_names())
+    if "alembic_version" in tables:
+        return
+    unknown = tables - CREATE_ALL_TABLES
+    if unknown:
+        raise RuntimeError(f"Database has no schema revision and tables create_all never built "
+                           f"({', '.join(sorted(unknown))}); stamp it by hand with `python -m app.cli stamp`")
+    if tables:
+        logger.info("Stamping create_all database at %s", CREATE_ALL_REVISION)
+    stamp(CREATE_ALL_REVISION)
+
+def upgrade(revision: str = "head", sql: bool = False) -> None:
+    if not sql:
+        # Same URL as alembic/env.py
+        bind = create_engine(os.getenv("DATABASE_URL") or settings.DATABASE_URL, poolclass=NullPool)
+        try:
+            stamp_unversioned(bind)
+        finally:
+            bind.dispose()
+    command.upgrade(alembic_config(), revision, sql=sql)
+
+def stamp(revision: str) -> None:
+    command.stamp(alembic_config(), revision)
@@ -1,14 +1,169 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import sessionmaker
-import os
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
+from app.core.config import settings
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+class PoolMetrics:
+    """Counters fed by connection pool events.
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    A checkout that leaves every pooled and overflow connection in use is
+    counted as saturated: until a connection is returned, further checkouts
+    wait up to DB_POOL_TIMEOUT, so a rising count is the early sign of pool
+    exhaustion turning into request latency.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.overflow_checkouts = 0
+        self.saturated_checkouts = 0
+        self.peak_checked_out = 0
+
+    def attach(self, engine: Engine, capacity: Optional[int] = None) -> None:
+        pool = engine.pool
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+            with self._lock:
+                self.checkouts += 1
+                self.peak_checked_out = max(self.peak_checked_out, checked_out)
+                if hasattr(pool, "overflow") and pool.overflow() > 0:
+                    self.overflow_checkouts += 1
+                if capacity is not None and checked_out >= capacity:
+                    self.saturated_checkouts += 1
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self.checkins += 1
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+
+    def snapshot(self, engine: Engine) -> Dict[str, Any]:
+        pool = engine.pool
+        with self._lock:
+            stats = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "overflow_checkouts": self.overflow_checkouts,
+                "saturated_checkouts": self.saturated_checkouts,
+                "peak_checked_out": self.peak_checked_out,
+            }
+        stats["pool"] = pool.status()
+        if hasattr(pool, "checkedout"):
+            stats.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        return stats
+
+def engine_options(url: URL, **overrides: Any) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Engine keyword arguments from settings, and the pool capacity when it is bounded"""
+    backend = url.get_backend_name()
+
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if backend != "sqlite":
+        # SQLite uses a single-file or per-thread pool where sizing does not apply
+        options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        })
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    options.update(overrides)
+
+    capacity = None
+    if "pool_size" in options and options.get("max_overflow", 0) >= 0:
+        capacity = options["pool_size"] + options.get("max_overflow", 0)
+    return options, capacity
+
+def create_db_engine(database_url: Optional[str] = None, **overrides: Any) -> Engine:
+    """Create an engine with pool sizing, pre-ping, recycle and timeouts from settings"""
+    url = make_url(database_url or settings.DATABASE_URL)
+    options, capacity = engine_options(url, **overrides)
+    engine = create_engine(url, **options)
+    engine.pool_metrics = PoolMetrics()
+    engine.pool_metrics.attach(engine, capacity)
+    return engine
+
+_engine: Optional[Engine] = None
+_engine_lock = Lock()
+
+def get_engine() -> Engine:
+    """The application engine, created on first use.
+
+    Nothing is created at import, so importing the app neither loads the
+    DBAPI nor opens a connection; forked workers each build their own
+    engine and pool the first time they touch the database.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+    return _engine
+
+def dispose_engine(close: bool = True) -> None:
+    """Drop the engine; the next use creates a fresh one.
+
+    In a forked child pass close=False so connections inherited from the
+    parent are abandoned rather than closed underneath it.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose(close=close)
+            _engine = None
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from app.db.session import engine` working without an import-time engine
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_pool_metrics(bind: Optional[Engine] = None) -> Dict[str, Any]:
+    if bind is None:
+        if _engine is None:
+            return {"connects": 0, "checkouts": 0, "pool": "not created"}
+        bind = _engine
+    return bind.pool_metrics.snapshot(bind)
+
+class LazySessionMaker(sessionmaker):
+    """sessionmaker that binds to the application engine on first use"""
+
+    def __call__(self, **local_kw: Any):
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+# Committed objects keep their flushed state (eager defaults included) instead of
+# being expired and reloaded with a SELECT when the response is serialised
+SessionLocal = LazySessionMaker(autocommit=False, autoflush=False, expire_on_commit=False)
 
 def get_db():
     db = SessionLocal()
@@ -1,22 +1,69 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import (
     auth, students, supervisors, registrations, viva_teams, 
-    timelines, appraisals, submissions, reports, student_supervisors, notifications
+    timelines, appraisals, submissions, reports, student_supervisors, notifications, search
 )
-from app.db.session import engine
-from app.db.base import Base
+from app.db.session import SessionLocal, get_engine, get_pool_metrics
+from app.db.async_session import dispose_async_engine, get_async_pool_metrics
+from app.db.migrations import verify_schema_revision
+from app.core.config import settings
+from app.core.dependencies import require_admin
+from app.core.security import PasswordHashingBusy, hashing_pool
+from app.core.principal_cache import principal_cache
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from app.core.responses import ORJSONResponse
+from app.core.smtp_pool import smtp_pool
+from app.core.typeahead import TypeaheadRebuilder, typeahead_index
+from app.services.report_snapshot_service import ReportSnapshotRefresher
+from app.workers.notification_worker import NotificationWorker
 import os
+import logging
+from anyio import to_thread
 from dotenv import load_dotenv
 
 load_dotenv()
 
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+report_snapshot_refresher = ReportSnapshotRefresher(SessionLocal, settings.REPORT_SNAPSHOT_REFRESH_SECONDS)
+typeahead_rebuilder = TypeaheadRebuilder(typeahead_index, SessionLocal, settings.TYPEAHEAD_REBUILD_SECONDS)
+notification_worker = NotificationWorker(
+    SessionLocal, settings.NOTIFICATION_WORKER_BATCH_SIZE, settings.NOTIFICATION_WORKER_POLL_SECONDS
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The schema belongs to Alembic (`python -m app.cli migrate`); startup only checks the revision
+    verify_schema_revision(get_engine(), settings.SCHEMA_REVISION_CHECK)
+    # Sync routes and dependencies run on this per-worker threadpool
+    if settings.THREADPOOL_SIZE > 0:
+        to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    if settings.TYPEAHEAD_ENABLED:
+        try:
+            typeahead_rebuilder.rebuild_once()
+        except Exception as e:
+            # Serve without typeahead results rather than refuse to start; the rebuilder retries
+            logger.error(f"Typeahead index build failed: {e}")
+        typeahead_rebuilder.start()
+    report_snapshot_refresher.start()
+    # Deliver the outbox from the web process unless a separate worker does
+    if settings.NOTIFICATION_WORKER_IN_PROCESS:
+        notification_worker.start()
+    yield
+    notification_worker.stop()
+    report_snapshot_refresher.stop()
+    typeahead_rebuilder.stop()
+    smtp_pool.close()
+    await dispose_async_engine()
 
 app = FastAPI(
     title="EdgeHill PGR Management System",
     description="Postgraduate Research Student Management System for Edge Hill University",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -25,8 +72,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    return ORJSONResponse(status_code=429, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+if settings.ASYNC_DB_ENABLED:
+    # Async read routes shadow their sync equivalents, so they must be registered first
+    app.include_router(students.async_router, prefix="/api/v1/students", tags=["Students"])
+    app.include_router(submissions.async_router, prefix="/api/v1/submissions", tags=["Submissions"])
+    app.include_router(notifications.async_router, prefix="/api/v1/notifications", tags=["Notifications"])
+    app.include_router(reports.async_router, prefix="/api/v1/reports", tags=["Reports"])
+
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(students.router, prefix="/api/v1/students", tags=["Students"])
 app.include_router(supervisors.router, prefix="/api/v1/supervisors", tags=["Supervisors"])
@@ -38,6 +97,7 @@ app.include_router(appraisals.router, prefix="/api/v1/appraisals", tags=["Apprai
 app.include_router(submissions.router, prefix="/api/v1/submissions", tags=["Submissions"])
 app.include_router(reports.router, prefix="/api/v1/reports", tags=["Reports"])
 app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["Notifications"])
+app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
 
 @app.get("/")
 async def root():
@@ -47,6 +107,19 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", dependencies=[Depends(require_admin)])
+async def metrics():
+    limiter = to_thread.current_default_thread_limiter()
+    return {
+        "database_pool": get_pool_metrics(),
+        "async_database_pool": get_async_pool_metrics(),
+        "password_hashing": hashing_pool.stats(),
+        "principal_cache": principal_cache.stats(),
+        "smtp_pool": smtp_pool.stats(),
+        "typeahead": typeahead_index.stats(),
+        "threadpool": {"size": limiter.total_tokens, "busy": limiter.borrowed_tokens},
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
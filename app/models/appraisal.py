@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, Enum, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -45,6 +45,12 @@ class Appraisal(Base):
     reviewer = relationship("User", foreign_keys=[reviewer_id])
     approver = relationship("User", foreign_keys=[approved_by])
     
+    __table_args__ = (
+        Index("ix_appraisals_student_number_id", "student_number", "id"),
+        Index("ix_appraisals_academic_year_status", "academic_year", "status"),
+        Index("ix_appraisals_status", "status"),
+    )
+    
     def __repr__(self):
         return f"<Appraisal(student='{self.student_number}', year='{self.academic_year}', status='{self.status}')>"
 
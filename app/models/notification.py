@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from datetime import datetime
@@ -50,5 +50,12 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
     
+    __table_args__ = (
+        # Inbox pages: newest first per user, matching the keyset order
+        Index("ix_notifications_user_created", user_id, created_at.desc(), id.desc()),
+        # Worker claims: due PENDING rows in scheduled order
+        Index("ix_notifications_status_scheduled", status, scheduled_at, id),
+    )
+    
     def __repr__(self):
         return f"<Notification(id={self.id}, type='{self.type}', title='{self.title}', status='{self.status}')>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -20,6 +20,11 @@ class Registration(Base):
     updated_date = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     student = relationship("Student", back_populates="registrations")
     
+    __table_args__ = (
+        Index("ix_registrations_student_number", "student_number"),
+        Index("ix_registrations_status_id", "registration_status", "registration_id"),
+    )
+    
     def __repr__(self):
         return f"<Registration(id={self.registration_id}, student='{self.student_number}', status='{self.registration_status}')>"
 
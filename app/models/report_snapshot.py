@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from app.db.base import Base
+from datetime import datetime
+
+class ReportSnapshot(Base):
+    __tablename__ = "report_snapshots"
+    
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    report_name = Column(String(100), nullable=False)  # e.g., "department-dashboard", "student-overview"
+    params_key = Column(String(255), nullable=False, default="")  # canonical JSON of the report parameters
+    payload = Column(Text, nullable=False)  # JSON report body
+    generated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_report_snapshots_lookup", "report_name", "params_key", "generated_at"),
+    )
+    
+    def __repr__(self):
+        return f"<ReportSnapshot(report='{self.report_name}', params='{self.params_key}', generated_at='{self.generated_at}')>"
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Text
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Index
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -23,5 +24,23 @@ class Student(Base):
     updated_date = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     student_notes = Column(Text, comment="General notes about the student - special circumstances or important background information")
     
+    @hybrid_property
+    def full_name(self):
+        return self.forename + " " + self.surname
+    
     def __repr__(self):
         return f"<Student(student_number='{self.student_number}', name='{self.forename} {self.surname}')>"
+
+# Trigram indexes for the ILIKE '%term%' searches in StudentService; PostgreSQL only
+Index(
+    "ix_students_full_name_trgm", Student.full_name.label("full_name"),
+    postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_students_student_number_trgm", Student.student_number,
+    postgresql_using="gin", postgresql_ops={"student_number": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_students_programme_of_study_trgm", Student.programme_of_study,
+    postgresql_using="gin", postgresql_ops={"programme_of_study": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from app.models.student import Student
@@ -16,6 +16,11 @@ class StudentSupervisor(Base):
     student = relationship("Student", back_populates="supervisors")
     supervisor = relationship("Supervisor", back_populates="students")
     
+    __table_args__ = (
+        Index("ix_student_supervisors_student_number", "student_number"),
+        Index("ix_student_supervisors_supervisor_id", "supervisor_id"),
+    )
+    
     def __repr__(self):
         return f"<StudentSupervisor(student='{self.student_number}', supervisor={self.supervisor_id}, role='{self.role}')>"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -30,6 +30,7 @@ class Submission(Base):
     file_path = Column(String(500))
     file_name = Column(String(200))
     file_size = Column(Integer)
+    file_sha256 = Column(String(64))
     mime_type = Column(String(100))
     status = Column(Enum(SubmissionStatus), default=SubmissionStatus.DRAFT)
     submission_date = Column(DateTime(timezone=True))
@@ -42,6 +43,13 @@ class Submission(Base):
     student = relationship("Student", back_populates="submissions")
     reviewer = relationship("User")
     
+    __table_args__ = (
+        Index("ix_submissions_student_number_id", "student_number", "id"),
+        Index("ix_submissions_status_id", "status", "id"),
+        Index("ix_submissions_type_status", "submission_type", "status"),
+        Index("ix_submissions_submission_date", "submission_date"),
+    )
+    
     def __repr__(self):
         return f"<Submission(student='{self.student_number}', type='{self.submission_type}', title='{self.title}')>"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -13,3 +13,13 @@ class Supervisor(Base):
     
     def __repr__(self):
         return f"<Supervisor(id={self.supervisor_id}, name='{self.supervisor_name}', department='{self.department}')>"
+
+# Trigram indexes for the ILIKE '%term%' searches in SupervisorService; PostgreSQL only
+Index(
+    "ix_supervisors_supervisor_name_trgm", Supervisor.supervisor_name,
+    postgresql_using="gin", postgresql_ops={"supervisor_name": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_supervisors_email_trgm", Supervisor.email,
+    postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 import enum
@@ -23,6 +23,11 @@ class Timeline(Base):
 
     student = relationship("Student", back_populates="timelines")
     
+    __table_args__ = (
+        Index("ix_timelines_student_number_id", "student_number", "id"),
+        Index("ix_timelines_status_planned_date", "status", "planned_date"),
+    )
+    
     def __repr__(self):
         return f"<Timeline(student='{self.student_number}', stage='{self.stage}', milestone='{self.milestone_name}')>"
 
@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, ForeignKey, Enum
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+from datetime import datetime
+import enum
+
+class UploadSessionStatus(enum.Enum):
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+
+class UploadSession(Base):
+    """A resumable upload in progress; its parts are recorded in upload_session_parts"""
+    __tablename__ = "upload_sessions"
+    
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    submission_id = Column(Integer, ForeignKey("submissions.id"), nullable=False, index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    file_name = Column(String(200), nullable=False)
+    mime_type = Column(String(100))
+    total_size = Column(BigInteger)  # declared by the client, checked on completion
+    reserved_bytes = Column(BigInteger, nullable=False, default=0, server_default="0")  # stored parts plus parts in flight
+    status = Column(Enum(UploadSessionStatus), nullable=False, default=UploadSessionStatus.ACTIVE)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    submission = relationship("Submission")
+    
+    def __repr__(self):
+        return f"<UploadSession(id={self.id}, submission_id={self.submission_id}, status='{self.status}')>"
+
+class UploadSessionPart(Base):
+    """One received part, stored as UPLOAD_DIR/.parts/<upload_id>/<file_name>"""
+    __tablename__ = "upload_session_parts"
+    
+    upload_id = Column(Integer, ForeignKey("upload_sessions.id"), primary_key=True)
+    part_number = Column(Integer, primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    file_name = Column(String(64), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<UploadSessionPart(upload_id={self.upload_id}, part_number={self.part_number}, size={self.size})>"
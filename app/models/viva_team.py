@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Boolean, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -45,6 +45,11 @@ class VivaTeam(Base):
     proposer = relationship("User", foreign_keys=[proposed_by])
     approver = relationship("User", foreign_keys=[approved_by])
     
+    __table_args__ = (
+        Index("ix_viva_teams_student_number_id", "student_number", "id"),
+        Index("ix_viva_teams_status_id", "status", "id"),
+    )
+    
     def __repr__(self):
         return f"<VivaTeam(student='{self.student_number}', stage='{self.stage}', status='{self.status}')>"
 
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, model_validator
 from app.models.notification import NotificationType, NotificationStatus, NotificationPriority
 from typing import Optional, Dict, Any
 from datetime import datetime
+import json
 
 class NotificationBase(BaseModel):
     title: str
@@ -42,6 +43,17 @@ class NotificationInDB(NotificationBase):
     
     class Config:
         from_attributes = True
+    
+    @model_validator(mode="before")
+    @classmethod
+    def load_extra_data(cls, data: Any) -> Any:
+        # On ORM rows `metadata` is SQLAlchemy's declarative MetaData; the
+        # notification's own metadata is stored as JSON in extra_data
+        if hasattr(data, "extra_data"):
+            values = {field: getattr(data, field, None) for field in cls.model_fields if field != "metadata"}
+            values["metadata"] = json.loads(data.extra_data) if data.extra_data else None
+            return values
+        return data
 
 class Notification(NotificationInDB):
     pass
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Optional
+from enum import Enum
+
+class TypeaheadKind(str, Enum):
+    STUDENT = "student"
+    SUPERVISOR = "supervisor"
+    USER = "user"
+
+class TypeaheadMatch(BaseModel):
+    kind: TypeaheadKind
+    id: str
+    label: str
+    detail: Optional[str] = None
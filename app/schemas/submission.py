@@ -39,6 +39,7 @@ class SubmissionInDB(SubmissionBase):
     file_path: Optional[str] = None
     file_name: Optional[str] = None
     file_size: Optional[int] = None
+    file_sha256: Optional[str] = None
     mime_type: Optional[str] = None
     status: SubmissionStatusEnum = SubmissionStatusEnum.DRAFT
     submission_date: Optional[datetime] = None
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+
+class UploadSessionStatusEnum(str, Enum):
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+
+class UploadSessionCreate(BaseModel):
+    file_name: str
+    mime_type: Optional[str] = None
+    total_size: Optional[int] = Field(None, ge=0)
+
+class UploadPart(BaseModel):
+    part_number: int
+    size: int
+
+class UploadSession(BaseModel):
+    id: int
+    submission_id: int
+    file_name: str
+    mime_type: Optional[str] = None
+    total_size: Optional[int] = None
+    status: UploadSessionStatusEnum
+    received_bytes: int = 0
+    parts: List[UploadPart] = []
+    created_at: datetime
+    updated_at: datetime
@@ -28,7 +28,6 @@ class AppraisalService:
         appraisal = Appraisal(**appraisal_data.dict())
         db.add(appraisal)
         db.commit()
-        db.refresh(appraisal)
         return AppraisalSchema.from_orm(appraisal)
     
     @staticmethod
@@ -62,7 +61,6 @@ class AppraisalService:
         appraisal.status = AppraisalStatus.STUDENT_SUBMITTED
         
         db.commit()
-        db.refresh(appraisal)
         return AppraisalSchema.from_orm(appraisal)
     
     @staticmethod
@@ -83,7 +81,6 @@ class AppraisalService:
         appraisal.status = AppraisalStatus.DOS_SUBMITTED
         
         db.commit()
-        db.refresh(appraisal)
         return AppraisalSchema.from_orm(appraisal)
     
     @staticmethod
@@ -101,7 +98,6 @@ class AppraisalService:
         appraisal.approved_by = current_user.username
         
         db.commit()
-        db.refresh(appraisal)
         return AppraisalSchema.from_orm(appraisal)
     
     @staticmethod
@@ -130,7 +126,6 @@ class AppraisalService:
             appraisal.admin_comments = review_comments
         
         db.commit()
-        db.refresh(appraisal)
         return AppraisalSchema.from_orm(appraisal)
 
     # Legacy methods for backward compatibility - can be removed if not used elsewhere
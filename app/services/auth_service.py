@@ -1,25 +1,47 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
 from app.models.user import User 
 from app.schemas.user import User as UserSchema
 from app.schemas.auth import RegisterRequest
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import (
+    verify_password_async,
+    verify_and_update_password_async,
+    get_password_hash_async,
+    create_access_token
+)
 from datetime import timedelta
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.pagination import Page, keyset_paginate
 
 class AuthService:
+    # The password methods are async: their queries run on the threadpool and
+    # bcrypt is awaited on the hashing pool, so no request thread waits on it
+    
     @staticmethod
-    def authenticate_user(db: Session, username: str, password: str):
+    async def authenticate_user(db: Session, username: str, password: str):
         """Authenticate a user with username and password"""
-        user = db.query(User).filter(User.username == username).first()
+        user = await run_in_threadpool(AuthService.get_user_by_username, db, username)
         if not user:
             return False
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not verified:
             return False
+        if new_hash:
+            # Stored hash uses an outdated cost factor; upgrade it transparently
+            await run_in_threadpool(AuthService._store_password_hash, db, user, new_hash)
         return user
     
     @staticmethod
-    def create_user(db: Session, user_data: RegisterRequest) -> UserSchema:
+    async def create_user(db: Session, user_data: RegisterRequest) -> UserSchema:
         """Create a new user"""
+        await run_in_threadpool(AuthService._check_registration_available, db, user_data)
+        hashed_password = await get_password_hash_async(user_data.password)
+        return await run_in_threadpool(AuthService._insert_user, db, user_data, hashed_password)
+    
+    @staticmethod
+    def _check_registration_available(db: Session, user_data: RegisterRequest) -> None:
         # Check if username already exists
         if db.query(User).filter(User.username == user_data.username).first():
             raise ValueError("Username already registered")
@@ -27,8 +49,9 @@ class AuthService:
         # Check if email already exists
         if db.query(User).filter(User.email == user_data.email).first():
             raise ValueError("Email already registered")
-        
-        hashed_password = get_password_hash(user_data.password)
+    
+    @staticmethod
+    def _insert_user(db: Session, user_data: RegisterRequest, hashed_password: str) -> UserSchema:
         db_user = User(
             username=user_data.username,
             email=user_data.email,
@@ -40,7 +63,6 @@ class AuthService:
         )
         db.add(db_user)
         db.commit()
-        db.refresh(db_user)
         return UserSchema.from_orm(db_user)
     
     @staticmethod
@@ -82,13 +104,15 @@ class AuthService:
             if db.query(User).filter(User.email == user_data['email']).first():
                 raise ValueError("Email already exists")
         
+        previous_username = user.username
+        
         # Update user fields
         for field, value in user_data.items():
             if hasattr(user, field) and value is not None:
                 setattr(user, field, value)
         
         db.commit()
-        db.refresh(user)
+        principal_cache.invalidate_user(previous_username, user.username)
         return UserSchema.from_orm(user)
     
     @staticmethod
@@ -114,23 +138,25 @@ class AuthService:
             if db.query(User).filter(User.email == user_data['email']).first():
                 raise ValueError("Email already exists")
         
+        previous_username = user.username
+        
         # Update user fields (including role for admin)
         for field, value in user_data.items():
             if hasattr(user, field) and value is not None:
                 setattr(user, field, value)
         
         db.commit()
-        db.refresh(user)
+        principal_cache.invalidate_user(previous_username, user.username)
         return UserSchema.from_orm(user)
     
     @staticmethod
-    def get_all_users(db: Session, admin_user: User, skip: int = 0, limit: int = 100) -> list:
-        """Get all users (admin only)"""
+    def get_all_users(db: Session, admin_user: User, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> Page:
+        """Get a page of users ordered by id (admin only)"""
         if admin_user.role != "system_admin":
             raise ValueError("Only system administrators can view all users")
         
-        users = db.query(User).offset(skip).limit(limit).all()
-        return [UserSchema.from_orm(user) for user in users]
+        page = keyset_paginate(db.query(User), [User.id], limit, cursor, skip=skip)
+        return Page([UserSchema.from_orm(user) for user in page.items], page.next_cursor)
     
     @staticmethod
     def get_user_by_id(db: Session, user_id: int, admin_user: User) -> UserSchema:
@@ -145,32 +171,42 @@ class AuthService:
         return UserSchema.from_orm(user)
     
     @staticmethod
-    def change_password(db: Session, user_id: int, current_password: str, new_password: str) -> bool:
+    async def change_password(db: Session, user_id: int, current_password: str, new_password: str) -> bool:
         """Change user's password"""
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise ValueError("User not found")
+        user = await run_in_threadpool(AuthService._get_user, db, user_id)
         
         # Verify current password
-        if not verify_password(current_password, user.hashed_password):
+        if not await verify_password_async(current_password, user.hashed_password):
             raise ValueError("Current password is incorrect")
         
         # Hash new password and update
-        user.hashed_password = get_password_hash(new_password)
-        db.commit()
+        hashed_password = await get_password_hash_async(new_password)
+        await run_in_threadpool(AuthService._store_password_hash, db, user, hashed_password)
         return True
     
     @staticmethod
-    def admin_reset_password(db: Session, user_id: int, new_password: str, admin_user: User) -> bool:
+    async def admin_reset_password(db: Session, user_id: int, new_password: str, admin_user: User) -> bool:
         """Admin-only method to reset any user's password"""
         if admin_user.role != "system_admin":
             raise ValueError("Only system administrators can reset user passwords")
         
+        user = await run_in_threadpool(AuthService._get_user, db, user_id)
+        
+        # Hash new password and update (no current password verification needed for admin)
+        hashed_password = await get_password_hash_async(new_password)
+        await run_in_threadpool(AuthService._store_password_hash, db, user, hashed_password)
+        return True
+    
+    @staticmethod
+    def _get_user(db: Session, user_id: int) -> User:
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             raise ValueError("User not found")
-        
-        # Hash new password and update (no current password verification needed for admin)
-        user.hashed_password = get_password_hash(new_password)
+        return user
+    
+    @staticmethod
+    def _store_password_hash(db: Session, user: User, hashed_password: str) -> None:
+        user.hashed_password = hashed_password
+        username = user.username
         db.commit()
-        return True
+        principal_cache.invalidate_user(username)
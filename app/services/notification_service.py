@@ -1,7 +1,8 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-import smtplib
 import json
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -16,6 +17,9 @@ from app.schemas.notification import (
     NotificationTemplate
 )
 from app.core.config import settings
+from app.core.pagination import Page, keyset_paginate, keyset_paginate_async
+from app.core.serialization import validate_rows
+from app.core.smtp_pool import smtp_pool
 import logging
 
 logger = logging.getLogger(__name__)
@@ -95,19 +99,24 @@ class NotificationService:
             recipient_email=notification_data.recipient_email,
             recipient_phone=notification_data.recipient_phone,
             scheduled_at=notification_data.scheduled_at or datetime.utcnow(),
-            extra_data=extra_data_str
+            extra_data=extra_data_str,
+            **NotificationService._initial_state(notification_data.type)
         )
         
+        # Delivery is left to the notification worker, which claims PENDING rows
         db.add(db_notification)
         db.commit()
-        db.refresh(db_notification)
-        
-        # Try to send immediately if it's scheduled for now or past
-        if db_notification.scheduled_at <= datetime.utcnow():
-            NotificationService._send_notification(db, db_notification)
         
         return NotificationSchema.from_orm(db_notification)
     
+    @staticmethod
+    def _initial_state(notification_type: NotificationType) -> Dict[str, Any]:
+        """Status columns for a new row: in-app notifications have nothing to send, so they start DELIVERED"""
+        if notification_type == NotificationType.IN_APP:
+            now = datetime.utcnow()
+            return {"status": NotificationStatus.DELIVERED, "sent_at": now, "delivered_at": now}
+        return {"status": NotificationStatus.PENDING}
+    
     @staticmethod
     def create_from_template(
         db: Session, 
@@ -151,20 +160,26 @@ class NotificationService:
         current_user: User,
         skip: int = 0, 
         limit: int = 100,
-        status: Optional[NotificationStatus] = None
-    ) -> List[NotificationSchema]:
-        """Get notifications for a user"""
+        status: Optional[NotificationStatus] = None,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """Get a page of a user's notifications, newest first"""
+        query = db.query(Notification).filter(*NotificationService.inbox_filters(user_id, current_user, status))
+        page = keyset_paginate(
+            query, [Notification.created_at, Notification.id], limit, cursor, descending=True, skip=skip
+        )
+        return Page(validate_rows(NotificationSchema, page.items), page.next_cursor)
+    
+    @staticmethod
+    def inbox_filters(user_id: int, current_user: User, status: Optional[NotificationStatus] = None) -> list:
         # Users can only see their own notifications, admins can see anyone's
         if current_user.role not in ["system_admin"] and current_user.id != user_id:
             raise HTTPException(status_code=403, detail="Not authorized to view these notifications")
         
-        query = db.query(Notification).filter(Notification.user_id == user_id)
-        
+        criteria = [Notification.user_id == user_id]
         if status:
-            query = query.filter(Notification.status == status)
-        
-        notifications = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
-        return [NotificationSchema.from_orm(notification) for notification in notifications]
+            criteria.append(Notification.status == status)
+        return criteria
     
     @staticmethod
     def mark_as_read(db: Session, notification_id: int, current_user: User) -> NotificationSchema:
@@ -180,34 +195,80 @@ class NotificationService:
         notification.status = NotificationStatus.DELIVERED
         notification.delivered_at = datetime.utcnow()
         db.commit()
-        db.refresh(notification)
         
         return NotificationSchema.from_orm(notification)
     
     @staticmethod
     def retry_failed_notifications(db: Session, current_user: User) -> Dict[str, int]:
-        """Retry sending failed notifications (admin only)"""
+        """Re-queue failed notifications for the worker (admin only)"""
         if current_user.role != "system_admin":
             raise HTTPException(status_code=403, detail="Only system administrators can retry notifications")
         
-        failed_notifications = db.query(Notification).filter(
+        requeued = db.query(Notification).filter(
             Notification.status == NotificationStatus.FAILED,
             Notification.retry_count < Notification.max_retries
-        ).all()
+        ).update({
+            Notification.status: NotificationStatus.PENDING,
+            Notification.scheduled_at: datetime.utcnow()
+        }, synchronize_session=False)
+        db.commit()
+        
+        # Sending happens in the worker, so nothing has succeeded or failed yet
+        return {
+            "retried": requeued,
+            "successful": 0,
+            "failed": 0,
+            "queued": requeued
+        }
+    
+    @staticmethod
+    def claim_pending_notifications(db: Session, batch_size: int) -> List[Notification]:
+        """Lock a batch of due PENDING notifications for delivery.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers never claim
+        the same rows; the locks are held until the caller commits.
+        """
+        return db.query(Notification).filter(
+            Notification.status == NotificationStatus.PENDING,
+            Notification.scheduled_at <= datetime.utcnow()
+        ).order_by(
+            Notification.scheduled_at, Notification.id
+        ).limit(batch_size).with_for_update(skip_locked=True).all()
+    
+    @staticmethod
+    def deliver_pending_notifications(db: Session, batch_size: int = None) -> Dict[str, int]:
+        """Claim one batch of due notifications, send them and record the outcome"""
+        batch_size = batch_size or settings.NOTIFICATION_WORKER_BATCH_SIZE
+        notifications = NotificationService.claim_pending_notifications(db, batch_size)
         
-        success_count = 0
-        failed_count = 0
+        # Emails in the batch share one SMTP session instead of a handshake each
+        emails = [n for n in notifications if n.type == NotificationType.EMAIL]
+        outcomes = list(zip(emails, NotificationService._send_email_batch(db, emails))) if emails else []
+        outcomes += [
+            (notification, NotificationService._send_notification(db, notification))
+            for notification in notifications if notification.type != NotificationType.EMAIL
+        ]
         
-        for notification in failed_notifications:
-            if NotificationService._send_notification(db, notification):
-                success_count += 1
+        sent = 0
+        failed = 0
+        for notification, delivered in outcomes:
+            if delivered:
+                sent += 1
             else:
-                failed_count += 1
+                failed += 1
+                if notification.status == NotificationStatus.PENDING:
+                    # Not sendable (e.g. unsupported type or missing configuration)
+                    notification.status = NotificationStatus.FAILED
+                    notification.error_message = notification.error_message or "Notification could not be delivered"
+                    notification.retry_count = (notification.retry_count or 0) + 1
+        
+        # One commit per batch records every outcome and releases the row locks
+        db.commit()
         
         return {
-            "retried": len(failed_notifications),
-            "successful": success_count,
-            "failed": failed_count
+            "claimed": len(notifications),
+            "sent": sent,
+            "failed": failed
         }
     
     @staticmethod
@@ -216,33 +277,52 @@ class NotificationService:
         bulk_data: BulkNotificationCreate, 
         current_user: User
     ) -> List[NotificationSchema]:
-        """Create notifications for multiple users"""
+        """Create notifications for multiple users.
+
+        Resolves all recipients in one query and inserts every row in a single
+        multi-row INSERT ... RETURNING; the rows are queued as PENDING for the
+        notification worker (in-app ones are DELIVERED at once). Unknown user
+        ids are skipped.
+        """
         if current_user.role not in ["system_admin", "academic_admin", "gbos_admin"]:
             raise HTTPException(status_code=403, detail="Not authorized to send bulk notifications")
         
-        notifications = []
-        for user_id in bulk_data.user_ids:
-            try:
-                notification_data = NotificationCreate(
-                    user_id=user_id,
-                    type=bulk_data.type,
-                    title=bulk_data.title,
-                    message=bulk_data.message,
-                    action_type=bulk_data.action_type,
-                    priority=bulk_data.priority,
-                    scheduled_at=bulk_data.scheduled_at
-                )
-                notification = NotificationService.create_notification(db, notification_data, current_user)
-                notifications.append(notification)
-            except Exception as e:
-                logger.error(f"Failed to create notification for user {user_id}: {e}")
-                continue
+        user_ids = list(dict.fromkeys(bulk_data.user_ids))
+        if not user_ids:
+            return []
+        
+        emails = dict(db.query(User.id, User.email).filter(User.id.in_(user_ids)).all())
+        missing = [user_id for user_id in user_ids if user_id not in emails]
+        if missing:
+            logger.error(f"Skipping bulk notification for unknown users: {missing}")
         
-        return notifications
+        scheduled_at = bulk_data.scheduled_at or datetime.utcnow()
+        initial_state = NotificationService._initial_state(bulk_data.type)
+        rows = [
+            {
+                "user_id": user_id,
+                "type": bulk_data.type,
+                "title": bulk_data.title,
+                "message": bulk_data.message,
+                "action_type": bulk_data.action_type,
+                "priority": bulk_data.priority,
+                "recipient_email": emails[user_id],
+                "scheduled_at": scheduled_at,
+                **initial_state,
+            }
+            for user_id in user_ids if user_id in emails
+        ]
+        if not rows:
+            return []
+        
+        notifications = db.scalars(insert(Notification).returning(Notification, sort_by_parameter_order=True), rows).all()
+        db.commit()
+        
+        return [NotificationSchema.from_orm(notification) for notification in notifications]
     
     @staticmethod
     def _send_notification(db: Session, notification: Notification) -> bool:
-        """Internal method to send notification"""
+        """Internal method to send notification; the caller commits the status change"""
         try:
             if notification.type == NotificationType.EMAIL:
                 return NotificationService._send_email(db, notification)
@@ -253,7 +333,6 @@ class NotificationService:
                 notification.status = NotificationStatus.DELIVERED
                 notification.sent_at = datetime.utcnow()
                 notification.delivered_at = datetime.utcnow()
-                db.commit()
                 return True
             else:
                 logger.warning(f"Unsupported notification type: {notification.type}")
@@ -264,32 +343,50 @@ class NotificationService:
             notification.status = NotificationStatus.FAILED
             notification.error_message = str(e)
             notification.retry_count += 1
-            db.commit()
             return False
     
     @staticmethod
     def _send_email(db: Session, notification: Notification) -> bool:
         """Send email notification"""
+        return NotificationService._send_email_batch(db, [notification])[0]
+    
+    @staticmethod
+    def _send_email_batch(db: Session, notifications: List[Notification]) -> List[bool]:
+        """Send email notifications over one pooled SMTP session"""
+        if not smtp_pool.configured:
+            logger.warning("Email configuration not set up")
+            return [False] * len(notifications)
+        
+        messages = [NotificationService._build_email(notification) for notification in notifications]
         try:
-            # Email configuration (should be in settings)
-            smtp_server = getattr(settings, 'SMTP_SERVER', 'smtp.gmail.com')
-            smtp_port = getattr(settings, 'SMTP_PORT', 587)
-            smtp_username = getattr(settings, 'SMTP_USERNAME', '')
-            smtp_password = getattr(settings, 'SMTP_PASSWORD', '')
-            from_email = getattr(settings, 'FROM_EMAIL', smtp_username)
-            
-            if not smtp_username or not smtp_password:
-                logger.warning("Email configuration not set up")
-                return False
-            
-            # Create email
-            msg = MIMEMultipart()
-            msg['From'] = from_email
-            msg['To'] = notification.recipient_email
-            msg['Subject'] = notification.title
-            
-            # Email body
-            body = f"""
+            errors = smtp_pool.send_batch(messages)
+        except Exception as e:
+            logger.error(f"Failed to send {len(notifications)} email notifications: {e}")
+            errors = [e] * len(notifications)
+        
+        results = []
+        for notification, error in zip(notifications, errors):
+            if error is None:
+                notification.status = NotificationStatus.SENT
+                notification.sent_at = datetime.utcnow()
+                logger.info(f"Email notification {notification.id} sent successfully")
+            else:
+                logger.error(f"Failed to send email notification {notification.id}: {error}")
+                notification.status = NotificationStatus.FAILED
+                notification.error_message = str(error)
+                notification.retry_count = (notification.retry_count or 0) + 1
+            results.append(error is None)
+        return results
+    
+    @staticmethod
+    def _build_email(notification: Notification) -> MIMEMultipart:
+        msg = MIMEMultipart()
+        msg['From'] = settings.FROM_EMAIL or smtp_pool.username
+        msg['To'] = notification.recipient_email
+        msg['Subject'] = notification.title
+        
+        # Email body
+        body = f"""
             {notification.message}
             
             ---
@@ -297,26 +394,9 @@ class NotificationService:
             Action Type: {notification.action_type}
             Sent: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
             """
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(smtp_username, smtp_password)
-                server.send_message(msg)
-            
-            # Update notification status
-            notification.status = NotificationStatus.SENT
-            notification.sent_at = datetime.utcnow()
-            db.commit()
-            
-            logger.info(f"Email notification {notification.id} sent successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send email notification {notification.id}: {e}")
-            raise
+        
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
     
     @staticmethod
     def _send_sms(db: Session, notification: Notification) -> bool:
@@ -329,7 +409,6 @@ class NotificationService:
             # For now, just mark as sent
             notification.status = NotificationStatus.SENT
             notification.sent_at = datetime.utcnow()
-            db.commit()
             
             return True
             
@@ -348,4 +427,24 @@ class NotificationService:
             matches = re.findall(r'\{([^}]+)\}', template)
             variables.update(matches)
         
-        return list(variables) 
\ No newline at end of file
+        return list(variables) 
+
+
+class AsyncNotificationService:
+    """Read paths of NotificationService on an AsyncSession"""
+    
+    @staticmethod
+    async def get_user_notifications(
+        db: AsyncSession,
+        user_id: int,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[NotificationStatus] = None,
+        cursor: Optional[str] = None
+    ) -> Page:
+        statement = select(Notification).where(*NotificationService.inbox_filters(user_id, current_user, status))
+        page = await keyset_paginate_async(
+            db, statement, [Notification.created_at, Notification.id], limit, cursor, descending=True, skip=skip
+        )
+        return Page(validate_rows(NotificationSchema, page.items), page.next_cursor)
@@ -1,9 +1,10 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional
 from datetime import date, datetime
 from fastapi import HTTPException
 from app.models.registration import Registration
 from app.models.user import User
+from app.core.pagination import Page, keyset_paginate
 from app.schemas.registration import RegistrationCreate, RegistrationUpdate, Registration as RegistrationSchema
 
 class RegistrationService:
@@ -13,13 +14,13 @@ class RegistrationService:
         db_registration = Registration(**registration.dict())
         db.add(db_registration)
         db.commit()
-        db.refresh(db_registration)
         return RegistrationSchema.from_orm(db_registration)
     
     @staticmethod
     def get_registrations(db: Session, current_user: User, skip: int = 0, limit: int = 100,
-                         student_number: Optional[str] = None, status: Optional[str] = None) -> List[RegistrationSchema]:
-        """Get registrations with filtering and authorization"""
+                         student_number: Optional[str] = None, status: Optional[str] = None,
+                         cursor: Optional[str] = None) -> Page:
+        """Get a page of registrations with filtering and authorization"""
         query = db.query(Registration)
 
         if student_number:
@@ -32,8 +33,8 @@ class RegistrationService:
         if current_user.role == "student":
             query = query.filter(Registration.student_number == current_user.username)
         
-        registrations = query.offset(skip).limit(limit).all()
-        return [RegistrationSchema.from_orm(registration) for registration in registrations]
+        page = keyset_paginate(query, [Registration.registration_id], limit, cursor, skip=skip)
+        return Page([RegistrationSchema.from_orm(registration) for registration in page.items], page.next_cursor)
     
     @staticmethod
     def get_registration_by_id(db: Session, registration_id: int, current_user: User) -> RegistrationSchema:
@@ -72,7 +73,6 @@ class RegistrationService:
             setattr(db_registration, field, value)
         
         db.commit()
-        db.refresh(db_registration)
         return RegistrationSchema.from_orm(db_registration)
     
     @staticmethod
@@ -86,7 +86,6 @@ class RegistrationService:
         registration.extension_period = extension_days
         registration.extension_reason = reason
         db.commit()
-        db.refresh(registration)
         return RegistrationSchema.from_orm(registration)
     
     @staticmethod
@@ -104,5 +103,4 @@ class RegistrationService:
             registration.due_date = registration.due_date + timedelta(days=registration.extension_period)
         
         db.commit()
-        db.refresh(registration)
         return RegistrationSchema.from_orm(registration)
@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import List, Dict, Any
+from sqlalchemy import func, and_, select
+from typing import List, Dict, Any, Iterator, Tuple
 from datetime import datetime, date, timedelta
+import csv
+import io
+import zlib
 from app.models.registration import Registration
 from app.models.submission import Submission, SubmissionStatus, SubmissionType
 from app.models.timeline import Timeline, TimelineStage
@@ -10,6 +13,11 @@ from app.models.viva_team import VivaTeam, VivaStatus
 from app.models.student import Student
 
 class ReportService:
+    # Rows fetched per round trip / bytes buffered per chunk when streaming exports
+    EXPORT_YIELD_PER = 1000
+    EXPORT_CHUNK_SIZE = 64 * 1024
+    STUDENT_EXPORT_HEADER = ["student_number", "programme", "status", "supervisor"]
+
     @staticmethod
     def get_student_overview_report(db: Session) -> Dict[str, Any]:
         """Generate student overview report"""
@@ -71,7 +79,13 @@ class ReportService:
     @staticmethod
     def get_submission_analytics(db: Session, start_date: date = None, end_date: date = None) -> Dict[str, Any]:
         """Generate submission analytics report"""
-        query = db.query(Submission)
+        # One scan grouped by (type, status); the per-type and per-status
+        # breakdowns are rolled up from those few groups
+        query = db.query(
+            Submission.submission_type,
+            Submission.status,
+            func.count(Submission.id).label('count')
+        )
         
         if start_date and end_date:
             query = query.filter(
@@ -81,18 +95,18 @@ class ReportService:
                 )
             )
         
-        submissions = query.all()
-        total_submissions = len(submissions)
+        groups = query.group_by(Submission.submission_type, Submission.status).all()
+        total_submissions = sum(group.count for group in groups)
         
         # Group by type
         by_type = {}
-        for submission in submissions:
-            by_type[submission.submission_type] = by_type.get(submission.submission_type, 0) + 1
+        for group in groups:
+            by_type[group.submission_type] = by_type.get(group.submission_type, 0) + group.count
         
         # Group by status
         by_status = {}
-        for submission in submissions:
-            by_status[submission.status] = by_status.get(submission.status, 0) + 1
+        for group in groups:
+            by_status[group.status] = by_status.get(group.status, 0) + group.count
         
         return {
             "total_submissions": total_submissions,
@@ -148,22 +162,27 @@ class ReportService:
     @staticmethod
     def get_appraisal_completion_rates(db: Session, academic_year: str = None) -> Dict[str, Any]:
         """Generate appraisal completion rates report"""
-        query = db.query(Appraisal)
+        # One scan grouped by (status, period); the large Text columns are never read
+        query = db.query(
+            Appraisal.status,
+            Appraisal.appraisal_period,
+            func.count(Appraisal.id).label('count')
+        )
         if academic_year:
             query = query.filter(Appraisal.academic_year == academic_year)
         
-        appraisals = query.all()
-        total = len(appraisals)
+        groups = query.group_by(Appraisal.status, Appraisal.appraisal_period).all()
+        total = sum(group.count for group in groups)
         
         # Group by status
         by_status = {}
-        for appraisal in appraisals:
-            by_status[appraisal.status] = by_status.get(appraisal.status, 0) + 1
+        for group in groups:
+            by_status[group.status] = by_status.get(group.status, 0) + group.count
         
         # Group by period
         by_period = {}
-        for appraisal in appraisals:
-            by_period[appraisal.appraisal_period] = by_period.get(appraisal.appraisal_period, 0) + 1
+        for group in groups:
+            by_period[group.appraisal_period] = by_period.get(group.appraisal_period, 0) + group.count
         
         completed = by_status.get(AppraisalStatus.APPROVED, 0)
         completion_rate = (completed / total * 100) if total > 0 else 0
@@ -204,38 +223,51 @@ class ReportService:
     
     @staticmethod
     def get_department_dashboard(db: Session) -> Dict[str, Any]:
-        """Generate department dashboard data"""
-        # Active students
-        active_students = db.query(Registration).filter(Registration.registration_status.in_(["active", "enrolled"])).count()
-        
-        # Pending submissions
-        pending_submissions = db.query(Submission).filter(
-            Submission.status.in_([SubmissionStatus.SUBMITTED, SubmissionStatus.UNDER_REVIEW])
-        ).count()
-        
-        # Overdue milestones
+        """Generate department dashboard data.
+
+        Every KPI is a scalar subquery of one SELECT, so the dashboard costs a
+        single round trip instead of one COUNT query per table.
+        """
         today = date.today()
-        overdue_milestones = db.query(Timeline).filter(
-            and_(
+
+        def count_where(model, *criteria):
+            return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+        kpis = db.execute(select(
+            # Active students
+            count_where(
+                Registration,
+                Registration.registration_status.in_(["active", "enrolled"])
+            ).label("active_students"),
+            # Pending submissions
+            count_where(
+                Submission,
+                Submission.status.in_([SubmissionStatus.SUBMITTED, SubmissionStatus.UNDER_REVIEW])
+            ).label("pending_submissions"),
+            # Overdue milestones
+            count_where(
+                Timeline,
                 Timeline.status == "pending",
                 Timeline.planned_date < today
-            )
-        ).count()
-        
-        # Pending appraisals
-        pending_appraisals = db.query(Appraisal).filter(
-            Appraisal.status.in_([AppraisalStatus.PENDING, AppraisalStatus.STUDENT_SUBMITTED])
-        ).count()
-        
-        # Pending viva teams
-        pending_viva_teams = db.query(VivaTeam).filter(VivaTeam.status == VivaStatus.PROPOSED).count()
-        
+            ).label("overdue_milestones"),
+            # Pending appraisals
+            count_where(
+                Appraisal,
+                Appraisal.status.in_([AppraisalStatus.PENDING, AppraisalStatus.STUDENT_SUBMITTED])
+            ).label("pending_appraisals"),
+            # Pending viva teams
+            count_where(
+                VivaTeam,
+                VivaTeam.status == VivaStatus.PROPOSED
+            ).label("pending_viva_teams")
+        )).one()
+
         return {
-            "active_students": active_students,
-            "pending_submissions": pending_submissions,
-            "overdue_milestones": overdue_milestones,
-            "pending_appraisals": pending_appraisals,
-            "pending_viva_teams": pending_viva_teams
+            "active_students": kpis.active_students,
+            "pending_submissions": kpis.pending_submissions,
+            "overdue_milestones": kpis.overdue_milestones,
+            "pending_appraisals": kpis.pending_appraisals,
+            "pending_viva_teams": kpis.pending_viva_teams
         }
     
     @staticmethod
@@ -314,3 +346,72 @@ class ReportService:
             "filters_applied": filters,
             "data": report_data
         }
+
+    @staticmethod
+    def iter_student_export_rows(db: Session, filters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Yield (student_number, programme, status) rows for the student export.
+
+        Only the exported columns are selected and rows are pulled through a
+        server-side cursor in batches, so no ORM objects are built and memory
+        stays flat regardless of cohort size.
+        """
+        query = db.query(
+            Registration.student_number,
+            Student.programme_of_study,
+            Registration.registration_status
+        ).join(Student, Registration.student_number == Student.student_number)
+
+        if filters.get("programme"):
+            query = query.filter(Student.programme_of_study == filters["programme"])
+
+        if filters.get("mode"):
+            query = query.filter(Student.mode == filters["mode"])
+
+        if filters.get("status"):
+            query = query.filter(Registration.registration_status == filters["status"])
+
+        if filters.get("cohort"):
+            query = query.filter(Student.cohort == filters["cohort"])
+
+        query = query.order_by(Registration.registration_id).execution_options(
+            stream_results=True,
+            yield_per=ReportService.EXPORT_YIELD_PER
+        )
+        for row in query:
+            yield row
+
+    @staticmethod
+    def stream_student_data_csv(db: Session, filters: Dict[str, Any] = None, compress: bool = False) -> Iterator[bytes]:
+        """Stream the student export as CSV chunks, optionally gzip-compressed.
+
+        The session is closed once the stream is exhausted because request-scoped
+        dependencies have already exited by the time the response body is sent.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        # wbits=31 produces a gzip container rather than a raw zlib stream
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+        def drain() -> bytes:
+            data = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            return compressor.compress(data) if compressor else data
+
+        try:
+            writer.writerow(ReportService.STUDENT_EXPORT_HEADER)
+            for student_number, programme, status in ReportService.iter_student_export_rows(db, filters or {}):
+                # Registrations carry no supervisor; the column is kept for compatibility
+                writer.writerow([student_number, programme or "Unknown", status or "Unknown", ""])
+                if buffer.tell() >= ReportService.EXPORT_CHUNK_SIZE:
+                    chunk = drain()
+                    if chunk:
+                        yield chunk
+
+            chunk = drain()
+            if compressor:
+                chunk += compressor.flush()
+            if chunk:
+                yield chunk
+        finally:
+            db.close()
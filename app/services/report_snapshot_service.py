@@ -0,0 +1,258 @@
+from contextlib import contextmanager
+from sqlalchemy import Select, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Dict, Any, Iterator, Optional, Callable
+from datetime import datetime
+import json
+import logging
+import threading
+from fastapi import HTTPException
+from app.models.report_snapshot import ReportSnapshot
+from app.services.report_service import ReportService
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock id taken by whichever process refreshes snapshots ("PGRS")
+REFRESH_LOCK_KEY = 0x50475253
+
+class ReportSnapshotService:
+    # Snapshot-backed reports: name -> compute function
+    REPORTS: Dict[str, Callable[..., Dict[str, Any]]] = {
+        "student-overview": ReportService.get_student_overview_report,
+        "supervisor-workload": ReportService.get_supervisor_workload_report,
+        "submission-analytics": ReportService.get_submission_analytics,
+        "timeline-compliance": ReportService.get_timeline_compliance_report,
+        "appraisal-completion": ReportService.get_appraisal_completion_rates,
+        "programme-statistics": ReportService.get_programme_statistics,
+        "department-dashboard": ReportService.get_department_dashboard,
+        "weekly-activity": ReportService.get_weekly_activity_report,
+    }
+
+    @staticmethod
+    def get_report(db: Session, report_name: str, params: Optional[Dict[str, Any]] = None, fresh: bool = False) -> Dict[str, Any]:
+        """Serve a report from its latest snapshot, recomputing when missing, too old or fresh is requested.
+
+        Only the default (parameterless) form of each report is snapshotted;
+        requests with parameters are computed live and not stored, so callers
+        cannot grow the table or the refresher's work.
+        """
+        params = ReportSnapshotService._normalise_params(params)
+        if params:
+            return ReportSnapshotService._with_metadata(ReportSnapshotService.compute_report(db, report_name, params), "live")
+        params_key = ""
+
+        snapshot = None
+        if not fresh:
+            snapshot = ReportSnapshotService.get_latest_snapshot(db, report_name, params_key)
+            if snapshot and ReportSnapshotService._age_seconds(snapshot) > settings.REPORT_SNAPSHOT_MAX_AGE_SECONDS:
+                snapshot = None
+
+        source = "snapshot"
+        if snapshot is None:
+            snapshot = ReportSnapshotService.refresh_report(db, report_name, params)
+            source = "live"
+
+        return ReportSnapshotService._with_metadata(snapshot, source)
+
+    @staticmethod
+    def get_latest_snapshot(db: Session, report_name: str, params_key: str = "") -> Optional[ReportSnapshot]:
+        """Latest snapshot for a report/parameter combination (single indexed read)"""
+        return db.scalar(ReportSnapshotService._latest_statement(report_name, params_key))
+
+    @staticmethod
+    def compute_report(db: Session, report_name: str, params: Optional[Dict[str, Any]] = None) -> ReportSnapshot:
+        """Compute a report from the raw tables as an unsaved snapshot"""
+        if report_name not in ReportSnapshotService.REPORTS:
+            raise HTTPException(status_code=404, detail=f"Unknown report: {report_name}")
+
+        compute = ReportSnapshotService.REPORTS[report_name]
+        params = ReportSnapshotService._normalise_params(params)
+        payload = compute(db, **params)
+        return ReportSnapshot(
+            report_name=report_name,
+            params_key=ReportSnapshotService._params_key(params),
+            payload=json.dumps(payload, default=str),
+            generated_at=datetime.utcnow()
+        )
+
+    @staticmethod
+    def refresh_report(db: Session, report_name: str, params: Optional[Dict[str, Any]] = None) -> ReportSnapshot:
+        """Recompute a report from the raw tables and store it as the latest snapshot"""
+        snapshot = ReportSnapshotService.compute_report(db, report_name, params)
+        params_key = snapshot.params_key
+        db.add(snapshot)
+        db.flush()
+
+        # Only the latest snapshot per report/parameter combination is kept
+        db.query(ReportSnapshot).filter(
+            ReportSnapshot.report_name == report_name,
+            ReportSnapshot.params_key == params_key,
+            ReportSnapshot.id != snapshot.id
+        ).delete(synchronize_session=False)
+
+        db.commit()
+        return snapshot
+
+    @staticmethod
+    def refresh_stale_snapshots(db: Session, max_age_seconds: Optional[int] = None) -> int:
+        """Incrementally refresh the default snapshot of every report older than max_age_seconds.
+
+        Rows for parameter combinations (stored before those were served
+        live) and for reports that no longer exist are pruned.
+        Returns the number of snapshots regenerated.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = settings.REPORT_SNAPSHOT_REFRESH_SECONDS
+
+        pruned = db.query(ReportSnapshot).filter(
+            (ReportSnapshot.params_key != "") | ReportSnapshot.report_name.notin_(ReportSnapshotService.REPORTS)
+        ).delete(synchronize_session=False)
+        if pruned:
+            db.commit()
+
+        refreshed = 0
+        for report_name in sorted(ReportSnapshotService.REPORTS):
+            snapshot = ReportSnapshotService.get_latest_snapshot(db, report_name)
+            if snapshot and ReportSnapshotService._age_seconds(snapshot) < max_age_seconds:
+                continue
+            try:
+                ReportSnapshotService.refresh_report(db, report_name)
+                refreshed += 1
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to refresh report snapshot {report_name}: {e}")
+
+        return refreshed
+
+    @staticmethod
+    def _latest_statement(report_name: str, params_key: str) -> Select:
+        return select(ReportSnapshot).where(
+            ReportSnapshot.report_name == report_name,
+            ReportSnapshot.params_key == params_key
+        ).order_by(ReportSnapshot.generated_at.desc()).limit(1)
+
+    @staticmethod
+    def _normalise_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Drop unset parameters so equivalent requests share a snapshot"""
+        return {key: value for key, value in (params or {}).items() if value is not None}
+
+    @staticmethod
+    def _params_key(params: Dict[str, Any]) -> str:
+        if not params:
+            return ""
+        return json.dumps(params, sort_keys=True, default=str)
+
+    @staticmethod
+    def _age_seconds(snapshot: ReportSnapshot) -> float:
+        return (datetime.utcnow() - snapshot.generated_at).total_seconds()
+
+    @staticmethod
+    def _with_metadata(snapshot: ReportSnapshot, source: str) -> Dict[str, Any]:
+        age_seconds = max(ReportSnapshotService._age_seconds(snapshot), 0.0)
+        report = json.loads(snapshot.payload)
+        report["snapshot"] = {
+            "generated_at": snapshot.generated_at.isoformat() + "Z",
+            "age_seconds": round(age_seconds, 3),
+            "stale": age_seconds > settings.REPORT_SNAPSHOT_REFRESH_SECONDS,
+            "source": source
+        }
+        return report
+
+class AsyncReportSnapshotService:
+    """ReportSnapshotService.get_report on an AsyncSession"""
+
+    @staticmethod
+    async def get_report(db: AsyncSession, report_name: str, params: Optional[Dict[str, Any]] = None,
+                         fresh: bool = False) -> Dict[str, Any]:
+        params = ReportSnapshotService._normalise_params(params)
+        if params:
+            snapshot = await db.run_sync(ReportSnapshotService.compute_report, report_name, params)
+            return ReportSnapshotService._with_metadata(snapshot, "live")
+        params_key = ""
+
+        snapshot = None
+        if not fresh:
+            snapshot = await db.scalar(ReportSnapshotService._latest_statement(report_name, params_key))
+            if snapshot and ReportSnapshotService._age_seconds(snapshot) > settings.REPORT_SNAPSHOT_MAX_AGE_SECONDS:
+                snapshot = None
+
+        source = "snapshot"
+        if snapshot is None:
+            # Recomputing reuses the sync report queries, run on this session's async connection
+            snapshot = await db.run_sync(ReportSnapshotService.refresh_report, report_name, params)
+            source = "live"
+
+        return ReportSnapshotService._with_metadata(snapshot, source)
+
+class ReportSnapshotRefresher:
+    """Background thread that periodically refreshes stale report snapshots"""
+
+    def __init__(self, session_factory: Callable[[], Session], interval_seconds: int):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="report-snapshot-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh_once(self) -> int:
+        """Refresh stale snapshots unless another process is already doing so"""
+        db = self.session_factory()
+        try:
+            with self._refresh_lock(db.get_bind()) as acquired:
+                if not acquired:
+                    return 0
+                return ReportSnapshotService.refresh_stale_snapshots(db, self.interval_seconds)
+        finally:
+            db.close()
+
+    @staticmethod
+    @contextmanager
+    def _refresh_lock(bind: Engine) -> Iterator[bool]:
+        """Session-level advisory lock so one gunicorn worker refreshes at a time.
+
+        Held on its own connection because the refresh commits (and may change
+        connection) once per report. Other databases have no advisory locks;
+        they are single-process development setups.
+        """
+        if bind.dialect.name != "postgresql":
+            yield True
+            return
+        with bind.connect() as connection:
+            acquired = connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": REFRESH_LOCK_KEY})
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": REFRESH_LOCK_KEY})
+
+    def _run(self) -> None:
+        # Wait first: requests populate snapshots on demand right after startup
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                refreshed = self.refresh_once()
+                if refreshed:
+                    logger.info(f"Refreshed {refreshed} report snapshots")
+            except Exception as e:
+                logger.error(f"Report snapshot refresh failed: {e}")
+
+if __name__ == "__main__":
+    # One-off refresh, e.g. from cron: python -m app.services.report_snapshot_service
+    from app.db.session import SessionLocal
+    logging.basicConfig(level=logging.INFO)
+    refreshed = ReportSnapshotRefresher(SessionLocal, settings.REPORT_SNAPSHOT_REFRESH_SECONDS).refresh_once()
+    logger.info(f"Refreshed {refreshed} report snapshots")
@@ -1,16 +1,49 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from fastapi import HTTPException
 from app.models.student import Student
 from app.models.registration import Registration
+from app.core.pagination import (
+    Page, keyset_paginate, keyset_paginate_async, stream_json_array, stream_json_array_async
+)
+from app.core.search import contains_any, match_rank
+from app.core.serialization import schema_columns, validate_rows
 from app.schemas.student import StudentCreate, StudentUpdate, Student as StudentSchema
 
 class StudentService:
+    SEARCH_COLUMNS = [Student.full_name, Student.student_number]
+    RESPONSE_COLUMNS = schema_columns(Student, StudentSchema)
+    
     @staticmethod
-    def get_students(db: Session, skip: int = 0, limit: int = 100) -> List[StudentSchema]:
-        """Get list of students with pagination"""
-        students = db.query(Student).offset(skip).limit(limit).all()
-        return [StudentSchema.from_orm(student) for student in students]
+    def get_students(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                     with_total: bool = False) -> Page:
+        """Get a page of students ordered by student number"""
+        return StudentService._page(StudentService.students_query(db), limit, cursor, skip, with_total)
+    
+    @staticmethod
+    def students_query(db: Session, search: Optional[str] = None, programme: Optional[str] = None) -> Query:
+        """Response columns of students matching an optional name/number search and programme filter"""
+        return db.query(*StudentService.RESPONSE_COLUMNS).filter(*StudentService.student_filters(search, programme))
+    
+    @staticmethod
+    def student_filters(search: Optional[str] = None, programme: Optional[str] = None) -> list:
+        criteria = []
+        if search:
+            criteria.append(contains_any(StudentService.SEARCH_COLUMNS, search))
+        if programme:
+            criteria.append(contains_any([Student.programme_of_study], programme))
+        return criteria
+    
+    @staticmethod
+    def stream_students(db: Session, search: Optional[str] = None, programme: Optional[str] = None) -> StreamingResponse:
+        """Every matching student as a streamed JSON array"""
+        return stream_json_array(
+            db, StudentService.students_query(db, search, programme), [Student.student_number],
+            lambda student: StudentSchema.model_validate(student).model_dump_json()
+        )
     
     @staticmethod
     def get_student_by_number(db: Session, student_number: str) -> Optional[StudentSchema]:
@@ -24,7 +57,6 @@ class StudentService:
         student = Student(**student_data.dict())
         db.add(student)
         db.commit()
-        db.refresh(student)
         return StudentSchema.from_orm(student)
     
     @staticmethod
@@ -40,7 +72,6 @@ class StudentService:
                 setattr(student, key, value)
         
         db.commit()
-        db.refresh(student)
         return StudentSchema.from_orm(student)
     
     @staticmethod
@@ -55,7 +86,6 @@ class StudentService:
             setattr(student, field, value)
         
         db.commit()
-        db.refresh(student)
         return StudentSchema.from_orm(student)
     
     @staticmethod
@@ -70,14 +100,22 @@ class StudentService:
         return True
     
     @staticmethod
-    def search_students(db: Session, query: str) -> List[StudentSchema]:
-        """Search students by name or student number"""
-        students = db.query(Student).filter(
-            Student.forename.ilike(f"%{query}%") |
-            Student.surname.ilike(f"%{query}%") |
-            Student.student_number.ilike(f"%{query}%")
-        ).all()
-        return [StudentSchema.from_orm(student) for student in students]
+    def search_students(db: Session, query: str, limit: int = 100, cursor: Optional[str] = None,
+                        with_total: bool = False) -> Page:
+        """Search students by name or student number, exact then prefix then substring matches"""
+        rank = StudentService.search_rank(query)
+        ranked = db.query(*StudentService.RESPONSE_COLUMNS, rank.label("rank")).filter(
+            contains_any(StudentService.SEARCH_COLUMNS, query)
+        )
+        page = keyset_paginate(
+            ranked, [rank, Student.student_number], limit, cursor, with_total=with_total,
+            row_keys=lambda row: [row.rank, row.student_number]
+        )
+        return page._replace(items=validate_rows(StudentSchema, page.items))
+    
+    @staticmethod
+    def search_rank(query: str):
+        return match_rank([Student.student_number, Student.full_name, Student.forename, Student.surname], query)
     
     @staticmethod
     def get_students_by_supervisor(db: Session, supervisor_id: int) -> List[StudentSchema]:
@@ -88,12 +126,10 @@ class StudentService:
         return [StudentSchema.from_orm(student) for student in students]
     
     @staticmethod
-    def get_students_by_programme(db: Session, programme: str) -> List[StudentSchema]:
+    def get_students_by_programme(db: Session, programme: str, limit: int = 100, cursor: Optional[str] = None,
+                                  with_total: bool = False) -> Page:
         """Get students by programme"""
-        students = db.query(Student).filter(
-            Student.programme_of_study.ilike(f"%{programme}%")
-        ).all()
-        return [StudentSchema.from_orm(student) for student in students]
+        return StudentService._page(StudentService.students_query(db, programme=programme), limit, cursor, 0, with_total)
     
     @staticmethod
     def get_active_students(db: Session) -> List[StudentSchema]:
@@ -102,3 +138,55 @@ class StudentService:
             Registration.status == "active"
         ).all()
         return [StudentSchema.from_orm(student) for student in students]
+    
+    @staticmethod
+    def _page(query: Query, limit: int, cursor: Optional[str], skip: int, with_total: bool) -> Page:
+        page = keyset_paginate(query, [Student.student_number], limit, cursor, skip=skip, with_total=with_total)
+        return page._replace(items=validate_rows(StudentSchema, page.items))
+
+class AsyncStudentService:
+    """Read paths of StudentService on an AsyncSession"""
+    
+    @staticmethod
+    async def get_students(db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                           with_total: bool = False) -> Page:
+        return await AsyncStudentService._page(db, select(*StudentService.RESPONSE_COLUMNS), limit, cursor, skip, with_total)
+    
+    @staticmethod
+    def stream_students(db: AsyncSession, search: Optional[str] = None, programme: Optional[str] = None) -> StreamingResponse:
+        return stream_json_array_async(
+            db, select(Student).where(*StudentService.student_filters(search, programme)), [Student.student_number],
+            lambda student: StudentSchema.model_validate(student).model_dump_json()
+        )
+    
+    @staticmethod
+    async def get_student_by_number(db: AsyncSession, student_number: str) -> Optional[StudentSchema]:
+        student = await db.scalar(select(Student).where(Student.student_number == student_number))
+        return StudentSchema.from_orm(student) if student else None
+    
+    @staticmethod
+    async def search_students(db: AsyncSession, query: str, limit: int = 100, cursor: Optional[str] = None,
+                              with_total: bool = False) -> Page:
+        rank = StudentService.search_rank(query)
+        ranked = select(*StudentService.RESPONSE_COLUMNS, rank.label("rank")).where(
+            contains_any(StudentService.SEARCH_COLUMNS, query)
+        )
+        page = await keyset_paginate_async(
+            db, ranked, [rank, Student.student_number], limit, cursor, with_total=with_total,
+            row_keys=lambda row: [row.rank, row.student_number]
+        )
+        return page._replace(items=validate_rows(StudentSchema, page.items))
+    
+    @staticmethod
+    async def get_students_by_programme(db: AsyncSession, programme: str, limit: int = 100, cursor: Optional[str] = None,
+                                        with_total: bool = False) -> Page:
+        statement = select(*StudentService.RESPONSE_COLUMNS).where(*StudentService.student_filters(programme=programme))
+        return await AsyncStudentService._page(db, statement, limit, cursor, 0, with_total)
+    
+    @staticmethod
+    async def _page(db: AsyncSession, statement: Select, limit: int, cursor: Optional[str], skip: int,
+                    with_total: bool) -> Page:
+        page = await keyset_paginate_async(
+            db, statement, [Student.student_number], limit, cursor, skip=skip, with_total=with_total
+        )
+        return page._replace(items=validate_rows(StudentSchema, page.items))
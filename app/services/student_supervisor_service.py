@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from fastapi import HTTPException
 from app.models.student_supervisor import StudentSupervisor
 from app.models.user import User
+from app.core.pagination import Page, keyset_paginate
 from app.schemas.student_supervisor import (
     StudentSupervisorCreate, 
     StudentSupervisorUpdate, 
@@ -34,7 +35,6 @@ class StudentSupervisorService:
         db_assignment = StudentSupervisor(**assignment.dict())
         db.add(db_assignment)
         db.commit()
-        db.refresh(db_assignment)
         return StudentSupervisorSchema.from_orm(db_assignment)
     
     @staticmethod
@@ -96,7 +96,6 @@ class StudentSupervisorService:
             setattr(assignment, field, value)
         
         db.commit()
-        db.refresh(assignment)
         return StudentSupervisorSchema.from_orm(assignment)
     
     @staticmethod
@@ -125,11 +124,14 @@ class StudentSupervisorService:
         db: Session, 
         current_user: User, 
         skip: int = 0, 
-        limit: int = 100
-    ) -> List[StudentSupervisorSchema]:
-        """Get all supervisor assignments (admin only)"""
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """Get a page of supervisor assignments (admin only)"""
         if current_user.role not in ["system_admin", "academic_admin", "gbos_admin", "dos"]:
             raise HTTPException(status_code=403, detail="Not authorized to view all assignments")
         
-        assignments = db.query(StudentSupervisor).offset(skip).limit(limit).all()
-        return [StudentSupervisorSchema.from_orm(assignment) for assignment in assignments]
+        page = keyset_paginate(
+            db.query(StudentSupervisor), [StudentSupervisor.student_supervisor_id], limit, cursor, skip=skip
+        )
+        return Page([StudentSupervisorSchema.from_orm(assignment) for assignment in page.items], page.next_cursor)
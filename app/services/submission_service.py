@@ -1,14 +1,27 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from typing import Optional
 from fastapi import HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+import logging
 import os
-import shutil
 from app.models.submission import Submission, SubmissionStatus, SubmissionType
 from app.models.user import User
+from app.core.pagination import (
+    Page, keyset_paginate, keyset_paginate_async, stream_json_array, stream_json_array_async
+)
+from app.core.serialization import schema_columns, validate_rows
+from app.core.uploads import StoredFile, safe_filename
+from app.storage import StorageBackend, get_storage
 from app.schemas.submission import SubmissionCreate, SubmissionUpdate, Submission as SubmissionSchema
 
+logger = logging.getLogger(__name__)
+
 class SubmissionService:
+    RESPONSE_COLUMNS = schema_columns(Submission, SubmissionSchema)
+    
     @staticmethod
     def create_submission(db: Session, submission: SubmissionCreate, current_user: User) -> SubmissionSchema:
         """Create a new submission"""
@@ -34,23 +47,47 @@ class SubmissionService:
         db_submission = Submission(**submission_data)
         db.add(db_submission)
         db.commit()
-        db.refresh(db_submission)
         return SubmissionSchema.from_orm(db_submission)
     
     @staticmethod
     def get_submissions(db: Session, current_user: User, student_number: Optional[str] = None,
-                       submission_type: Optional[str] = None, status: Optional[str] = None) -> List[SubmissionSchema]:
-        """Get submissions with filtering and authorization"""
-        query = db.query(Submission)
+                       submission_type: Optional[str] = None, status: Optional[str] = None,
+                       skip: int = 0, limit: int = 100, cursor: Optional[str] = None, with_total: bool = False) -> Page:
+        """Get a page of submissions with filtering and authorization"""
+        query = SubmissionService.submissions_query(db, current_user, student_number, submission_type, status)
+        return SubmissionService._page(query, limit, cursor, skip, with_total)
+    
+    @staticmethod
+    def stream_submissions(db: Session, current_user: User, student_number: Optional[str] = None,
+                           submission_type: Optional[str] = None, status: Optional[str] = None) -> StreamingResponse:
+        """Every matching submission as a streamed JSON array"""
+        query = SubmissionService.submissions_query(db, current_user, student_number, submission_type, status)
+        return stream_json_array(
+            db, query, [Submission.id],
+            lambda submission: SubmissionSchema.model_validate(submission).model_dump_json()
+        )
+    
+    @staticmethod
+    def submissions_query(db: Session, current_user: User, student_number: Optional[str] = None,
+                          submission_type: Optional[str] = None, status: Optional[str] = None) -> Query:
+        """Response columns of submissions matching the filters that the current user may see"""
+        return db.query(*SubmissionService.RESPONSE_COLUMNS).filter(
+            *SubmissionService.submission_filters(current_user, student_number, submission_type, status)
+        )
+    
+    @staticmethod
+    def submission_filters(current_user: User, student_number: Optional[str] = None,
+                           submission_type: Optional[str] = None, status: Optional[str] = None) -> list:
+        criteria = []
 
         if student_number:
-            query = query.filter(Submission.student_number.ilike(f"%{student_number}%"))
+            criteria.append(Submission.student_number.ilike(f"%{student_number}%"))
         
         if submission_type:
             # Convert string to enum if needed
             try:
                 type_enum = SubmissionType(submission_type) if isinstance(submission_type, str) else submission_type
-                query = query.filter(Submission.submission_type == type_enum)
+                criteria.append(Submission.submission_type == type_enum)
             except ValueError:
                 pass  # Invalid submission type, ignore filter
             
@@ -58,21 +95,24 @@ class SubmissionService:
             # Convert string to enum if needed
             try:
                 status_enum = SubmissionStatus(status) if isinstance(status, str) else status
-                query = query.filter(Submission.status == status_enum)
+                criteria.append(Submission.status == status_enum)
             except ValueError:
                 pass  # Invalid status, ignore filter
 
         # Students can only see their own submissions
         if current_user.role == "student":
-            query = query.filter(Submission.student_number == current_user.username)
+            criteria.append(Submission.student_number == current_user.username)
         
-        submissions = query.all()
-        return [SubmissionSchema.from_orm(submission) for submission in submissions]
+        return criteria
     
     @staticmethod
     def get_submission_by_id(db: Session, submission_id: int, current_user: User) -> SubmissionSchema:
         """Get submission by ID with authorization check"""
         submission = db.query(Submission).filter(Submission.id == submission_id).first()
+        return SubmissionService._visible(submission, current_user)
+    
+    @staticmethod
+    def _visible(submission: Optional[Submission], current_user: User) -> SubmissionSchema:
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
 
@@ -82,9 +122,36 @@ class SubmissionService:
         
         return SubmissionSchema.from_orm(submission)
     
+    @staticmethod
+    def get_submission_file(db: Session, submission_id: int, current_user: User) -> Submission:
+        """Get a submission whose stored file can be served, with authorization check"""
+        submission = db.query(Submission).filter(Submission.id == submission_id).first()
+        if not submission:
+            raise HTTPException(status_code=404, detail="Submission not found")
+
+        # Students can only download their own submissions
+        if current_user.role == "student" and submission.student_number != current_user.username:
+            raise HTTPException(status_code=403, detail="Not authorized to view this submission")
+
+        if not submission.file_path or not os.path.isfile(submission.file_path):
+            raise HTTPException(status_code=404, detail="No file uploaded for this submission")
+
+        return submission
+    
     @staticmethod
     async def upload_file(db: Session, submission_id: int, file: UploadFile, current_user: User) -> SubmissionSchema:
         """Upload file for a submission with authorization check"""
+        submission = SubmissionService.get_uploadable_submission(db, submission_id, current_user)
+        
+        # Streamed off the event loop; size and hash are computed as it is written
+        file_name = safe_filename(file.filename)
+        storage = get_storage()
+        stored = await storage.save(file, f"submissions/{submission_id}/{file_name}")
+        return SubmissionService.attach_file(db, submission, storage, stored, file_name, file.content_type)
+    
+    @staticmethod
+    def get_uploadable_submission(db: Session, submission_id: int, current_user: User) -> Submission:
+        """Get a submission the current user may upload files to"""
         submission = db.query(Submission).filter(Submission.id == submission_id).first()
         if not submission:
             raise HTTPException(status_code=404, detail="Submission not found")
@@ -93,25 +160,50 @@ class SubmissionService:
         if current_user.role == "student" and submission.student_number != current_user.username:
             raise HTTPException(status_code=403, detail="Not authorized to upload file to this submission")
         
-        # Create uploads directory if it doesn't exist
-        upload_dir = f"uploads/submissions/{submission_id}"
-        os.makedirs(upload_dir, exist_ok=True)
-        
-        # Save the file
-        file_path = f"{upload_dir}/{file.filename}"
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        return submission
+    
+    @staticmethod
+    def attach_file(
+        db: Session,
+        submission: Submission,
+        storage: StorageBackend,
+        stored: StoredFile,
+        file_name: str,
+        mime_type: Optional[str]
+    ) -> SubmissionSchema:
+        """Record a stored file on the submission, then release the file it replaces.
+
+        The row is committed first so it never points at a file that was
+        already removed; if the commit fails the new file is discarded instead.
+        """
+        previous_path, previous_sha256 = submission.file_path, submission.file_sha256
         
         # Update submission with file information
-        submission.file_path = file_path
-        submission.file_name = file.filename
-        submission.file_size = os.path.getsize(file_path)
+        submission.file_path = stored.path
+        submission.file_name = file_name
+        submission.file_size = stored.size
+        submission.file_sha256 = stored.sha256
+        submission.mime_type = mime_type
         submission.submission_date = datetime.now()  # Updated field name
         
-        db.commit()
-        db.refresh(submission)
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+            if stored.path != previous_path:
+                SubmissionService._cleanup(storage.delete, stored.path, stored.sha256)
+            raise
+        SubmissionService._cleanup(storage.replace, previous_path, previous_sha256, stored)
         return SubmissionSchema.from_orm(submission)
     
+    @staticmethod
+    def _cleanup(operation, *args) -> None:
+        """Run a storage cleanup step; a leftover file is logged, not raised, once the row is committed"""
+        try:
+            operation(*args)
+        except OSError as e:
+            logger.warning(f"Could not clean up stored submission file: {e}")
+    
     @staticmethod
     def update_submission(db: Session, submission_id: int, submission_update: SubmissionUpdate, current_user: User) -> SubmissionSchema:
         """Update submission with authorization check"""
@@ -148,7 +240,6 @@ class SubmissionService:
         
         submission.updated_date = datetime.now()  # Use the correct field name
         db.commit()
-        db.refresh(submission)
         return SubmissionSchema.from_orm(submission)
     
     @staticmethod
@@ -166,7 +257,6 @@ class SubmissionService:
         submission.reviewed_by = current_user.id  # Use user ID, not username
         
         db.commit()
-        db.refresh(submission)
         return SubmissionSchema.from_orm(submission)
     
     @staticmethod
@@ -185,7 +275,6 @@ class SubmissionService:
         submission.reviewed_by = current_user.id  # Use user ID, not username
         
         db.commit()
-        db.refresh(submission)
         return SubmissionSchema.from_orm(submission)
     
     @staticmethod
@@ -214,41 +303,78 @@ class SubmissionService:
         submission.reviewed_by = current_user.id  # Use user ID, not username
         
         db.commit()
-        db.refresh(submission)
         return SubmissionSchema.from_orm(submission)
     
     @staticmethod
-    def get_student_submissions(db: Session, student_number: str, current_user: User) -> List[SubmissionSchema]:
-        """Get all submissions for a specific student with authorization"""
+    def get_student_submissions(db: Session, student_number: str, current_user: User,
+                                limit: int = 100, cursor: Optional[str] = None) -> Page:
+        """Get a page of submissions for a specific student with authorization"""
         if current_user.role == "student" and current_user.username != student_number:
             raise HTTPException(status_code=403, detail="Not authorized to view submissions for another student")
         
-        submissions = db.query(Submission).filter(Submission.student_number == student_number).all()
-        return [SubmissionSchema.from_orm(submission) for submission in submissions]
+        query = db.query(*SubmissionService.RESPONSE_COLUMNS).filter(Submission.student_number == student_number)
+        return SubmissionService._page(query, limit, cursor)
     
     @staticmethod
-    def get_pending_submissions(db: Session, current_user: User) -> List[SubmissionSchema]:
-        """Get all pending submissions - for supervisors/admin only"""
+    def get_pending_submissions(db: Session, current_user: User,
+                                limit: int = 100, cursor: Optional[str] = None) -> Page:
+        """Get a page of pending submissions - for supervisors/admin only"""
         if current_user.role not in ["supervisor", "admin"]:
             raise HTTPException(status_code=403, detail="Not authorized to view pending submissions")
         
-        submissions = db.query(Submission).filter(Submission.status == SubmissionStatus.SUBMITTED).all()  # Use SUBMITTED instead of pending
-        return [SubmissionSchema.from_orm(submission) for submission in submissions]
+        query = db.query(*SubmissionService.RESPONSE_COLUMNS).filter(Submission.status == SubmissionStatus.SUBMITTED)  # Use SUBMITTED instead of pending
+        return SubmissionService._page(query, limit, cursor)
     
     @staticmethod
-    def get_submissions_by_type(db: Session, submission_type: str, current_user: User) -> List[SubmissionSchema]:
-        """Get submissions by type with authorization"""
+    def get_submissions_by_type(db: Session, submission_type: str, current_user: User,
+                                limit: int = 100, cursor: Optional[str] = None) -> Page:
+        """Get a page of submissions by type with authorization"""
         # Convert string to enum if needed
         try:
             type_enum = SubmissionType(submission_type) if isinstance(submission_type, str) else submission_type
-            query = db.query(Submission).filter(Submission.submission_type == type_enum)
+            query = db.query(*SubmissionService.RESPONSE_COLUMNS).filter(Submission.submission_type == type_enum)
         except ValueError:
-            # Invalid submission type, return empty list
-            return []
+            # Invalid submission type, return an empty page
+            return Page([], None)
         
         # Students can only see their own submissions
         if current_user.role == "student":
             query = query.filter(Submission.student_number == current_user.username)
         
-        submissions = query.all()
-        return [SubmissionSchema.from_orm(submission) for submission in submissions]
+        return SubmissionService._page(query, limit, cursor)
+    
+    @staticmethod
+    def _page(query: Query, limit: int, cursor: Optional[str], skip: int = 0, with_total: bool = False) -> Page:
+        page = keyset_paginate(query, [Submission.id], limit, cursor, skip=skip, with_total=with_total)
+        return page._replace(items=validate_rows(SubmissionSchema, page.items))
+
+class AsyncSubmissionService:
+    """Read paths of SubmissionService on an AsyncSession"""
+    
+    @staticmethod
+    async def get_submissions(db: AsyncSession, current_user: User, student_number: Optional[str] = None,
+                              submission_type: Optional[str] = None, status: Optional[str] = None,
+                              skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                              with_total: bool = False) -> Page:
+        statement = select(*SubmissionService.RESPONSE_COLUMNS).where(
+            *SubmissionService.submission_filters(current_user, student_number, submission_type, status)
+        )
+        page = await keyset_paginate_async(db, statement, [Submission.id], limit, cursor, skip=skip, with_total=with_total)
+        return page._replace(items=validate_rows(SubmissionSchema, page.items))
+    
+    @staticmethod
+    def stream_submissions(db: AsyncSession, current_user: User, student_number: Optional[str] = None,
+                           submission_type: Optional[str] = None, status: Optional[str] = None) -> StreamingResponse:
+        # stream_json_array_async yields scalars, so this selects the entity rather than its columns
+        statement = select(Submission).where(
+            *SubmissionService.submission_filters(current_user, student_number, submission_type, status)
+        )
+        return stream_json_array_async(
+            db, statement, [Submission.id],
+            lambda submission: SubmissionSchema.model_validate(submission).model_dump_json()
+        )
+    
+    @staticmethod
+    async def get_submission_by_id(db: AsyncSession, submission_id: int, current_user: User) -> SubmissionSchema:
+        submission = await db.get(Submission, submission_id)
+        return SubmissionService._visible(submission, current_user)
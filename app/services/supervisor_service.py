@@ -1,15 +1,40 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from app.models.supervisor import Supervisor
 from app.models.registration import Registration
+from app.core.pagination import Page, keyset_paginate, stream_json_array
+from app.core.search import contains_any, match_rank
+from app.core.serialization import schema_columns, validate_rows
 from app.schemas.supervisor import SupervisorCreate, SupervisorUpdate, Supervisor as SupervisorSchema
 
 class SupervisorService:
+    SEARCH_COLUMNS = [Supervisor.supervisor_name, Supervisor.email]
+    RESPONSE_COLUMNS = schema_columns(Supervisor, SupervisorSchema)
+    
+    @staticmethod
+    def get_supervisors(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                        with_total: bool = False) -> Page:
+        """Get a page of supervisors ordered by id"""
+        return SupervisorService._page(SupervisorService.supervisors_query(db), limit, cursor, skip, with_total)
+    
     @staticmethod
-    def get_supervisors(db: Session, skip: int = 0, limit: int = 100) -> List[SupervisorSchema]:
-        """Get list of supervisors with pagination"""
-        supervisors = db.query(Supervisor).offset(skip).limit(limit).all()
-        return [SupervisorSchema.from_orm(supervisor) for supervisor in supervisors]
+    def supervisors_query(db: Session, search: Optional[str] = None, department: Optional[str] = None) -> Query:
+        """Response columns of supervisors matching an optional name/email search and department filter"""
+        query = db.query(*SupervisorService.RESPONSE_COLUMNS)
+        if search:
+            query = query.filter(contains_any(SupervisorService.SEARCH_COLUMNS, search))
+        if department:
+            query = query.filter(Supervisor.department == department)
+        return query
+    
+    @staticmethod
+    def stream_supervisors(db: Session, search: Optional[str] = None, department: Optional[str] = None) -> StreamingResponse:
+        """Every matching supervisor as a streamed JSON array"""
+        return stream_json_array(
+            db, SupervisorService.supervisors_query(db, search, department), [Supervisor.supervisor_id],
+            lambda supervisor: SupervisorSchema.model_validate(supervisor).model_dump_json()
+        )
     
     @staticmethod
     def get_supervisor_by_id(db: Session, supervisor_id: int) -> Optional[SupervisorSchema]:
@@ -29,7 +54,6 @@ class SupervisorService:
         supervisor = Supervisor(**supervisor_data.dict())
         db.add(supervisor)
         db.commit()
-        db.refresh(supervisor)
         return SupervisorSchema.from_orm(supervisor)
     
     @staticmethod
@@ -45,7 +69,6 @@ class SupervisorService:
                 setattr(supervisor, key, value)
         
         db.commit()
-        db.refresh(supervisor)
         return SupervisorSchema.from_orm(supervisor)
     
     @staticmethod
@@ -60,18 +83,24 @@ class SupervisorService:
         return True
     
     @staticmethod
-    def search_supervisors(db: Session, query: str) -> List[Supervisor]:
-        """Search supervisors by name or email"""
-        return db.query(Supervisor).filter(
-            Supervisor.first_name.ilike(f"%{query}%") |
-            Supervisor.last_name.ilike(f"%{query}%") |
-            Supervisor.email.ilike(f"%{query}%")
-        ).all()
+    def search_supervisors(db: Session, query: str, limit: int = 100, cursor: Optional[str] = None,
+                           with_total: bool = False) -> Page:
+        """Search supervisors by name or email, exact then prefix then substring matches"""
+        rank = match_rank(SupervisorService.SEARCH_COLUMNS, query)
+        ranked = db.query(*SupervisorService.RESPONSE_COLUMNS, rank.label("rank")).filter(
+            contains_any(SupervisorService.SEARCH_COLUMNS, query)
+        )
+        page = keyset_paginate(
+            ranked, [rank, Supervisor.supervisor_id], limit, cursor, with_total=with_total,
+            row_keys=lambda row: [row.rank, row.supervisor_id]
+        )
+        return page._replace(items=validate_rows(SupervisorSchema, page.items))
     
     @staticmethod
-    def get_supervisors_by_department(db: Session, department: str) -> List[Supervisor]:
+    def get_supervisors_by_department(db: Session, department: str, limit: int = 100, cursor: Optional[str] = None,
+                                      with_total: bool = False) -> Page:
         """Get supervisors by department"""
-        return db.query(Supervisor).filter(Supervisor.department == department).all()
+        return SupervisorService._page(SupervisorService.supervisors_query(db, department=department), limit, cursor, 0, with_total)
     
     @staticmethod
     def get_supervisor_workload(db: Session, supervisor_id: int) -> dict:
@@ -102,3 +131,8 @@ class SupervisorService:
                 available.append(supervisor)
         
         return available
+    
+    @staticmethod
+    def _page(query: Query, limit: int, cursor: Optional[str], skip: int, with_total: bool) -> Page:
+        page = keyset_paginate(query, [Supervisor.supervisor_id], limit, cursor, skip=skip, with_total=with_total)
+        return page._replace(items=validate_rows(SupervisorSchema, page.items))
@@ -4,6 +4,7 @@ from datetime import date, datetime
 from fastapi import HTTPException
 from app.models.timeline import Timeline
 from app.models.user import User
+from app.core.pagination import Page, keyset_paginate
 from app.schemas.timeline import TimelineCreate, TimelineUpdate, Timeline as TimelineSchema
 
 class TimelineService:
@@ -13,7 +14,6 @@ class TimelineService:
         db_timeline = Timeline(**timeline.dict())
         db.add(db_timeline)
         db.commit()
-        db.refresh(db_timeline)
         return TimelineSchema.from_orm(db_timeline)
     
     @staticmethod
@@ -28,8 +28,8 @@ class TimelineService:
     @staticmethod
     def get_timelines(db: Session, current_user: User, skip: int = 0, limit: int = 100, 
                      student_number: Optional[str] = None, stage: Optional[str] = None, 
-                     status: Optional[str] = None) -> List[TimelineSchema]:
-        """Get timelines with filtering and authorization"""
+                     status: Optional[str] = None, cursor: Optional[str] = None) -> Page:
+        """Get a page of timelines with filtering and authorization"""
         query = db.query(Timeline)
 
         if student_number:
@@ -44,8 +44,8 @@ class TimelineService:
         if current_user.role == "student":
             query = query.filter(Timeline.student_number == current_user.username)
         
-        timelines = query.offset(skip).limit(limit).all()
-        return [TimelineSchema.from_orm(timeline) for timeline in timelines]
+        page = keyset_paginate(query, [Timeline.id], limit, cursor, skip=skip)
+        return Page([TimelineSchema.from_orm(timeline) for timeline in page.items], page.next_cursor)
     
     @staticmethod
     def get_timeline_by_id(db: Session, timeline_id: int, current_user: User) -> TimelineSchema:
@@ -71,7 +71,6 @@ class TimelineService:
             setattr(db_timeline, field, value)
         
         db.commit()
-        db.refresh(db_timeline)
         return TimelineSchema.from_orm(db_timeline)
     
     @staticmethod
@@ -90,7 +89,6 @@ class TimelineService:
             timeline.notes = notes
         
         db.commit()
-        db.refresh(timeline)
         return TimelineSchema.from_orm(timeline)
     
     @staticmethod
@@ -124,7 +122,6 @@ class TimelineService:
         timeline.actual_date = datetime.now().date()
         timeline.completion_notes = completion_notes
         db.commit()
-        db.refresh(timeline)
         return timeline
     
     @staticmethod
@@ -157,7 +154,6 @@ class TimelineService:
         timeline.planned_date = new_date
         timeline.reschedule_reason = reason
         db.commit()
-        db.refresh(timeline)
         return timeline
     
     @staticmethod
@@ -0,0 +1,336 @@
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, List, Optional
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from datetime import datetime, timedelta
+import os
+import secrets
+import shutil
+from app.models.upload_session import UploadSession, UploadSessionPart, UploadSessionStatus
+from app.models.user import User
+from app.schemas.upload_session import UploadSessionCreate, UploadPart, UploadSession as UploadSessionSchema
+from app.schemas.submission import Submission as SubmissionSchema
+from app.services.submission_service import SubmissionService
+from app.core.config import settings
+from app.core.uploads import iter_files, safe_filename, save_stream
+from app.storage import get_storage
+
+class UploadSessionService:
+    """Resumable uploads: initiate, upload numbered parts in any order, then complete.
+
+    Each part is written atomically to its own file and recorded in
+    upload_session_parts, so the session status shows which parts the server
+    already holds. The session's reserved_bytes counts stored parts plus parts
+    still streaming and never exceeds the upload's size limit. Completing
+    streams the parts in order into the storage backend without loading them
+    into memory.
+    """
+
+    MAX_PARTS = 10000
+
+    @staticmethod
+    def initiate(db: Session, submission_id: int, upload: UploadSessionCreate, current_user: User) -> UploadSessionSchema:
+        """Start a resumable upload for a submission"""
+        SubmissionService.get_uploadable_submission(db, submission_id, current_user)
+        if upload.total_size is not None and upload.total_size > settings.MAX_UPLOAD_SIZE_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds the maximum upload size of {settings.MAX_UPLOAD_SIZE_BYTES} bytes"
+            )
+
+        UploadSessionService.expire_stale_sessions(db)
+
+        session = UploadSession(
+            submission_id=submission_id,
+            created_by=current_user.id,
+            file_name=safe_filename(upload.file_name),
+            mime_type=upload.mime_type,
+            total_size=upload.total_size
+        )
+        db.add(session)
+        db.commit()
+        return UploadSessionService._to_schema(db, session)
+
+    @staticmethod
+    def get_session(db: Session, submission_id: int, upload_id: int, current_user: User) -> UploadSessionSchema:
+        """Upload progress, including the parts received so far"""
+        session = UploadSessionService._get_session(db, submission_id, upload_id, current_user)
+        return UploadSessionService._to_schema(db, session)
+
+    @staticmethod
+    async def upload_part(
+        db: Session,
+        submission_id: int,
+        upload_id: int,
+        part_number: int,
+        chunks: AsyncIterator[bytes],
+        current_user: User,
+        content_length: Optional[int] = None
+    ) -> UploadPart:
+        """Store one numbered part; re-sending a part replaces it.
+
+        The part's Content-Length (or, without one, everything left of the
+        budget) is reserved on the session with a conditional UPDATE before
+        any bytes are written, so parts sent in parallel cannot together
+        exceed the declared total_size or MAX_UPLOAD_SIZE_BYTES. Once the part
+        is stored the reservation is settled to its actual size.
+        """
+        session = UploadSessionService._get_active_session(db, submission_id, upload_id, current_user)
+        if not 1 <= part_number <= UploadSessionService.MAX_PARTS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Part number must be between 1 and {UploadSessionService.MAX_PARTS}"
+            )
+        if content_length == 0:
+            raise HTTPException(status_code=400, detail="Part is empty")
+
+        limit = min(session.total_size or settings.MAX_UPLOAD_SIZE_BYTES, settings.MAX_UPLOAD_SIZE_BYTES)
+        too_large = HTTPException(status_code=413, detail=f"Upload parts exceed the upload size of {limit} bytes")
+
+        # A re-sent part discards the earlier attempt first, freeing its bytes
+        replaced = UploadSessionService._discard_part(db, session, part_number)
+        if replaced:
+            await run_in_threadpool(UploadSessionService._remove_part_file, session.id, replaced)
+
+        db.refresh(session)
+        reserve = content_length if content_length is not None else limit - session.reserved_bytes
+        if reserve <= 0 or not UploadSessionService._reserve(db, session, reserve, limit):
+            db.refresh(session)
+            if session.status != UploadSessionStatus.ACTIVE:
+                raise HTTPException(status_code=409, detail=f"Upload session is {session.status.value}")
+            raise too_large
+
+        file_name = f"{part_number:05d}-{secrets.token_hex(8)}"
+        try:
+            stored = await save_stream(
+                chunks, os.path.join(UploadSessionService._parts_dir(session.id), file_name), max_size=reserve
+            )
+        except BaseException as e:
+            UploadSessionService._adjust_reservation(db, session, -reserve)
+            db.commit()
+            if isinstance(e, HTTPException) and e.status_code == 413:
+                raise too_large from e
+            raise
+
+        replaced = UploadSessionService._record_part(db, session, part_number, file_name, stored.size, reserve)
+        if replaced:
+            await run_in_threadpool(UploadSessionService._remove_part_file, session.id, replaced)
+        return UploadPart(part_number=part_number, size=stored.size)
+
+    @staticmethod
+    async def complete(db: Session, submission_id: int, upload_id: int, current_user: User) -> SubmissionSchema:
+        """Assemble the parts into the submission's file and close the session"""
+        session = UploadSessionService._get_active_session(db, submission_id, upload_id, current_user)
+        submission = SubmissionService.get_uploadable_submission(db, submission_id, current_user)
+
+        # Claim the session with a conditional UPDATE so concurrent completes assemble it only
+        # once; parts still streaming can no longer be recorded or replaced after this
+        claimed = db.query(UploadSession).filter(
+            UploadSession.id == session.id,
+            UploadSession.status == UploadSessionStatus.ACTIVE
+        ).update({UploadSession.status: UploadSessionStatus.COMPLETED})
+        db.commit()
+        if not claimed:
+            raise HTTPException(status_code=409, detail="Upload session is already being completed")
+
+        try:
+            parts = UploadSessionService._complete_parts(db, session)
+        except HTTPException:
+            UploadSessionService._release_claim(db, session)
+            raise
+
+        parts_dir = UploadSessionService._parts_dir(session.id)
+        storage = get_storage()
+        try:
+            stored = await storage.save_stream(
+                iter_files(os.path.join(parts_dir, part.file_name) for part in parts),
+                f"submissions/{submission_id}/{session.file_name}"
+            )
+            attached = SubmissionService.attach_file(db, submission, storage, stored, session.file_name, session.mime_type)
+        except BaseException:
+            db.rollback()
+            UploadSessionService._release_claim(db, session)
+            raise
+        await run_in_threadpool(shutil.rmtree, parts_dir, True)
+        return attached
+
+    @staticmethod
+    def _complete_parts(db: Session, session: UploadSession) -> List[UploadSessionPart]:
+        """The session's parts in order, checked to form the whole declared upload"""
+        parts = UploadSessionService._list_parts(db, session.id)
+        if not parts:
+            raise HTTPException(status_code=400, detail="No parts have been uploaded")
+
+        missing = sorted(set(range(1, parts[-1].part_number + 1)) - {part.part_number for part in parts})
+        if missing:
+            raise HTTPException(status_code=400, detail=f"Missing parts: {missing}")
+
+        received = sum(part.size for part in parts)
+        if session.total_size is not None and received != session.total_size:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Received {received} bytes but the upload declared {session.total_size}"
+            )
+        return parts
+
+    @staticmethod
+    def _release_claim(db: Session, session: UploadSession) -> None:
+        """Hand a claimed session back so the client can fix it and retry the complete"""
+        db.query(UploadSession).filter(UploadSession.id == session.id).update(
+            {UploadSession.status: UploadSessionStatus.ACTIVE}
+        )
+        db.commit()
+
+    @staticmethod
+    def abort(db: Session, submission_id: int, upload_id: int, current_user: User) -> None:
+        """Cancel an upload and discard its parts"""
+        session = UploadSessionService._get_active_session(db, submission_id, upload_id, current_user)
+        session.status = UploadSessionStatus.ABORTED
+        db.commit()
+        shutil.rmtree(UploadSessionService._parts_dir(session.id), ignore_errors=True)
+
+    @staticmethod
+    def expire_stale_sessions(db: Session) -> int:
+        """Abort active uploads untouched for UPLOAD_SESSION_EXPIRE_HOURS and free their parts"""
+        cutoff = datetime.utcnow() - timedelta(hours=settings.UPLOAD_SESSION_EXPIRE_HOURS)
+        stale = db.query(UploadSession).filter(
+            UploadSession.status == UploadSessionStatus.ACTIVE,
+            UploadSession.updated_at < cutoff
+        ).all()
+        for session in stale:
+            session.status = UploadSessionStatus.ABORTED
+            shutil.rmtree(UploadSessionService._parts_dir(session.id), ignore_errors=True)
+        if stale:
+            db.commit()
+        return len(stale)
+
+    @staticmethod
+    def _get_session(db: Session, submission_id: int, upload_id: int, current_user: User) -> UploadSession:
+        session = db.query(UploadSession).filter(
+            UploadSession.id == upload_id,
+            UploadSession.submission_id == submission_id
+        ).first()
+        if not session:
+            raise HTTPException(status_code=404, detail="Upload session not found")
+
+        # Only the user who started an upload can continue it
+        if session.created_by != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to access this upload")
+
+        return session
+
+    @staticmethod
+    def _get_active_session(db: Session, submission_id: int, upload_id: int, current_user: User) -> UploadSession:
+        session = UploadSessionService._get_session(db, submission_id, upload_id, current_user)
+        if session.status != UploadSessionStatus.ACTIVE:
+            raise HTTPException(status_code=409, detail=f"Upload session is {session.status.value}")
+        return session
+
+    @staticmethod
+    def _reserve(db: Session, session: UploadSession, size: int, limit: int) -> bool:
+        """Add size to the session's reserved bytes if it stays within limit and the session is active"""
+        reserved = db.query(UploadSession).filter(
+            UploadSession.id == session.id,
+            UploadSession.status == UploadSessionStatus.ACTIVE,
+            UploadSession.reserved_bytes + size <= limit
+        ).update({
+            UploadSession.reserved_bytes: UploadSession.reserved_bytes + size,
+            UploadSession.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+        db.commit()
+        return bool(reserved)
+
+    @staticmethod
+    def _adjust_reservation(db: Session, session: UploadSession, delta: int) -> int:
+        """Change the session's reserved bytes by delta while it is active, without committing"""
+        return db.query(UploadSession).filter(
+            UploadSession.id == session.id,
+            UploadSession.status == UploadSessionStatus.ACTIVE
+        ).update({
+            UploadSession.reserved_bytes: UploadSession.reserved_bytes + delta,
+            UploadSession.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+
+    @staticmethod
+    def _discard_part(db: Session, session: UploadSession, part_number: int) -> Optional[str]:
+        """Forget a stored part and release its bytes; returns its file name to remove"""
+        part = db.query(UploadSessionPart).filter(
+            UploadSessionPart.upload_id == session.id,
+            UploadSessionPart.part_number == part_number
+        ).populate_existing().first()
+        if part is None:
+            return None
+        # Matching the file name means a concurrent re-send of the same part frees it only once
+        deleted = db.query(UploadSessionPart).filter(
+            UploadSessionPart.upload_id == session.id,
+            UploadSessionPart.part_number == part_number,
+            UploadSessionPart.file_name == part.file_name
+        ).delete(synchronize_session=False)
+        # A completed or aborted session keeps its parts as they are
+        if not deleted or not UploadSessionService._adjust_reservation(db, session, -part.size):
+            db.rollback()
+            return None
+        db.commit()
+        return part.file_name
+
+    @staticmethod
+    def _record_part(
+        db: Session, session: UploadSession, part_number: int, file_name: str, size: int, reserved: int
+    ) -> Optional[str]:
+        """Record a stored part and settle its reservation; returns a replaced part's file name"""
+        previous = db.query(UploadSessionPart).filter(
+            UploadSessionPart.upload_id == session.id,
+            UploadSessionPart.part_number == part_number
+        ).populate_existing().first()
+        # A concurrent re-send of this part may have been recorded while this one streamed
+        delta = size - reserved - (previous.size if previous else 0)
+        if not UploadSessionService._adjust_reservation(db, session, delta):
+            db.rollback()
+            UploadSessionService._remove_part_file(session.id, file_name)
+            db.refresh(session)
+            raise HTTPException(status_code=409, detail=f"Upload session is {session.status.value}")
+
+        replaced = previous.file_name if previous else None
+        if previous:
+            previous.size = size
+            previous.file_name = file_name
+        else:
+            db.add(UploadSessionPart(upload_id=session.id, part_number=part_number, size=size, file_name=file_name))
+        db.commit()
+        return replaced
+
+    @staticmethod
+    def _parts_dir(upload_id: int) -> str:
+        return os.path.join(settings.UPLOAD_DIR, ".parts", str(upload_id))
+
+    @staticmethod
+    def _remove_part_file(upload_id: int, file_name: str) -> None:
+        try:
+            os.remove(os.path.join(UploadSessionService._parts_dir(upload_id), file_name))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _list_parts(db: Session, upload_id: int) -> List[UploadSessionPart]:
+        return db.query(UploadSessionPart).filter(
+            UploadSessionPart.upload_id == upload_id
+        ).order_by(UploadSessionPart.part_number).populate_existing().all()
+
+    @staticmethod
+    def _to_schema(db: Session, session: UploadSession) -> UploadSessionSchema:
+        parts = [
+            UploadPart(part_number=part.part_number, size=part.size)
+            for part in UploadSessionService._list_parts(db, session.id)
+        ] if session.status == UploadSessionStatus.ACTIVE else []
+        return UploadSessionSchema(
+            id=session.id,
+            submission_id=session.submission_id,
+            file_name=session.file_name,
+            mime_type=session.mime_type,
+            total_size=session.total_size,
+            status=session.status.value,
+            received_bytes=sum(part.size for part in parts),
+            parts=parts,
+            created_at=session.created_at,
+            updated_at=session.updated_at
+        )
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models.user import User
 from app.core.security import get_password_hash
+from app.core.principal_cache import principal_cache
 
 class UserService:
     @staticmethod
@@ -41,6 +42,7 @@ class UserService:
         if not user:
             return None
         
+        previous_username = user.username
         for key, value in kwargs.items():
             if hasattr(user, key):
                 if key == 'password':
@@ -49,7 +51,7 @@ class UserService:
                     setattr(user, key, value)
         
         db.commit()
-        db.refresh(user)
+        principal_cache.invalidate_user(previous_username, user.username)
         return user
     
     @staticmethod
@@ -59,8 +61,10 @@ class UserService:
         if not user:
             return False
         
+        username = user.username
         db.delete(user)
         db.commit()
+        principal_cache.invalidate_user(username)
         return True
     
     @staticmethod
@@ -71,5 +75,7 @@ class UserService:
             return False
         
         user.hashed_password = get_password_hash(new_password)
+        username = user.username
         db.commit()
+        principal_cache.invalidate_user(username)
         return True
@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime, date
 from fastapi import HTTPException
 from app.models.viva_team import VivaTeam, VivaStatus, VivaStage
 from app.models.user import User
 from app.models.supervisor import Supervisor
+from app.core.pagination import Page, keyset_paginate
 from app.schemas.viva_team import VivaTeamCreate, VivaTeamUpdate, VivaTeam as VivaTeamSchema
 
 class VivaTeamService:
@@ -52,14 +53,13 @@ class VivaTeamService:
         db_viva_team = VivaTeam(**viva_team_data)
         db.add(db_viva_team)
         db.commit()
-        db.refresh(db_viva_team)
         return VivaTeamSchema.from_orm(db_viva_team)
     
     @staticmethod
     def get_viva_teams(db: Session, current_user: User, skip: int = 0, limit: int = 100,
                       student_number: Optional[str] = None, stage: Optional[str] = None,
-                      status: Optional[str] = None) -> List[VivaTeamSchema]:
-        """Get viva teams with filtering and authorization"""
+                      status: Optional[str] = None, cursor: Optional[str] = None) -> Page:
+        """Get a page of viva teams with filtering and authorization"""
         query = db.query(VivaTeam)
 
         if student_number:
@@ -85,8 +85,8 @@ class VivaTeamService:
         if current_user.role == "student":
             query = query.filter(VivaTeam.student_number == current_user.username)
         
-        viva_teams = query.offset(skip).limit(limit).all()
-        return [VivaTeamSchema.from_orm(vt) for vt in viva_teams]
+        page = keyset_paginate(query, [VivaTeam.id], limit, cursor, skip=skip)
+        return Page([VivaTeamSchema.from_orm(vt) for vt in page.items], page.next_cursor)
     
     @staticmethod
     def get_viva_team_by_id(db: Session, viva_team_id: int, current_user: User) -> VivaTeamSchema:
@@ -146,7 +146,6 @@ class VivaTeamService:
             setattr(db_viva_team, field, value)
         
         db.commit()
-        db.refresh(db_viva_team)
         return VivaTeamSchema.from_orm(db_viva_team)
     
     @staticmethod
@@ -164,7 +163,6 @@ class VivaTeamService:
         viva_team.approval_date = datetime.now()
         viva_team.approved_by = current_user.id
         db.commit()
-        db.refresh(viva_team)
         return VivaTeamSchema.from_orm(viva_team)
     
     @staticmethod
@@ -178,7 +176,6 @@ class VivaTeamService:
         # Note: rejection_reason field doesn't exist in model, you may need to add it
         # viva_team.rejection_reason = reason
         db.commit()
-        db.refresh(viva_team)
         return VivaTeamSchema.from_orm(viva_team)
     
     @staticmethod
@@ -195,7 +192,6 @@ class VivaTeamService:
         viva_team.scheduled_date = scheduled_date
         viva_team.location = location
         db.commit()
-        db.refresh(viva_team)
         return VivaTeamSchema.from_orm(viva_team)
     
     @staticmethod
@@ -210,5 +206,4 @@ class VivaTeamService:
         viva_team.outcome_notes = outcome_notes
         viva_team.actual_date = date.today()
         db.commit()
-        db.refresh(viva_team)
         return VivaTeamSchema.from_orm(viva_team)
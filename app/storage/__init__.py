@@ -0,0 +1,17 @@
+# File storage backends
+from app.core.config import settings
+from app.storage.base import StorageBackend
+from app.storage.local import LocalStorage
+from app.storage.content_addressed import ContentAddressedStorage
+
+BACKENDS = {
+    LocalStorage.name: LocalStorage,
+    ContentAddressedStorage.name: ContentAddressedStorage,
+}
+
+def get_storage(backend: str = None, root: str = None) -> StorageBackend:
+    """Storage backend selected by STORAGE_BACKEND, rooted at UPLOAD_DIR"""
+    backend = backend or settings.STORAGE_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return BACKENDS[backend](root or settings.UPLOAD_DIR)
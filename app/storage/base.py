@@ -0,0 +1,38 @@
+from typing import AsyncIterator, Optional
+from fastapi import UploadFile
+from app.core.uploads import StoredFile, iter_upload
+
+class StorageBackend:
+    """Where uploaded submission files live.
+
+    Keys are relative, '/'-separated names such as
+    "submissions/12/thesis.pdf". save returns the StoredFile whose path and
+    sha256 are recorded on the submission and later passed back to delete.
+    """
+
+    name = "base"
+
+    async def save(self, file: UploadFile, key: str) -> StoredFile:
+        return await self.save_stream(iter_upload(file), key)
+
+    async def save_stream(self, chunks: AsyncIterator[bytes], key: str) -> StoredFile:
+        raise NotImplementedError
+
+    def delete(self, path: str, sha256: Optional[str] = None) -> None:
+        """Remove the stored file at path"""
+        raise NotImplementedError
+
+    def release(self, sha256: str) -> None:
+        """Drop a reference to content that was overwritten in place"""
+
+    def replace(self, previous_path: Optional[str], previous_sha256: Optional[str], stored: StoredFile) -> None:
+        """Clean up a submission's previous file after a new one was saved"""
+        if not previous_path:
+            return
+        if previous_path != stored.path:
+            self.delete(previous_path, previous_sha256)
+        elif previous_sha256 and previous_sha256 != stored.sha256:
+            self.release(previous_sha256)
+
+    def stats(self) -> dict:
+        return {"backend": self.name}
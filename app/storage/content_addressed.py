@@ -0,0 +1,100 @@
+import os
+import uuid
+from typing import AsyncIterator, Optional
+from starlette.concurrency import run_in_threadpool
+from app.core.uploads import StoredFile, save_stream
+from app.storage.base import StorageBackend
+
+class ContentAddressedStorage(StorageBackend):
+    """Deduplicating store keyed by SHA-256.
+
+    Bytes live once under <root>/blobs/ab/cd/<sha256>; every upload is a hard
+    link to its blob at <root>/<key>, so stored file paths stay ordinary
+    readable files. The blob's link count is its reference count and the
+    blob is removed with its last reference. Re-uploading known content
+    only adds a link; the streamed copy is discarded.
+    """
+
+    name = "content_addressed"
+
+    def __init__(self, root: str):
+        self.root = root
+        self.blob_root = os.path.join(root, "blobs")
+        self.incoming_root = os.path.join(root, ".incoming")
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.blob_root, sha256[:2], sha256[2:4], sha256)
+
+    def reference_count(self, sha256: str) -> int:
+        try:
+            return os.stat(self.blob_path(sha256)).st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    async def save_stream(self, chunks: AsyncIterator[bytes], key: str) -> StoredFile:
+        incoming = os.path.join(self.incoming_root, uuid.uuid4().hex)
+        stored = await save_stream(chunks, incoming)
+        destination = os.path.join(self.root, *key.split("/"))
+        await run_in_threadpool(self._link_reference, incoming, stored.sha256, destination)
+        return StoredFile(destination, stored.size, stored.sha256)
+
+    def delete(self, path: str, sha256: Optional[str] = None) -> None:
+        # Files stored before content addressing are plain files, not links to a blob
+        if sha256 is None or self._is_reference(path, sha256) or self._is_unlinked(path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        if sha256:
+            self.release(sha256)
+
+    def release(self, sha256: str) -> None:
+        blob = self.blob_path(sha256)
+        try:
+            if os.stat(blob).st_nlink <= 1:
+                os.remove(blob)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> dict:
+        blobs = 0
+        blob_bytes = 0
+        for directory, _, files in os.walk(self.blob_root):
+            for name in files:
+                blobs += 1
+                blob_bytes += os.path.getsize(os.path.join(directory, name))
+        return {"backend": self.name, "blobs": blobs, "blob_bytes": blob_bytes}
+
+    def _link_reference(self, incoming: str, sha256: str, destination: str) -> None:
+        blob = self.blob_path(sha256)
+        # Link under a temporary name first so the reference appears atomically
+        reference = f"{destination}.{uuid.uuid4().hex}.part"
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        try:
+            try:
+                os.link(blob, reference)
+                os.remove(incoming)
+            except FileNotFoundError:
+                # New content (or its blob was just collected): the upload becomes the blob
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                os.replace(incoming, blob)
+                os.link(blob, reference)
+            os.replace(reference, destination)
+        except BaseException:
+            for path in (incoming, reference):
+                if os.path.lexists(path):
+                    os.remove(path)
+            raise
+
+    @staticmethod
+    def _is_unlinked(path: str) -> bool:
+        try:
+            return os.stat(path).st_nlink == 1
+        except FileNotFoundError:
+            return False
+
+    def _is_reference(self, path: str, sha256: str) -> bool:
+        try:
+            return os.path.samefile(path, self.blob_path(sha256))
+        except FileNotFoundError:
+            return False
@@ -0,0 +1,21 @@
+import os
+from typing import AsyncIterator, Optional
+from app.core.uploads import StoredFile, save_stream
+from app.storage.base import StorageBackend
+
+class LocalStorage(StorageBackend):
+    """Stores each upload verbatim at <root>/<key>"""
+
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = root
+
+    async def save_stream(self, chunks: AsyncIterator[bytes], key: str) -> StoredFile:
+        return await save_stream(chunks, os.path.join(self.root, *key.split("/")))
+
+    def delete(self, path: str, sha256: Optional[str] = None) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,101 @@
+"""
+Notification delivery worker.
+
+Drains the notification outbox: API requests only insert PENDING rows, and
+this process claims due rows in batches (SELECT ... FOR UPDATE SKIP LOCKED,
+so several workers can run side by side), sends them and records the result.
+With NOTIFICATION_WORKER_IN_PROCESS the web app runs the same loop on a
+background thread instead.
+
+Usage:
+    python -m app.workers.notification_worker [--once] [--batch-size 50] [--poll-interval 5]
+"""
+import argparse
+import logging
+import signal
+import threading
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.smtp_pool import smtp_pool
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+class NotificationWorker:
+    """Polls the outbox and delivers pending notifications until stopped"""
+
+    def __init__(self, session_factory: Callable[[], Session], batch_size: int, poll_interval: float):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Run the poll loop on a daemon thread, for delivery inside the web process"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name="notification-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, *_args) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(5.0)
+            self._thread = None
+
+    def run_once(self) -> int:
+        """Deliver batches until the outbox has no due rows; returns rows processed"""
+        processed = 0
+        db = self.session_factory()
+        try:
+            while not self._stop_event.is_set():
+                result = NotificationService.deliver_pending_notifications(db, self.batch_size)
+                processed += result["claimed"]
+                if result["claimed"]:
+                    logger.info(f"Delivered {result['sent']} notifications, {result['failed']} failed")
+                if result["claimed"] < self.batch_size:
+                    break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return processed
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Notification delivery failed: {e}")
+            self._stop_event.wait(self.poll_interval)
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Deliver pending notifications")
+    parser.add_argument("--once", action="store_true", help="drain the outbox once and exit")
+    parser.add_argument("--batch-size", type=int, default=settings.NOTIFICATION_WORKER_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=settings.NOTIFICATION_WORKER_POLL_SECONDS)
+    args = parser.parse_args(argv)
+
+    from app.db.session import SessionLocal
+    logging.basicConfig(level=logging.INFO)
+    worker = NotificationWorker(SessionLocal, args.batch_size, args.poll_interval)
+
+    try:
+        if args.once:
+            logger.info(f"Processed {worker.run_once()} notifications")
+            return
+
+        signal.signal(signal.SIGTERM, worker.stop)
+        signal.signal(signal.SIGINT, worker.stop)
+        logger.info("Notification worker started")
+        worker.run()
+        logger.info("Notification worker stopped")
+    finally:
+        smtp_pool.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ReportService.get_department_dashboard
+
+Compares the previous five-COUNT implementation with the single-statement
+aggregate, reporting round trips and mean latency per call.
+
+Usage:
+    python benchmarks/bench_department_dashboard.py [--rows 20000] [--iterations 200]
+
+Runs against BENCH_DATABASE_URL when set, otherwise a throwaway SQLite file.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, and_
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.registration import Registration
+from app.models.submission import Submission, SubmissionStatus, SubmissionType
+from app.models.timeline import Timeline, TimelineStage
+from app.models.appraisal import Appraisal, AppraisalStatus
+from app.models.viva_team import VivaTeam, VivaStatus, VivaStage
+from app.services.report_service import ReportService
+
+
+def legacy_department_dashboard(db):
+    """The pre-aggregation implementation: one COUNT query per KPI"""
+    today = date.today()
+    return {
+        "active_students": db.query(Registration).filter(
+            Registration.registration_status.in_(["active", "enrolled"])
+        ).count(),
+        "pending_submissions": db.query(Submission).filter(
+            Submission.status.in_([SubmissionStatus.SUBMITTED, SubmissionStatus.UNDER_REVIEW])
+        ).count(),
+        "overdue_milestones": db.query(Timeline).filter(
+            and_(Timeline.status == "pending", Timeline.planned_date < today)
+        ).count(),
+        "pending_appraisals": db.query(Appraisal).filter(
+            Appraisal.status.in_([AppraisalStatus.PENDING, AppraisalStatus.STUDENT_SUBMITTED])
+        ).count(),
+        "pending_viva_teams": db.query(VivaTeam).filter(VivaTeam.status == VivaStatus.PROPOSED).count(),
+    }
+
+
+def seed(db, rows):
+    rng = random.Random(42)
+    today = date.today()
+    for i in range(rows):
+        student_number = f"B{i:08d}"
+        db.add(Registration(
+            student_number=student_number,
+            registration_status=rng.choice(["active", "enrolled", "completed", "withdrawn"])
+        ))
+        db.add(Submission(
+            student_number=student_number,
+            submission_type=rng.choice(list(SubmissionType)),
+            title=f"Submission {i}",
+            status=rng.choice(list(SubmissionStatus))
+        ))
+        db.add(Timeline(
+            student_number=student_number,
+            stage=rng.choice(list(TimelineStage)),
+            milestone_name="Milestone",
+            planned_date=today + timedelta(days=rng.randint(-365, 365)),
+            status=rng.choice(["pending", "completed"])
+        ))
+        db.add(Appraisal(
+            student_number=student_number,
+            academic_year="2024-25",
+            status=rng.choice(list(AppraisalStatus))
+        ))
+        if i % 4 == 0:
+            db.add(VivaTeam(
+                student_number=student_number,
+                stage=rng.choice(list(VivaStage)),
+                status=rng.choice(list(VivaStatus))
+            ))
+        if i % 1000 == 0:
+            db.flush()
+    db.commit()
+
+
+def measure(label, fn, db, engine, iterations):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    result = fn(db)
+    event.listen(engine, "before_cursor_execute", record)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(db)
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", record)
+
+    print(f"{label:<12} round trips/call: {len(statements) / iterations:>4.1f}   "
+          f"mean latency: {elapsed / iterations * 1000:8.3f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    tmpdir = None
+    if not url:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    try:
+        print(f"Seeding {args.rows} students on {engine.dialect.name}...")
+        seed(db, args.rows)
+
+        legacy = measure("five-query", legacy_department_dashboard, db, engine, args.iterations)
+        current = measure("aggregate", ReportService.get_department_dashboard, db, engine, args.iterations)
+        assert legacy == current, f"Payload mismatch: {legacy} != {current}"
+        print("Payloads identical:", current)
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+        if tmpdir:
+            tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark for response encoding of the largest payloads
+
+Seeds a SQLite database and takes what the route handlers produce for
+1000-row registration and viva team pages (rows with dates, datetimes and
+status enums) and for the report endpoints. It then times turning that
+into response bytes three ways:
+
+  json        FastAPI's response_model serialisation, then the stdlib
+              JSONResponse (the routes before orjson)
+  orjson      the same serialisation, then ORJSONResponse.render (routes
+              that still return plain objects)
+  direct      what these handlers do now: ORJSONResponse(report) for
+              reports, one TypeAdapter dump_json for pages (page_json)
+
+Usage:
+    python benchmarks/bench_json_encode.py [--students 5000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.core.responses import ORJSONResponse
+from app.core.serialization import list_adapter
+from app.models.registration import Registration
+from app.models.student import Student
+from app.models.submission import Submission, SubmissionStatus, SubmissionType
+from app.models.viva_team import VivaStage, VivaStatus, VivaTeam
+from app.schemas.registration import Registration as RegistrationSchema
+from app.schemas.viva_team import VivaTeam as VivaTeamSchema
+from app.services.report_service import ReportService
+
+PAGE_SIZE = 1000
+
+
+def seed(engine, count):
+    today = date(2025, 1, 6)
+    now = datetime(2025, 1, 6, 9, 30)
+    with engine.begin() as conn:
+        conn.execute(insert(Student), [
+            {"student_number": f"EH{i:07d}", "forename": "Student", "surname": f"Number{i}", "cohort": "2024",
+             "programme_of_study": f"PhD Programme {i % 12}", "mode": "Full-time"}
+            for i in range(count)
+        ])
+        conn.execute(insert(Registration), [
+            {"student_number": f"EH{i:07d}", "registration_status": "active" if i % 4 else "pending",
+             "original_registration_deadline": today + timedelta(days=i % 365),
+             "revised_registration_deadline": today + timedelta(days=30 + i % 365),
+             "created_date": now, "updated_date": now}
+            for i in range(count)
+        ])
+        conn.execute(insert(VivaTeam), [
+            {"student_number": f"EH{i:07d}", "stage": list(VivaStage)[i % 3], "status": list(VivaStatus)[i % 5],
+             "external_examiner_name": "Dr Examiner", "proposed_date": today + timedelta(days=i % 90),
+             "created_date": now, "updated_date": now}
+            for i in range(count)
+        ])
+        conn.execute(insert(Submission), [
+            {"student_number": f"EH{i:07d}", "submission_type": list(SubmissionType)[i % 5],
+             "title": f"Submission {i}", "status": list(SubmissionStatus)[i % 6],
+             "submission_date": now - timedelta(days=i % 200), "created_date": now, "updated_date": now}
+            for i in range(count)
+        ])
+
+
+def via_response_model(annotation, response_class):
+    """FastAPI's path for a returned object: validate against response_model, then render"""
+    field = create_model_field("Response_bench", annotation, mode="serialization")
+
+    def encode(value):
+        content = asyncio.run(serialize_response(field=field, response_content=value, is_coroutine=True))
+        return response_class(content).body
+    return encode
+
+
+def encoders(annotation, direct):
+    return (via_response_model(annotation, JSONResponse), via_response_model(annotation, ORJSONResponse), direct)
+
+
+def payloads(db) -> Dict[str, Any]:
+    registrations = db.query(Registration).order_by(Registration.registration_id).limit(PAGE_SIZE).all()
+    viva_teams = db.query(VivaTeam).order_by(VivaTeam.id).limit(PAGE_SIZE).all()
+    report = lambda content: ORJSONResponse(content).body
+    return {
+        "registrations page": (
+            [RegistrationSchema.model_validate(r) for r in registrations],
+            encoders(List[RegistrationSchema], list_adapter(RegistrationSchema).dump_json)),
+        "viva teams page": (
+            [VivaTeamSchema.model_validate(v) for v in viva_teams],
+            encoders(List[VivaTeamSchema], list_adapter(VivaTeamSchema).dump_json)),
+        "student overview": (ReportService.get_student_overview_report(db), encoders(Dict[str, Any], report)),
+        "submission analytics": (ReportService.get_submission_analytics(db), encoders(Dict[str, Any], report)),
+        "programme statistics": (ReportService.get_programme_statistics(db), encoders(Dict[str, Any], report)),
+        "department dashboard": (ReportService.get_department_dashboard(db), encoders(Dict[str, Any], report)),
+    }
+
+
+def best_of(render, content, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        seed(engine, args.students)
+        print(f"{'endpoint':<22} {'bytes':>9} {'json':>10} {'orjson':>10} {'direct':>10}  speedup")
+        for label, (content, (json_path, orjson_path, direct)) in payloads(db).items():
+            size = len(direct(content))
+            timings = [best_of(encode, content, args.repeat) for encode in (json_path, orjson_path, direct)]
+            print(f"{label:<22} {size:>9} " + " ".join(f"{us:>8.1f}us" for us in timings)
+                  + f"  {timings[0] / timings[2]:6.1f}x")
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
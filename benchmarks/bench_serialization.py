@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for list serialisation: per-row from_orm versus the column-select fast path
+
+Loads synthetic students into a SQLite database and times turning a full
+list of them into JSON bytes four ways:
+
+  orm+per-row       db.query(Student), from_orm per row, then FastAPI's
+                    response_model validation and JSON rendering (what the
+                    list routes did)
+  orm+adapter       entities validated in one TypeAdapter call, dumped directly
+  columns+per-row   select of the schema's columns, from_orm per row, FastAPI path
+  columns+adapter   select of the schema's columns, one TypeAdapter call,
+                    dump_json straight to bytes (the new path)
+
+Usage:
+    python benchmarks/bench_serialization.py [--students 10000] [--repeat 5]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models.student import Student
+from app.schemas.student import Student as StudentSchema
+from app.core.serialization import list_adapter, schema_columns, validate_rows
+
+RESPONSE_FIELD = create_model_field("Response_students", List[StudentSchema], mode="serialization")
+
+
+def seed(engine, count):
+    with engine.begin() as conn:
+        conn.execute(insert(Student), [
+            {
+                "student_number": f"EH{i:07d}", "forename": "Student", "surname": f"Number{i}",
+                "cohort": "2024", "programme_of_study": "PhD Computer Science", "mode": "Full-time",
+                "student_notes": "Synthetic benchmark row",
+            }
+            for i in range(count)
+        ])
+
+
+def fastapi_render(items):
+    """What FastAPI does with a list returned from a route with response_model"""
+    content = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=items, is_coroutine=True))
+    return JSONResponse(content).body
+
+
+def orm_per_row(db):
+    return fastapi_render([StudentSchema.model_validate(student) for student in db.query(Student).all()])
+
+
+def orm_adapter(db):
+    return list_adapter(StudentSchema).dump_json(validate_rows(StudentSchema, db.query(Student).all()))
+
+
+def columns_per_row(db):
+    rows = db.query(*schema_columns(Student, StudentSchema)).all()
+    return fastapi_render([StudentSchema.model_validate(row) for row in rows])
+
+
+def columns_adapter(db):
+    rows = db.query(*schema_columns(Student, StudentSchema)).all()
+    return list_adapter(StudentSchema).dump_json(validate_rows(StudentSchema, rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    try:
+        seed(engine, args.students)
+        baseline = None
+        for label, fn in [("orm+per-row", orm_per_row), ("orm+adapter", orm_adapter),
+                          ("columns+per-row", columns_per_row), ("columns+adapter", columns_adapter)]:
+            timings = []
+            for _ in range(args.repeat):
+                db = factory()
+                start = time.perf_counter()
+                body = fn(db)
+                timings.append(time.perf_counter() - start)
+                db.close()
+            best = min(timings) * 1000
+            baseline = baseline or best
+            print(f"{label:<17} {best:8.1f} ms  {baseline / best:5.2f}x  ({len(body) / 1e6:.1f} MB)")
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
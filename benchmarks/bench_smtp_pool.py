@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pooled SMTP delivery
+
+Sends the same messages to a local stand-in SMTP server twice: once with a
+new connection and login per message (the previous behaviour) and once
+through SMTPConnectionPool.send_batch, reporting messages/sec for each.
+
+Usage:
+    python benchmarks/bench_smtp_pool.py [--messages 500] [--batch-size 50] [--handshake-ms 20]
+
+--handshake-ms delays every new session to approximate TCP/TLS setup
+against a remote server; use 0 for raw loopback numbers.
+"""
+import argparse
+import os
+import smtplib
+import sys
+import time
+from email.message import EmailMessage
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.smtp_pool import SMTPConnectionPool
+from tests.smtp_stub import StubSMTPServer
+
+
+def build_messages(count):
+    messages = []
+    for i in range(count):
+        message = EmailMessage()
+        message["From"] = "pgr@edgehill.ac.uk"
+        message["To"] = f"student{i}@edgehill.ac.uk"
+        message["Subject"] = "Appraisal Due Soon"
+        message.set_content("Your appraisal is due soon. Please complete it as soon as possible.")
+        messages.append(message)
+    return messages
+
+
+def send_per_message(port, messages):
+    for message in messages:
+        with smtplib.SMTP("127.0.0.1", port) as server:
+            server.login("pgr@edgehill.ac.uk", "secret")
+            server.send_message(message)
+
+
+def send_pooled(port, messages, batch_size):
+    pool = SMTPConnectionPool("127.0.0.1", port, "pgr@edgehill.ac.uk", "secret", use_tls=False)
+    try:
+        for start in range(0, len(messages), batch_size):
+            errors = pool.send_batch(messages[start:start + batch_size])
+            assert not any(errors), errors
+    finally:
+        pool.close()
+
+
+def measure(label, stub, fn):
+    stub.messages.clear()
+    stub.sessions = 0
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    sent = len(stub.messages)
+    print(f"{label:<12} {sent:>6} messages  {stub.sessions:>5} sessions  {sent / elapsed:10.1f} messages/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--handshake-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    stub = StubSMTPServer(handshake_delay=args.handshake_ms / 1000).start()
+    messages = build_messages(args.messages)
+    try:
+        measure("per-message", stub, lambda: send_per_message(stub.port, messages))
+        measure("pooled", stub, lambda: send_pooled(stub.port, messages, args.batch_size))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the in-memory typeahead index
+
+Loads synthetic students into a SQLite database, then compares per-keystroke
+lookups against the database search (StudentService.search_students) with
+lookups against TypeaheadIndex, with and without its per-query result
+cache, reporting the mean latency of each. Short prefixes such as "ma"
+match thousands of rows and dominate the uncached figure.
+
+Usage:
+    python benchmarks/bench_typeahead.py [--students 20000] [--lookups 500]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models.student import Student
+from app.core.typeahead import TypeaheadIndex
+from app.services.student_service import StudentService
+
+FORENAMES = ["Mary", "Mark", "Marion", "Priya", "Tom", "Ann", "Joe", "Aisha", "Liam", "Chen", "Olga", "Sam"]
+SURNAMES = ["Smith", "Smithson", "Goldsmith", "Patel", "Evans", "Marshall", "Nguyen", "Kowalski", "Turner", "Okafor"]
+
+
+def seed(db, count):
+    rng = random.Random(1)
+    db.add_all([
+        Student(
+            student_number=f"EH{i:07d}",
+            forename=rng.choice(FORENAMES),
+            surname=f"{rng.choice(SURNAMES)}{rng.randint(0, 999)}",
+            programme_of_study="PhD"
+        )
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def keystrokes(count):
+    rng = random.Random(2)
+    queries = []
+    while len(queries) < count:
+        name = f"{rng.choice(FORENAMES)} {rng.choice(SURNAMES)}"
+        queries.extend(name[:length] for length in range(2, len(name) + 1))
+    return queries[:count]
+
+
+def measure(label, queries, fn):
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {len(queries):>6} lookups  {elapsed / len(queries) * 1e6:10.1f} us/lookup")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        seed(db, args.students)
+        index = TypeaheadIndex()
+        start = time.perf_counter()
+        index.build(db)
+        print(f"built index over {args.students} students in {time.perf_counter() - start:.2f}s")
+
+        queries = keystrokes(args.lookups)
+        measure("database", queries, lambda query: StudentService.search_students(db, query, limit=10))
+        index.max_cached_queries = 0
+        measure("uncached", queries, lambda query: index.search(query, ["student"], limit=10))
+        index.max_cached_queries = 1024
+        measure("cached", queries, lambda query: index.search(query, ["student"], limit=10))
+    finally:
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
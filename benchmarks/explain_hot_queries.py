@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Query plans for the hot filter queries, before and after the filter indexes
+
+Seeds a scratch database with synthetic students, notifications, timelines,
+submissions, appraisals, registrations, viva teams and supervisor
+assignments, then runs each hot query shape from the services with the
+indexes from the add_hot_filter_indexes migration dropped and again with
+them created, printing the plan and mean latency for both.
+
+Usage:
+    python benchmarks/explain_hot_queries.py [--students 2000] [--repeat 20]
+
+Set DATABASE_URL to a disposable PostgreSQL database to see PostgreSQL
+plans (EXPLAIN ANALYZE); its tables are dropped and recreated. The default
+is a temporary SQLite file (EXPLAIN QUERY PLAN).
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "explain.db"))
+
+from sqlalchemy import func, insert, select
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.models.student import Student
+from app.models.supervisor import Supervisor
+from app.models.user import User
+from app.models.notification import Notification, NotificationStatus, NotificationType
+from app.models.timeline import Timeline, TimelineStage
+from app.models.submission import Submission, SubmissionStatus, SubmissionType
+from app.models.appraisal import Appraisal, AppraisalStatus
+from app.models.registration import Registration
+from app.models.viva_team import VivaTeam, VivaStage, VivaStatus
+from app.models.student_supervisor import StudentSupervisor
+
+# Indexes added by the add_hot_filter_indexes migration
+HOT_INDEXES = {
+    "ix_submissions_student_number_id", "ix_submissions_status_id", "ix_submissions_type_status",
+    "ix_submissions_submission_date", "ix_timelines_student_number_id", "ix_timelines_status_planned_date",
+    "ix_viva_teams_student_number_id", "ix_viva_teams_status_id", "ix_appraisals_student_number_id",
+    "ix_appraisals_academic_year_status", "ix_appraisals_status", "ix_notifications_user_created",
+    "ix_notifications_status_scheduled", "ix_registrations_student_number", "ix_registrations_status_id",
+    "ix_student_supervisors_student_number", "ix_student_supervisors_supervisor_id",
+}
+
+
+def hot_indexes():
+    return [index for table in Base.metadata.sorted_tables for index in table.indexes if index.name in HOT_INDEXES]
+
+
+def seed(conn, students):
+    rng = random.Random(1)
+    today = date.today()
+    now = datetime.utcnow()
+    numbers = [f"EH{i:07d}" for i in range(students)]
+
+    conn.execute(insert(Student), [
+        {"student_number": number, "forename": "Student", "surname": number, "programme_of_study": "PhD"}
+        for number in numbers
+    ])
+    conn.execute(insert(Supervisor), [
+        {"supervisor_id": i + 1, "supervisor_name": f"Supervisor {i}", "email": f"sup{i}@edgehill.ac.uk"}
+        for i in range(max(students // 20, 1))
+    ])
+    conn.execute(insert(User), [
+        {"id": i + 1, "username": f"user{i}", "email": f"user{i}@edgehill.ac.uk", "hashed_password": "x"}
+        for i in range(students)
+    ])
+    conn.execute(insert(Notification), [
+        {
+            "user_id": rng.randint(1, students), "type": NotificationType.EMAIL, "title": "Reminder",
+            "message": "Reminder", "action_type": "appraisal_due", "status": rng.choice(list(NotificationStatus)),
+            "scheduled_at": now - timedelta(minutes=rng.randint(-600, 60 * 24 * 90)),
+            "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+        }
+        for _ in range(students * 25)
+    ])
+    conn.execute(insert(Timeline), [
+        {
+            "student_number": rng.choice(numbers), "stage": rng.choice(list(TimelineStage)),
+            "milestone_name": "Milestone", "planned_date": today + timedelta(days=rng.randint(-700, 700)),
+            "status": rng.choice(["pending", "completed", "completed", "completed"]),
+        }
+        for _ in range(students * 8)
+    ])
+    conn.execute(insert(Submission), [
+        {
+            "student_number": rng.choice(numbers), "submission_type": rng.choice(list(SubmissionType)),
+            "title": "Chapter", "status": rng.choice(list(SubmissionStatus)),
+            "submission_date": now - timedelta(days=rng.randint(0, 1000)),
+        }
+        for _ in range(students * 5)
+    ])
+    conn.execute(insert(Appraisal), [
+        {
+            "student_number": rng.choice(numbers), "academic_year": f"20{rng.randint(18, 25)}/{rng.randint(19, 26)}",
+            "status": rng.choice(list(AppraisalStatus)),
+        }
+        for _ in range(students * 3)
+    ])
+    conn.execute(insert(Registration), [
+        {"student_number": number, "registration_status": rng.choice(["active", "enrolled", "completed", "withdrawn"])}
+        for number in numbers
+    ])
+    conn.execute(insert(VivaTeam), [
+        {"student_number": rng.choice(numbers), "stage": rng.choice(list(VivaStage)), "status": rng.choice(list(VivaStatus))}
+        for _ in range(students)
+    ])
+    conn.execute(insert(StudentSupervisor), [
+        {"student_number": number, "supervisor_id": rng.randint(1, max(students // 20, 1)), "role": "Supervisor"}
+        for number in numbers
+    ])
+
+
+def hot_queries(students):
+    today = date.today()
+    return {
+        "notification inbox (user, newest first)": select(Notification).where(
+            Notification.user_id == students // 2
+        ).order_by(Notification.created_at.desc(), Notification.id.desc()).limit(20),
+        "notification worker claim": select(Notification).where(
+            Notification.status == NotificationStatus.PENDING, Notification.scheduled_at <= datetime.utcnow()
+        ).order_by(Notification.scheduled_at, Notification.id).limit(100),
+        "overdue milestones": select(Timeline).where(
+            Timeline.status == "pending", Timeline.planned_date < today
+        ),
+        "upcoming milestone count": select(func.count()).select_from(Timeline).where(
+            Timeline.status == "pending", Timeline.planned_date >= today,
+            Timeline.planned_date <= today + timedelta(days=7)
+        ),
+        "student's submissions": select(Submission).where(
+            Submission.student_number == "EH0000042"
+        ).order_by(Submission.id).limit(100),
+        "pending submissions": select(Submission).where(
+            Submission.status == SubmissionStatus.SUBMITTED
+        ).order_by(Submission.id).limit(100),
+        "submissions this week": select(func.count()).select_from(Submission).where(
+            Submission.submission_date >= datetime.utcnow() - timedelta(days=7)
+        ),
+        "appraisal completion by year": select(
+            Appraisal.status, Appraisal.appraisal_period, func.count(Appraisal.id)
+        ).where(Appraisal.academic_year == "2024/25").group_by(Appraisal.status, Appraisal.appraisal_period),
+        "student's registration": select(Registration).where(Registration.student_number == "EH0000042"),
+        "student's viva teams": select(VivaTeam).where(
+            VivaTeam.student_number == "EH0000042"
+        ).order_by(VivaTeam.id).limit(100),
+        "supervisor's students": select(StudentSupervisor).where(StudentSupervisor.supervisor_id == 3),
+    }
+
+
+def explain(conn, statement):
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "postgresql":
+        rows = conn.exec_driver_sql("EXPLAIN ANALYZE " + sql).fetchall()
+        return [row[0] for row in rows]
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).fetchall()
+    return [row[-1] for row in rows]
+
+
+def timed(conn, statement, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(statement).fetchall()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(conn, queries, repeat):
+    results = {}
+    for label, statement in queries.items():
+        results[label] = (explain(conn, statement), timed(conn, statement, repeat))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    queries = hot_queries(args.students)
+    try:
+        with engine.begin() as conn:
+            seed(conn, args.students)
+
+        with engine.begin() as conn:
+            for index in hot_indexes():
+                index.drop(conn)
+            if conn.dialect.name == "postgresql":
+                conn.exec_driver_sql("ANALYZE")
+        with engine.connect() as conn:
+            before = run(conn, queries, args.repeat)
+
+        with engine.begin() as conn:
+            for index in hot_indexes():
+                index.create(conn)
+            conn.exec_driver_sql("ANALYZE")
+        with engine.connect() as conn:
+            after = run(conn, queries, args.repeat)
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+    for label in queries:
+        (plan_before, ms_before), (plan_after, ms_after) = before[label], after[label]
+        print(f"== {label}: {ms_before:.2f} ms -> {ms_after:.2f} ms")
+        print("   before: " + "\n           ".join(plan_before))
+        print("   after:  " + "\n           ".join(plan_after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Load test: throughput of the production server as the worker count grows
+
+Migrates and seeds a scratch database, then for each worker count starts
+gunicorn with gunicorn.conf.py (WEB_CONCURRENCY set to that count) and
+drives an authenticated, database-backed sync endpoint
+(GET /api/v1/students/) with concurrent keep-alive clients for a fixed
+duration, printing requests per second and latency percentiles.
+
+Usage:
+    python benchmarks/load_test.py [--workers 1,2,4] [--concurrency 64] [--duration 15]
+
+Set DATABASE_URL to a disposable PostgreSQL database for realistic numbers;
+SQLite (the default, a temporary file) serialises writers but handles this
+read-only load. Throughput only scales while there are free CPUs, so run
+the load generator on a separate machine when measuring many workers.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "load.db"))
+
+import httpx
+from sqlalchemy.orm import sessionmaker
+from app.db import migrations
+from app.db.session import create_db_engine
+from app.models.student import Student
+from app.models.user import User
+from app.core.security import get_password_hash
+
+USERNAME, PASSWORD = "loadtest", "LoadTest123!"
+
+
+def seed(students):
+    engine = create_db_engine(os.environ["DATABASE_URL"])
+    db = sessionmaker(bind=engine)()
+    try:
+        db.add(User(username=USERNAME, email="loadtest@edgehill.ac.uk", role="system_admin",
+                    hashed_password=get_password_hash(PASSWORD), is_active=True))
+        db.add_all([
+            Student(student_number=f"EH{i:07d}", forename="Student", surname=f"Load{i}", programme_of_study="PhD")
+            for i in range(students)
+        ])
+        db.commit()
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def start_server(workers, port):
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(port), HOST="127.0.0.1",
+               TYPEAHEAD_REBUILD_SECONDS="0", REPORT_SNAPSHOT_REFRESH_SECONDS="0")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "app.main:app", "-c", "gunicorn.conf.py", "--access-logfile", "/dev/null"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(base_url + "/health").status_code == 200:
+                return server, base_url
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("server did not start")
+
+
+async def drive(base_url, concurrency, duration):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        token = (await client.post("/api/v1/auth/token", json={"username": USERNAME, "password": PASSWORD})).json()
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+        latencies, errors = [], 0
+        stop_at = time.perf_counter() + duration
+
+        async def user():
+            nonlocal errors
+            while time.perf_counter() < stop_at:
+                start = time.perf_counter()
+                response = await client.get("/api/v1/students/", params={"limit": 20}, headers=headers)
+                latencies.append(time.perf_counter() - start)
+                errors += response.status_code != 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return latencies, errors, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    migrations.upgrade()
+    seed(args.students)
+
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for workers in [int(count) for count in args.workers.split(",")]:
+        server, base_url = start_server(workers, args.port)
+        try:
+            latencies, errors, elapsed = asyncio.run(drive(base_url, args.concurrency, args.duration))
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"{workers:>7} {len(latencies) / elapsed:>9.1f} {cuts[49] * 1000:>8.1f} {cuts[98] * 1000:>8.1f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
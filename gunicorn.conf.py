@@ -0,0 +1,71 @@
+"""
+Gunicorn settings for production
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+Gunicorn reads this file automatically when started from the project root.
+Sizing and timeouts come from app.core.config (see .env.example). Apply
+migrations with `python -m app.cli migrate` before starting; workers only
+check the schema revision.
+"""
+import os
+from app.core.config import settings
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity and a cgroup v2 quota"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def worker_count() -> int:
+    """One event-loop worker per CPU, at least two, capped to bound database connections"""
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+    return max(2, min(available_cpus(), settings.WEB_CONCURRENCY_MAX))
+
+
+bind = f"{settings.HOST}:{settings.PORT}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = worker_count()
+
+# Import the app once in the master so workers fork ready to serve. Nothing
+# connects at import (the engine is created lazily); post_fork drops any
+# engine the master did create so workers never share pooled connections.
+preload_app = True
+
+timeout = settings.WORKER_TIMEOUT_SECONDS
+graceful_timeout = settings.GRACEFUL_TIMEOUT_SECONDS
+keepalive = settings.KEEPALIVE_SECONDS
+
+# Recycle workers periodically; the jitter keeps them from restarting together
+max_requests = settings.MAX_REQUESTS
+max_requests_jitter = settings.MAX_REQUESTS_JITTER
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    pool = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    server.log.info(
+        f"{workers} workers, {settings.THREADPOOL_SIZE} threads each, "
+        f"up to {workers * pool} database connections"
+    )
+
+
+def post_fork(server, worker):
+    from app.db.session import dispose_engine
+    from app.db.async_session import reset_async_engine
+    dispose_engine(close=False)
+    reset_async_engine()
@@ -0,0 +1,229 @@
+-- The schema Base.metadata.create_all built on SQLite before migrations were
+-- introduced, for testing the stamp-then-upgrade path of existing databases.
+
+CREATE TABLE users (
+	id INTEGER NOT NULL,
+	username VARCHAR(100) NOT NULL,
+	email VARCHAR(100) NOT NULL,
+	hashed_password VARCHAR(255) NOT NULL,
+	role VARCHAR(50) NOT NULL,
+	is_active BOOLEAN,
+	is_verified BOOLEAN,
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	first_name VARCHAR(100),
+	last_name VARCHAR(100),
+	department VARCHAR(100),
+	phone_number VARCHAR(20),
+	PRIMARY KEY (id)
+);
+
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+
+CREATE INDEX ix_users_id ON users (id);
+
+CREATE TABLE students (
+	student_number VARCHAR(20) NOT NULL,
+	forename VARCHAR(100) NOT NULL,
+	surname VARCHAR(100) NOT NULL,
+	cohort VARCHAR(50),
+	course_code VARCHAR(20),
+	quercus_course_name VARCHAR(200),
+	subject_area VARCHAR(100),
+	programme_of_study VARCHAR(200),
+	mode VARCHAR(50),
+	international_student BOOLEAN,
+	previous_ehu_student BOOLEAN,
+	previous_ehu_undergraduate BOOLEAN,
+	previous_ehu_pgt_student BOOLEAN,
+	previous_ehu_mres_student BOOLEAN,
+	previous_institution VARCHAR(200),
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	student_notes TEXT,
+	PRIMARY KEY (student_number)
+);
+
+CREATE INDEX ix_students_student_number ON students (student_number);
+
+CREATE TABLE supervisors (
+	supervisor_id INTEGER NOT NULL,
+	supervisor_name VARCHAR(150) NOT NULL,
+	email VARCHAR(100),
+	department VARCHAR(100),
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	supervisor_notes TEXT,
+	PRIMARY KEY (supervisor_id)
+);
+
+CREATE INDEX ix_supervisors_supervisor_id ON supervisors (supervisor_id);
+
+CREATE TABLE notifications (
+	id INTEGER NOT NULL,
+	user_id INTEGER NOT NULL,
+	type VARCHAR(6) NOT NULL,
+	title VARCHAR(255) NOT NULL,
+	message TEXT NOT NULL,
+	action_type VARCHAR(100) NOT NULL,
+	related_entity_type VARCHAR(50),
+	related_entity_id INTEGER,
+	priority VARCHAR(6),
+	status VARCHAR(9),
+	recipient_email VARCHAR(255),
+	recipient_phone VARCHAR(20),
+	scheduled_at DATETIME,
+	sent_at DATETIME,
+	delivered_at DATETIME,
+	error_message TEXT,
+	retry_count INTEGER,
+	max_retries INTEGER,
+	extra_data TEXT,
+	created_at DATETIME,
+	updated_at DATETIME,
+	PRIMARY KEY (id),
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE INDEX ix_notifications_id ON notifications (id);
+
+CREATE TABLE student_supervisors (
+	student_supervisor_id INTEGER NOT NULL,
+	student_number VARCHAR(20) NOT NULL,
+	supervisor_id INTEGER NOT NULL,
+	role VARCHAR(50) NOT NULL,
+	start_date DATE,
+	end_date DATE,
+	supervision_notes TEXT,
+	PRIMARY KEY (student_supervisor_id),
+	FOREIGN KEY(student_number) REFERENCES students (student_number),
+	FOREIGN KEY(supervisor_id) REFERENCES supervisors (supervisor_id)
+);
+
+CREATE INDEX ix_student_supervisors_student_supervisor_id ON student_supervisors (student_supervisor_id);
+
+CREATE TABLE registrations (
+	registration_id INTEGER NOT NULL,
+	student_number VARCHAR(20) NOT NULL,
+	registration_status VARCHAR(50),
+	original_registration_deadline DATE,
+	registration_extension_request_date DATE,
+	date_of_registration_extension_approval DATE,
+	registration_extension_length_days INTEGER,
+	revised_registration_deadline DATE,
+	date_pgr_moved_to_new_blackboard_group DATE,
+	pgr_registration_process_completed BOOLEAN,
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	PRIMARY KEY (registration_id),
+	FOREIGN KEY(student_number) REFERENCES students (student_number)
+);
+
+CREATE INDEX ix_registrations_registration_id ON registrations (registration_id);
+
+CREATE TABLE submissions (
+	id INTEGER NOT NULL,
+	student_number VARCHAR(20) NOT NULL,
+	submission_type VARCHAR(13) NOT NULL,
+	title VARCHAR(200) NOT NULL,
+	description TEXT,
+	file_path VARCHAR(500),
+	file_name VARCHAR(200),
+	file_size INTEGER,
+	mime_type VARCHAR(100),
+	status VARCHAR(17),
+	submission_date DATETIME,
+	review_deadline DATE,
+	reviewed_by INTEGER,
+	review_date DATETIME,
+	review_comments TEXT,
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	PRIMARY KEY (id),
+	FOREIGN KEY(student_number) REFERENCES students (student_number),
+	FOREIGN KEY(reviewed_by) REFERENCES users (id)
+);
+
+CREATE INDEX ix_submissions_id ON submissions (id);
+
+CREATE TABLE timelines (
+	id INTEGER NOT NULL,
+	student_number VARCHAR(20) NOT NULL,
+	stage VARCHAR(11) NOT NULL,
+	milestone_name VARCHAR(100) NOT NULL,
+	planned_date DATE,
+	actual_date DATE,
+	status VARCHAR(50),
+	description TEXT,
+	notes TEXT,
+	PRIMARY KEY (id),
+	FOREIGN KEY(student_number) REFERENCES students (student_number)
+);
+
+CREATE INDEX ix_timelines_id ON timelines (id);
+
+CREATE TABLE appraisals (
+	id INTEGER NOT NULL,
+	student_number VARCHAR(20) NOT NULL,
+	academic_year VARCHAR(10) NOT NULL,
+	appraisal_period VARCHAR(50),
+	due_date DATE,
+	student_submission_date DATETIME,
+	dos_submission_date DATETIME,
+	review_date DATETIME,
+	student_progress_report TEXT,
+	student_achievements TEXT,
+	student_challenges TEXT,
+	student_goals TEXT,
+	student_development_needs TEXT,
+	dos_comments TEXT,
+	dos_progress_rating VARCHAR(20),
+	dos_recommendations TEXT,
+	status VARCHAR(21),
+	reviewer_id INTEGER,
+	reviewer_comments TEXT,
+	approved_by INTEGER,
+	action_required BOOLEAN,
+	action_description TEXT,
+	action_deadline DATE,
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	PRIMARY KEY (id),
+	FOREIGN KEY(student_number) REFERENCES students (student_number),
+	FOREIGN KEY(reviewer_id) REFERENCES users (id),
+	FOREIGN KEY(approved_by) REFERENCES users (id)
+);
+
+CREATE INDEX ix_appraisals_id ON appraisals (id);
+
+CREATE TABLE viva_teams (
+	id INTEGER NOT NULL,
+	student_number VARCHAR(20) NOT NULL,
+	stage VARCHAR(12) NOT NULL,
+	status VARCHAR(9),
+	internal_examiner_1_id INTEGER,
+	internal_examiner_2_id INTEGER,
+	external_examiner_name VARCHAR(150),
+	external_examiner_email VARCHAR(100),
+	external_examiner_institution VARCHAR(200),
+	proposed_date DATE,
+	scheduled_date DATE,
+	actual_date DATE,
+	location VARCHAR(200),
+	outcome VARCHAR(50),
+	outcome_notes TEXT,
+	proposed_by INTEGER,
+	approved_by INTEGER,
+	approval_date DATETIME,
+	created_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_date DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	PRIMARY KEY (id),
+	FOREIGN KEY(student_number) REFERENCES students (student_number),
+	FOREIGN KEY(internal_examiner_1_id) REFERENCES supervisors (supervisor_id),
+	FOREIGN KEY(internal_examiner_2_id) REFERENCES supervisors (supervisor_id),
+	FOREIGN KEY(proposed_by) REFERENCES users (id),
+	FOREIGN KEY(approved_by) REFERENCES users (id)
+);
+
+CREATE INDEX ix_viva_teams_id ON viva_teams (id);
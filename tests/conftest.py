@@ -7,31 +7,42 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine
+# The test schema is created from the models below, not by migrations
+os.environ.setdefault("SCHEMA_REVISION_CHECK", "off")
+# Tests drive delivery themselves; no background worker polling the test database
+os.environ.setdefault("NOTIFICATION_WORKER_IN_PROCESS", "False")
+
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, create_db_engine
 from app.main import app
+from app.core.principal_cache import principal_cache
+from app.core.typeahead import typeahead_index
 
 os.environ["JWT_SECRET_KEY"] = "test-secret-key-for-testing-edgehill"
 os.environ["JWT_ALGORITHM"] = "HS256"
 
 TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL") or os.getenv("DATABASE_URL")
 
+@pytest.fixture(scope="session")
+def engine():
+    """One pooled engine shared by the whole test session"""
+    test_engine = create_db_engine(TEST_DATABASE_URL)
+    yield test_engine
+    test_engine.dispose()
+
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_db():
+def setup_test_db(engine):
     """Set up test database once per session"""
-    engine = create_engine(TEST_DATABASE_URL)
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 @pytest.fixture
-def db_session():
-    engine = create_engine(TEST_DATABASE_URL)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def db_session(engine):
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
     
     connection = engine.connect()
     transaction = connection.begin()
@@ -52,8 +63,12 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    # Each test rolls its users back, so cached principals must not leak between tests
+    principal_cache.clear()
     
     with TestClient(app) as test_client:
         yield test_client
 
     app.dependency_overrides.clear()
+    principal_cache.clear()
+    typeahead_index.clear()
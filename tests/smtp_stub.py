@@ -0,0 +1,111 @@
+"""Minimal in-process SMTP server for tests and benchmarks.
+
+Speaks enough ESMTP for smtplib (EHLO, AUTH PLAIN/LOGIN, MAIL, RCPT, DATA,
+RSET, NOOP, QUIT), accepts any credentials and keeps received messages in
+memory. `handshake_delay` adds a pause to every new session's greeting to
+stand in for TCP/TLS setup against a remote server, and
+`max_messages_per_session` makes the server drop the connection after that
+many messages, as real servers do. After `max_sessions` sessions new
+connections are turned away with 421.
+"""
+import socketserver
+import threading
+import time
+from typing import List, Optional
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.sessions += 1
+            refused = bool(server.max_sessions) and server.sessions > server.max_sessions
+        if refused:
+            self._reply("421 Too many connections")
+            return
+        if server.handshake_delay:
+            time.sleep(server.handshake_delay)
+        self._reply("220 stub ESMTP")
+        received = 0
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb == "EHLO":
+                self._reply("250-stub", "250-AUTH PLAIN LOGIN", "250 8BITMIME")
+            elif verb == "HELO":
+                self._reply("250 stub")
+            elif verb == "AUTH":
+                self._auth(command)
+            elif verb in ("MAIL", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                if any(rejected in command for rejected in server.rejected_recipients):
+                    self._reply("550 No such user")
+                else:
+                    self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self._read_data()
+                self._reply("250 OK queued")
+                received += 1
+                if server.max_messages_per_session and received >= server.max_messages_per_session:
+                    return
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _auth(self, command: str):
+        parts = command.split()
+        # Credentials not sent with the command are prompted for (one for PLAIN, two for LOGIN)
+        if len(parts) == 2:
+            for _ in range(1 if parts[1].upper() == "PLAIN" else 2):
+                self._reply("334 ")
+                self.rfile.readline()
+        self._reply("235 Authentication successful")
+
+    def _read_data(self):
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            lines.append(line)
+        with self.server.lock:
+            self.server.messages.append(b"".join(lines))
+
+    def _reply(self, *lines: str):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode("ascii"))
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, handshake_delay: float = 0.0):
+        super().__init__((host, port), _SMTPHandler)
+        self.handshake_delay = handshake_delay
+        self.max_messages_per_session = 0
+        self.max_sessions = 0
+        self.rejected_recipients: List[str] = []
+        self.messages: List[bytes] = []
+        self.sessions = 0
+        self.lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "StubSMTPServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="smtp-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
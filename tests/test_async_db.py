@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from app.api import notifications, reports, students, submissions
+from app.db.base import Base
+from app.db.session import create_db_engine
+from app.db.async_session import async_database_url, create_async_db_engine, get_async_db
+from app.models.registration import Registration
+from app.models.notification import Notification, NotificationStatus, NotificationType
+from app.models.student import Student
+from app.models.submission import Submission, SubmissionType
+from app.models.user import User
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token
+
+pytest.importorskip("aiosqlite")
+
+# The test database is shared through an outer transaction on a sync
+# connection, which an async connection cannot see, so these tests use their
+# own SQLite file with committed rows.
+
+@pytest.fixture
+def async_api(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_db_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    async_engine = create_async_db_engine(url, poolclass=NullPool)
+    sessions = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with sessions() as db:
+            yield db
+
+    test_app = FastAPI()
+    test_app.include_router(students.async_router, prefix="/api/v1/students")
+    test_app.include_router(submissions.async_router, prefix="/api/v1/submissions")
+    test_app.include_router(notifications.async_router, prefix="/api/v1/notifications")
+    test_app.include_router(reports.async_router, prefix="/api/v1/reports")
+    test_app.dependency_overrides[get_async_db] = override_get_async_db
+    principal_cache.clear()
+
+    db = sessionmaker(bind=sync_engine)()
+    with TestClient(test_app) as client:
+        yield client, db
+    db.close()
+    principal_cache.clear()
+    sync_engine.dispose()
+
+def _login(db, username, role):
+    user = User(username=username, email=f"{username}@edgehill.ac.uk", hashed_password="x", role=role)
+    db.add(user)
+    db.commit()
+    return user, {"Authorization": f"Bearer {create_access_token({'sub': username})}"}
+
+def _students(db, count):
+    db.add_all([
+        Student(student_number=f"ASYNC{i:03d}", forename="Async", surname=f"Student{i}", programme_of_study="PhD")
+        for i in range(count)
+    ])
+    db.commit()
+
+def test_async_database_url_swaps_drivers():
+    url = async_database_url("postgresql+psycopg2://user:secret@db/edgehill?sslmode=require")
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.query == {"ssl": "require"}
+    assert async_database_url("sqlite:///./test.db").drivername == "sqlite+aiosqlite"
+
+def test_async_students_pages_and_search(async_api):
+    client, db = async_api
+    _students(db, 5)
+    _, headers = _login(db, "async_admin", "system_admin")
+
+    first = client.get("/api/v1/students/?limit=3&with_total=true", headers=headers)
+    assert first.status_code == 200
+    assert [s["student_number"] for s in first.json()] == ["ASYNC000", "ASYNC001", "ASYNC002"]
+    assert first.headers["X-Total-Count"] == "5"
+
+    rest = client.get(f"/api/v1/students/?limit=3&cursor={first.headers['X-Next-Cursor']}", headers=headers)
+    assert [s["student_number"] for s in rest.json()] == ["ASYNC003", "ASYNC004"]
+    assert "X-Next-Cursor" not in rest.headers
+
+    found = client.get("/api/v1/students/?search=ASYNC003", headers=headers)
+    assert [s["student_number"] for s in found.json()] == ["ASYNC003"]
+
+    streamed = client.get("/api/v1/students/?stream=true", headers=headers)
+    assert len(streamed.json()) == 5
+
+def test_async_routes_keep_authorization(async_api):
+    client, db = async_api
+    _students(db, 2)
+    _, headers = _login(db, "ASYNC000", "student")
+    db.add_all([
+        Submission(student_number="ASYNC000", submission_type=SubmissionType.THESIS, title="Mine"),
+        Submission(student_number="ASYNC001", submission_type=SubmissionType.THESIS, title="Theirs"),
+    ])
+    db.commit()
+
+    assert [s["student_number"] for s in client.get("/api/v1/students/", headers=headers).json()] == ["ASYNC000"]
+    assert client.get("/api/v1/students/ASYNC001", headers=headers).status_code == 403
+
+    mine = client.get("/api/v1/submissions/", headers=headers).json()
+    assert [s["title"] for s in mine] == ["Mine"]
+    theirs = db.query(Submission).filter(Submission.title == "Theirs").one()
+    assert client.get(f"/api/v1/submissions/{theirs.id}", headers=headers).status_code == 403
+    assert client.get("/api/v1/reports/student-overview", headers=headers).status_code == 403
+
+    streamed = client.get("/api/v1/submissions/?stream=true", headers=headers)
+    assert streamed.status_code == 200
+    assert [s["title"] for s in streamed.json()] == ["Mine"]
+
+def test_async_notification_inbox_newest_first(async_api):
+    client, db = async_api
+    user, headers = _login(db, "async_inbox", "supervisor")
+    now = datetime.utcnow()
+    db.add_all([
+        Notification(user_id=user.id, type=NotificationType.IN_APP, title=f"N{i}", message="m",
+                     action_type="test", status=NotificationStatus.SENT, created_at=now - timedelta(minutes=i))
+        for i in range(3)
+    ])
+    db.commit()
+
+    response = client.get("/api/v1/notifications/me?limit=2", headers=headers)
+    assert response.status_code == 200
+    assert [n["title"] for n in response.json()] == ["N0", "N1"]
+    assert "X-Next-Cursor" in response.headers
+    assert client.get(f"/api/v1/notifications/user/{user.id + 1}", headers=headers).status_code == 403
+
+def test_async_report_computes_then_serves_snapshot(async_api):
+    client, db = async_api
+    _students(db, 3)
+    db.add_all([Registration(student_number=f"ASYNC{i:03d}", registration_status="active") for i in range(3)])
+    db.commit()
+    _, headers = _login(db, "async_reports", "system_admin")
+
+    live = client.get("/api/v1/reports/student-overview", headers=headers)
+    assert live.status_code == 200
+    assert live.json()["snapshot"]["source"] == "live"
+
+    cached = client.get("/api/v1/reports/student-overview", headers=headers).json()
+    assert cached["snapshot"]["source"] == "snapshot"
+    assert cached["total_students"] == live.json()["total_students"] == 3
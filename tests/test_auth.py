@@ -98,3 +98,177 @@ def test_duplicate_username(client):
     response2 = client.post("/api/v1/auth/register", json=user2_data)
     assert response2.status_code == 400
     assert "Username already registered" in response2.json()["detail"]
+
+def test_authenticated_principal_is_cached(client, db_session):
+    from sqlalchemy import event
+
+    user = User(
+        username="cacheduser",
+        email="cached@edgehill.ac.uk",
+        hashed_password=get_password_hash("password123"),
+        role="student"
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    token = create_access_token(data={"sub": user.username, "role": user.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/auth/me", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.json()["username"] == "cacheduser"
+    assert not any("FROM users" in statement for statement in statements)
+
+def test_admin_role_change_invalidates_cached_principal(client, db_session):
+    admin = User(
+        username="cacheadmin",
+        email="cacheadmin@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    user = User(
+        username="promoted",
+        email="promoted@edgehill.ac.uk",
+        hashed_password=get_password_hash("password123"),
+        role="student"
+    )
+    db_session.add_all([admin, user])
+    db_session.commit()
+
+    user_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"}
+    admin_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': admin.username})}"}
+
+    assert client.get("/api/v1/reports/student-overview", headers=user_headers).status_code == 403
+
+    response = client.put(f"/api/v1/auth/admin/users/{user.id}", json={"role": "gbos_admin"}, headers=admin_headers)
+    assert response.status_code == 200
+
+    assert client.get("/api/v1/auth/me", headers=user_headers).json()["role"] == "gbos_admin"
+    assert client.get("/api/v1/reports/student-overview", headers=user_headers).status_code == 200
+
+def test_login_rehashes_outdated_cost_factor(client, db_session):
+    from passlib.context import CryptContext
+    from app.core.config import settings
+
+    legacy_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    user = User(
+        username="legacyhash",
+        email="legacyhash@edgehill.ac.uk",
+        hashed_password=legacy_context.hash("testpassword123"),
+        role="student"
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post("/api/v1/auth/token", json={"username": "legacyhash", "password": "testpassword123"})
+    assert response.status_code == 200
+
+    db_session.refresh(user)
+    assert user.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+    response = client.post("/api/v1/auth/token", json={"username": "legacyhash", "password": "testpassword123"})
+    assert response.status_code == 200
+
+def test_login_returns_429_when_hashing_pool_is_full(client, db_session, monkeypatch):
+    import threading
+    from app.core import security
+
+    user = User(
+        username="stormuser",
+        email="storm@edgehill.ac.uk",
+        hashed_password=get_password_hash("testpassword123"),
+        role="student"
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    pool = security.PasswordHashingPool(max_workers=1, max_queue=0)
+    monkeypatch.setattr(security, "hashing_pool", pool)
+
+    release = threading.Event()
+    started = threading.Event()
+    def occupy():
+        started.set()
+        release.wait(5)
+    worker = threading.Thread(target=pool.run, args=(occupy,))
+    worker.start()
+    started.wait(5)
+    try:
+        response = client.post("/api/v1/auth/token", json={"username": "stormuser", "password": "testpassword123"})
+    finally:
+        release.set()
+        worker.join()
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    assert pool.stats()["rejected"] == 1
+
+    response = client.post("/api/v1/auth/token", json={"username": "stormuser", "password": "testpassword123"})
+    assert response.status_code == 200
+
+def test_admin_user_list_pages_with_cursor_header(client, db_session):
+    for index in range(3):
+        db_session.add(User(username=f"paged_user_{index}", email=f"paged{index}@edgehill.ac.uk",
+                            hashed_password="not-a-real-hash", role="system_admin"))
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'paged_user_0'})}"}
+
+    first = client.get("/api/v1/auth/admin/users?limit=2", headers=headers)
+    assert first.status_code == 200
+    assert [user["username"] for user in first.json()] == ["paged_user_0", "paged_user_1"]
+    rest = client.get(f"/api/v1/auth/admin/users?cursor={first.headers['x-next-cursor']}", headers=headers)
+    assert [user["username"] for user in rest.json()] == ["paged_user_2"]
+    assert "x-next-cursor" not in rest.headers
+
+def test_hashing_pool_run_async_leaves_the_event_loop_free():
+    import asyncio
+    import threading
+    from app.core.security import PasswordHashingPool
+
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def hash_slowly():
+        started.set()
+        release.wait(5)
+        return "hashed"
+
+    async def scenario():
+        hashing = asyncio.ensure_future(pool.run_async(hash_slowly))
+        # The loop keeps running other coroutines while the hash is in progress
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        assert not hashing.done()
+        assert pool.stats()["running"] == 1
+        release.set()
+        return await hashing
+
+    assert asyncio.run(scenario()) == "hashed"
+    assert pool.stats() == {**pool.stats(), "running": 0, "queue_depth": 0, "completed": 1}
+
+def test_metrics_require_system_admin(client, db_session):
+    for username, role in (("metrics_admin", "system_admin"), ("metrics_student", "student")):
+        db_session.add(User(username=username, email=f"{username}@edgehill.ac.uk",
+                            hashed_password=get_password_hash("secret123"), role=role))
+    db_session.commit()
+
+    assert client.get("/metrics").status_code == 403
+    student = {"Authorization": f"Bearer {create_access_token({'sub': 'metrics_student'})}"}
+    assert client.get("/metrics", headers=student).status_code == 403
+    admin = {"Authorization": f"Bearer {create_access_token({'sub': 'metrics_admin'})}"}
+    response = client.get("/metrics", headers=admin)
+    assert response.status_code == 200
+    assert "database_pool" in response.json()
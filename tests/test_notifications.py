@@ -0,0 +1,275 @@
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+import smtplib
+from sqlalchemy import event
+from app.models.notification import Notification, NotificationStatus, NotificationType
+from app.models.user import User
+from app.services import notification_service
+from app.services.notification_service import NotificationService
+from app.core.smtp_pool import SMTPConnectionPool
+from app.workers.notification_worker import NotificationWorker
+from app.core.security import create_access_token, get_password_hash
+from tests.smtp_stub import StubSMTPServer
+
+def _admin(db_session):
+    admin = User(
+        username="notify_admin",
+        email="notify_admin@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin)
+    db_session.commit()
+    return admin
+
+def _notification(db_session, user, **overrides):
+    values = dict(
+        user_id=user.id,
+        type=NotificationType.IN_APP,
+        title="Test",
+        message="Test message",
+        action_type="test",
+        status=NotificationStatus.PENDING,
+        scheduled_at=datetime.utcnow() - timedelta(seconds=1)
+    )
+    values.update(overrides)
+    notification = Notification(**values)
+    db_session.add(notification)
+    db_session.commit()
+    return notification
+
+def test_create_notification_only_queues(client, db_session, monkeypatch):
+    admin = _admin(db_session)
+
+    def fail_smtp(*args, **kwargs):
+        raise AssertionError("SMTP must not be contacted during the request")
+    monkeypatch.setattr(smtplib, "SMTP", fail_smtp)
+
+    token = create_access_token(data={"sub": admin.username, "role": admin.role})
+    response = client.post(
+        "/api/v1/notifications/",
+        json={
+            "user_id": admin.id,
+            "type": "email",
+            "title": "Queued",
+            "message": "Delivered by the worker",
+            "action_type": "test"
+        },
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+def test_in_app_notifications_are_delivered_on_insert(client, db_session):
+    admin = _admin(db_session)
+    token = create_access_token(data={"sub": admin.username, "role": admin.role})
+    response = client.post(
+        "/api/v1/notifications/",
+        json={
+            "user_id": admin.id,
+            "type": "in_app",
+            "title": "Stored",
+            "message": "Nothing to send",
+            "action_type": "test"
+        },
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "delivered"
+    assert response.json()["delivered_at"] is not None
+    assert NotificationService.deliver_pending_notifications(db_session, batch_size=10)["claimed"] == 0
+
+def test_deliver_pending_notifications(db_session):
+    admin = _admin(db_session)
+    in_app = _notification(db_session, admin)
+    email = _notification(db_session, admin, type=NotificationType.EMAIL, recipient_email=admin.email)
+    later = _notification(db_session, admin, scheduled_at=datetime.utcnow() + timedelta(hours=1))
+
+    result = NotificationService.deliver_pending_notifications(db_session, batch_size=10)
+
+    assert result == {"claimed": 2, "sent": 1, "failed": 1}
+    assert in_app.status == NotificationStatus.DELIVERED
+    # No SMTP credentials in the test environment
+    assert email.status == NotificationStatus.FAILED
+    assert email.retry_count == 1
+    assert later.status == NotificationStatus.PENDING
+
+def test_retry_failed_notifications_requeues(db_session):
+    admin = _admin(db_session)
+    retryable = _notification(db_session, admin, status=NotificationStatus.FAILED, retry_count=1)
+    exhausted = _notification(db_session, admin, status=NotificationStatus.FAILED, retry_count=3)
+
+    result = NotificationService.retry_failed_notifications(db_session, admin)
+
+    db_session.expire_all()
+    assert result == {"retried": 1, "successful": 0, "failed": 0, "queued": 1}
+    assert retryable.status == NotificationStatus.PENDING
+    assert exhausted.status == NotificationStatus.FAILED
+
+def test_worker_drains_outbox_in_batches(db_session, monkeypatch):
+    admin = _admin(db_session)
+    for _ in range(5):
+        _notification(db_session, admin)
+
+    batches = []
+    deliver = NotificationService.deliver_pending_notifications
+    def record(db, batch_size=None):
+        result = deliver(db, batch_size)
+        batches.append(result["claimed"])
+        return result
+    monkeypatch.setattr(NotificationService, "deliver_pending_notifications", record)
+
+    worker = NotificationWorker(lambda: db_session, batch_size=2, poll_interval=0)
+    assert worker.run_once() == 5
+    assert batches == [2, 2, 1]
+    assert db_session.query(Notification).filter(
+        Notification.status == NotificationStatus.PENDING
+    ).count() == 0
+
+def _stub_pool(stub, **overrides):
+    options = dict(username="pgr@edgehill.ac.uk", password="secret", use_tls=False, size=2)
+    options.update(overrides)
+    return SMTPConnectionPool("127.0.0.1", stub.port, **options)
+
+def _message(recipient):
+    message = EmailMessage()
+    message["From"] = "pgr@edgehill.ac.uk"
+    message["To"] = recipient
+    message["Subject"] = "Test"
+    message.set_content("Test message")
+    return message
+
+def test_smtp_pool_reuses_sessions():
+    stub = StubSMTPServer().start()
+    pool = _stub_pool(stub)
+    try:
+        assert pool.send_batch([_message(f"s{i}@edgehill.ac.uk") for i in range(5)]) == [None] * 5
+        pool.send(_message("late@edgehill.ac.uk"))
+
+        assert len(stub.messages) == 6
+        assert stub.sessions == 1
+        assert pool.stats()["connections_opened"] == 1
+    finally:
+        pool.close()
+        stub.stop()
+
+def test_smtp_pool_reconnects_and_isolates_failures():
+    stub = StubSMTPServer().start()
+    stub.max_messages_per_session = 2
+    stub.rejected_recipients = ["nobody@edgehill.ac.uk"]
+    pool = _stub_pool(stub)
+    try:
+        recipients = ["a@edgehill.ac.uk", "b@edgehill.ac.uk", "nobody@edgehill.ac.uk", "c@edgehill.ac.uk"]
+        results = pool.send_batch([_message(recipient) for recipient in recipients])
+
+        assert [error is None for error in results] == [True, True, False, True]
+        assert isinstance(results[2], smtplib.SMTPRecipientsRefused)
+        assert len(stub.messages) == 3
+        assert pool.stats()["reconnects"] == 1
+    finally:
+        pool.close()
+        stub.stop()
+
+def test_smtp_pool_keeps_sent_results_when_the_session_is_lost():
+    stub = StubSMTPServer().start()
+    stub.max_messages_per_session = 2
+    stub.max_sessions = 1
+    pool = _stub_pool(stub)
+    try:
+        results = pool.send_batch([_message(f"s{i}@edgehill.ac.uk") for i in range(4)])
+
+        assert results[:2] == [None, None]
+        assert all(isinstance(error, smtplib.SMTPException) for error in results[2:])
+        assert len(stub.messages) == 2
+        assert pool.stats()["idle"] == 0
+    finally:
+        pool.close()
+        stub.stop()
+
+def test_deliver_pending_emails_share_one_session(db_session, monkeypatch):
+    admin = _admin(db_session)
+    emails = [
+        _notification(db_session, admin, type=NotificationType.EMAIL, recipient_email=f"s{i}@edgehill.ac.uk")
+        for i in range(3)
+    ]
+    stub = StubSMTPServer().start()
+    pool = _stub_pool(stub)
+    monkeypatch.setattr(notification_service, "smtp_pool", pool)
+    try:
+        result = NotificationService.deliver_pending_notifications(db_session, batch_size=10)
+
+        assert result == {"claimed": 3, "sent": 3, "failed": 0}
+        assert all(email.status == NotificationStatus.SENT for email in emails)
+        assert stub.sessions == 1
+    finally:
+        pool.close()
+        stub.stop()
+
+def test_bulk_notification_is_set_based(client, db_session):
+    admin = _admin(db_session)
+    students = [
+        User(username=f"bulk{i}", email=f"bulk{i}@edgehill.ac.uk", hashed_password="x", role="student")
+        for i in range(25)
+    ]
+    db_session.add_all(students)
+    db_session.commit()
+    user_ids = [student.id for student in students]
+    student_emails = [student.email for student in students]
+    token = create_access_token(data={"sub": admin.username, "role": admin.role})
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.post(
+            "/api/v1/notifications/bulk",
+            json={
+                "user_ids": user_ids + [999999],
+                "title": "Appraisal Due",
+                "message": "Please complete your appraisal",
+                "action_type": "appraisal_due"
+            },
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 25
+    assert [item["recipient_email"] for item in data] == student_emails
+    assert all(item["status"] == "pending" for item in data)
+    # RETURNING in parameter order is batched where the dialect can sort it (PostgreSQL);
+    # SQLite cannot, so SQLAlchemy inserts row by row there
+    inserts = sum(statement.lstrip().upper().startswith("INSERT") for statement in statements)
+    assert inserts == (len(data) if engine.dialect.name == "sqlite" else 1)
+    # One lookup for the authenticated user, one for all recipients
+    assert sum("FROM users" in statement for statement in statements) == 2
+
+def test_my_notifications_cursor_pagination(client, db_session):
+    admin = _admin(db_session)
+    created = datetime(2026, 1, 1)
+    # Two notifications share a timestamp; the id breaks the tie
+    for offset in (0, 1, 1, 2, 3):
+        _notification(db_session, admin, created_at=created + timedelta(minutes=offset))
+    expected = [
+        notification.id for notification in db_session.query(Notification).order_by(
+            Notification.created_at.desc(), Notification.id.desc()
+        )
+    ]
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': admin.username, 'role': admin.role})}"}
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/v1/notifications/me", params=params, headers=headers)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert seen == expected
@@ -1,8 +1,9 @@
 from datetime import date, datetime
 from app.models.submission import Submission as SubmissionModel
 from app.models.registration import Registration as RegistrationModel
-from app.models.timeline import Timeline as TimelineModel
+from app.models.timeline import Timeline as TimelineModel, TimelineStage
 from app.models.appraisal import Appraisal as AppraisalModel
+from app.models.student import Student as StudentModel
 from app.models.user import User
 from app.schemas.submission import SubmissionTypeEnum, SubmissionStatusEnum
 from app.schemas.timeline import TimelineStageEnum
@@ -447,3 +448,208 @@ def test_reports_require_authentication(client):
     
     response = client.get("/api/v1/reports/submission-analytics")
     assert response.status_code == 401
+
+def test_export_student_data_streams_csv_rows(client, db_session):
+    admin_user = User(
+        username="gbos_admin",
+        email="gbos@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="gbos_admin"
+    )
+    student = StudentModel(
+        student_number="S24242424",
+        forename="Ada",
+        surname="Lovelace",
+        programme_of_study="Computer Science, PhD"
+    )
+    db_session.add_all([admin_user, student])
+    db_session.commit()
+
+    registration = RegistrationModel(
+        student_number="S24242424",
+        registration_status="active"
+    )
+    db_session.add(registration)
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin_user.username, "role": admin_user.role})
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"}
+
+    response = client.get("/api/v1/reports/export/student-data", headers=headers)
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+    lines = response.text.splitlines()
+    assert lines[0] == "student_number,programme,status,supervisor"
+    assert 'S24242424,"Computer Science, PhD",active,' in lines
+
+def test_export_student_data_gzip(client, db_session):
+    admin_user = User(
+        username="gbos_admin",
+        email="gbos@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="gbos_admin"
+    )
+    db_session.add(admin_user)
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin_user.username, "role": admin_user.role})
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"}
+
+    response = client.get("/api/v1/reports/export/student-data", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.startswith("student_number,programme,status,supervisor")
+
+def test_department_dashboard_single_round_trip(db_session):
+    from sqlalchemy import event
+    from app.models.submission import SubmissionStatus, SubmissionType
+    from app.models.viva_team import VivaTeam as VivaTeamModel, VivaStage
+    from app.services.report_service import ReportService
+
+    db_session.add_all([
+        RegistrationModel(student_number="S25252525", registration_status="active"),
+        RegistrationModel(student_number="S26262626", registration_status="withdrawn"),
+        SubmissionModel(
+            student_number="S25252525",
+            submission_type=SubmissionType.THESIS,
+            title="Thesis Draft",
+            status=SubmissionStatus.UNDER_REVIEW
+        ),
+        TimelineModel(
+            student_number="S25252525",
+            stage=TimelineStage.PROPOSAL,
+            milestone_name="Proposal",
+            planned_date=date(2020, 1, 1),
+            status="pending"
+        ),
+        VivaTeamModel(student_number="S25252525", stage=VivaStage.FINAL)
+    ])
+    db_session.commit()
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        data = ReportService.get_department_dashboard(db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert data["active_students"] == 1
+    assert data["pending_submissions"] == 1
+    assert data["overdue_milestones"] == 1
+    assert data["pending_appraisals"] == 0
+    assert data["pending_viva_teams"] == 1
+
+def test_submission_and_appraisal_analytics_aggregate_in_sql(db_session):
+    from sqlalchemy import event
+    from app.models.submission import SubmissionStatus, SubmissionType
+    from app.models.appraisal import AppraisalStatus
+    from app.services.report_service import ReportService
+
+    db_session.add_all([
+        SubmissionModel(student_number="S27272727", submission_type=SubmissionType.THESIS,
+                        title="Thesis", status=SubmissionStatus.SUBMITTED),
+        SubmissionModel(student_number="S27272727", submission_type=SubmissionType.THESIS,
+                        title="Thesis v2", status=SubmissionStatus.APPROVED),
+        SubmissionModel(student_number="S28282828", submission_type=SubmissionType.CORRECTION,
+                        title="Corrections", status=SubmissionStatus.SUBMITTED),
+        AppraisalModel(student_number="S27272727", academic_year="2030-31", appraisal_period="Q1",
+                       status=AppraisalStatus.APPROVED, student_progress_report="x" * 1000),
+        AppraisalModel(student_number="S28282828", academic_year="2030-31", appraisal_period="Q1",
+                       status=AppraisalStatus.PENDING),
+        AppraisalModel(student_number="S28282828", academic_year="2030-31", appraisal_period="Q2",
+                       status=AppraisalStatus.PENDING)
+    ])
+    db_session.commit()
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        submissions = ReportService.get_submission_analytics(db_session)
+        appraisals = ReportService.get_appraisal_completion_rates(db_session, "2030-31")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == 2
+    assert all("GROUP BY" in statement for statement in statements)
+    assert not any("student_progress_report" in statement for statement in statements)
+
+    by_type = {item["type"]: item["count"] for item in submissions["by_type"]}
+    by_status = {item["status"]: item["count"] for item in submissions["by_status"]}
+    assert by_type["thesis"] == 2 and by_type["correction"] == 1
+    assert by_status["submitted"] == 2 and by_status["approved"] == 1
+
+    assert appraisals["total_appraisals"] == 3
+    assert round(appraisals["completion_rate"], 2) == 33.33
+    assert {item["period"]: item["count"] for item in appraisals["by_period"]} == {"Q1": 2, "Q2": 1}
+
+def test_reports_are_served_from_snapshots(client, db_session):
+    admin_user = User(
+        username="system_admin",
+        email="admin@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin_user)
+    db_session.add(RegistrationModel(student_number="S29292929", registration_status="active"))
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin_user.username, "role": admin_user.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get("/api/v1/reports/department-dashboard", headers=headers).json()
+    assert first["snapshot"]["source"] == "live"
+    assert first["snapshot"]["stale"] is False
+    assert "generated_at" in first["snapshot"]
+
+    db_session.add(RegistrationModel(student_number="S30303030", registration_status="active"))
+    db_session.commit()
+
+    cached = client.get("/api/v1/reports/department-dashboard", headers=headers).json()
+    assert cached["snapshot"]["source"] == "snapshot"
+    assert cached["active_students"] == first["active_students"]
+
+    fresh = client.get("/api/v1/reports/department-dashboard?fresh=true", headers=headers).json()
+    assert fresh["snapshot"]["source"] == "live"
+    assert fresh["active_students"] == first["active_students"] + 1
+
+def test_refresh_stale_snapshots_regenerates_old_reports(db_session):
+    from datetime import timedelta
+    from app.models.report_snapshot import ReportSnapshot
+    from app.services.report_snapshot_service import ReportSnapshotService
+
+    ReportSnapshotService.get_report(db_session, "appraisal-completion")
+    snapshot = ReportSnapshotService.get_latest_snapshot(db_session, "appraisal-completion")
+    snapshot.generated_at = snapshot.generated_at - timedelta(hours=1)
+    # A parametrised snapshot left from before those were computed live
+    db_session.add(ReportSnapshot(report_name="appraisal-completion", params_key='{"academic_year": "2031-32"}',
+                                  payload="{}", generated_at=snapshot.generated_at))
+    db_session.commit()
+
+    refreshed = ReportSnapshotService.refresh_stale_snapshots(db_session, max_age_seconds=60)
+
+    # Every default report, including the stale one; the parametrised row is pruned
+    assert refreshed == len(ReportSnapshotService.REPORTS)
+    assert db_session.query(ReportSnapshot).filter(
+        ReportSnapshot.report_name == "appraisal-completion"
+    ).count() == 1
+    assert ReportSnapshotService.refresh_stale_snapshots(db_session, max_age_seconds=60) == 0
+
+def test_parametrised_reports_are_computed_live_and_not_stored(db_session):
+    from app.models.report_snapshot import ReportSnapshot
+    from app.services.report_snapshot_service import ReportSnapshotService
+
+    for year in ("2031-32", "2032-33"):
+        report = ReportSnapshotService.get_report(db_session, "appraisal-completion", {"academic_year": year})
+        assert report["snapshot"]["source"] == "live"
+
+    assert db_session.query(ReportSnapshot).count() == 0
@@ -0,0 +1,35 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.main import app
+from app.core.responses import ORJSONResponse
+from app.models.appraisal import AppraisalStatus
+from app.models.notification import NotificationStatus
+from app.models.submission import SubmissionStatus
+from app.models.viva_team import VivaStatus
+
+def test_orjson_response_matches_stdlib_encoding():
+    payload = {
+        "statuses": [SubmissionStatus.UNDER_REVIEW, VivaStatus.SCHEDULED,
+                     AppraisalStatus.DOS_SUBMITTED, NotificationStatus.SENT],
+        "by_status": {SubmissionStatus.APPROVED: 3, VivaStatus.PROPOSED: 1},
+        "deadline": date(2025, 9, 30),
+        "submitted": datetime(2025, 3, 1, 9, 30, 15, 250000),
+        "generated_at": datetime(2025, 3, 1, 9, 30, tzinfo=timezone.utc),
+        "average_days": Decimal("12.5"),
+        "by_year": {2024: 10, 2025: 12},
+        "title": "Thèse",
+    }
+
+    body = ORJSONResponse(payload).body
+    assert body == JSONResponse(jsonable_encoder(payload)).body
+    assert b'"deadline":"2025-09-30"' in body
+    assert b'"submitted":"2025-03-01T09:30:15.250000"' in body
+    assert b'"statuses":["under_review","scheduled","dos_submitted","sent"]' in body
+
+def test_app_renders_with_orjson_by_default(client):
+    assert app.router.default_response_class is ORJSONResponse
+    response = client.get("/health")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "healthy"}
@@ -0,0 +1,76 @@
+from app.models.student import Student
+from app.models.supervisor import Supervisor
+from app.models.user import User
+from app.core.security import create_access_token, get_password_hash
+from app.core.typeahead import typeahead_index
+
+def _user(db_session, username, role):
+    user = User(
+        username=username,
+        email=f"{username}@edgehill.ac.uk",
+        hashed_password=get_password_hash("password123"),
+        role=role,
+        first_name="Alex",
+        last_name="Admin"
+    )
+    db_session.add(user)
+    db_session.commit()
+    token = create_access_token(data={"sub": user.username, "role": user.role})
+    return {"Authorization": f"Bearer {token}"}
+
+def test_typeahead_tracks_committed_changes(client, db_session):
+    headers = _user(db_session, "admin", "system_admin")
+    db_session.add_all([
+        Student(student_number="EH93001", forename="Marion", surname="Marshall", programme_of_study="PhD"),
+        Student(student_number="EH93002", forename="Mark", surname="Evans", programme_of_study="PhD"),
+        Supervisor(supervisor_name="Dr. Mark Turner", email="turnerm@edgehill.ac.uk", department="History"),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/search/typeahead", params={"q": "mar"}, headers=headers)
+    assert response.status_code == 200
+    assert {(match["kind"], match["label"]) for match in response.json()} == {
+        ("student", "Marion Marshall"), ("student", "Mark Evans"), ("supervisor", "Dr. Mark Turner")
+    }
+
+    # Whole-word matches rank ahead of prefix-only matches
+    response = client.get("/api/v1/search/typeahead", params={"q": "mark", "kind": "student"}, headers=headers)
+    assert [match["id"] for match in response.json()] == ["EH93002"]
+
+    response = client.get("/api/v1/search/typeahead", params={"q": "mark tur"}, headers=headers)
+    assert [match["detail"] for match in response.json()] == ["turnerm@edgehill.ac.uk"]
+
+    response = client.get("/api/v1/search/typeahead", params={"q": "eh93"}, headers=headers)
+    assert sorted(match["id"] for match in response.json()) == ["EH93001", "EH93002"]
+
+    # Rolled-back writes never reach the index; deletes are removed on commit
+    savepoint = db_session.begin_nested()
+    db_session.add(Student(student_number="EH93003", forename="Mary", surname="Rollback", programme_of_study="PhD"))
+    db_session.flush()
+    savepoint.rollback()
+    db_session.delete(db_session.get(Student, "EH93001"))
+    db_session.commit()
+
+    response = client.get("/api/v1/search/typeahead", params={"q": "mar", "kind": "student"}, headers=headers)
+    assert [match["label"] for match in response.json()] == ["Mark Evans"]
+
+def test_typeahead_build_and_permissions(client, db_session):
+    headers = _user(db_session, "gbos", "gbos_admin")
+    db_session.add(Student(student_number="EH94001", forename="Priya", surname="Patel", programme_of_study="PhD"))
+    db_session.commit()
+
+    typeahead_index.clear()
+    assert typeahead_index.build(db_session) == 2
+
+    response = client.get("/api/v1/search/typeahead", params={"q": "pat"}, headers=headers)
+    assert [match["id"] for match in response.json()] == ["EH94001"]
+
+    # User accounts are for system admins only
+    response = client.get("/api/v1/search/typeahead", params={"q": "alex"}, headers=headers)
+    assert response.json() == []
+    response = client.get("/api/v1/search/typeahead", params={"q": "alex", "kind": "user"}, headers=headers)
+    assert response.status_code == 403
+
+    student_headers = _user(db_session, "EH94001", "student")
+    response = client.get("/api/v1/search/typeahead", params={"q": "pat"}, headers=student_headers)
+    assert response.status_code == 403
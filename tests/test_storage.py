@@ -0,0 +1,76 @@
+import asyncio
+import io
+import os
+import pytest
+from fastapi import UploadFile
+from app.models.submission import Submission
+from app.services.submission_service import SubmissionService
+from app.storage import get_storage, LocalStorage, ContentAddressedStorage
+
+def _save(storage, key, content):
+    return asyncio.run(storage.save(UploadFile(io.BytesIO(content), filename=key), key))
+
+def test_get_storage_selects_backend(tmp_path):
+    assert isinstance(get_storage("local", str(tmp_path)), LocalStorage)
+    assert isinstance(get_storage("content_addressed", str(tmp_path)), ContentAddressedStorage)
+
+def test_content_addressed_storage_dedupes_identical_uploads(tmp_path):
+    storage = ContentAddressedStorage(str(tmp_path))
+    draft = b"thesis draft" * 1000
+
+    first = _save(storage, "submissions/1/thesis.pdf", draft)
+    second = _save(storage, "submissions/2/correction.pdf", draft)
+
+    assert first.sha256 == second.sha256
+    assert first.path != second.path
+    assert open(second.path, "rb").read() == draft
+    assert os.path.samefile(first.path, storage.blob_path(first.sha256))
+    assert storage.reference_count(first.sha256) == 2
+    assert storage.stats()["blobs"] == 1
+    assert os.listdir(tmp_path / ".incoming") == []
+
+def test_content_addressed_storage_collects_unreferenced_blobs(tmp_path):
+    storage = ContentAddressedStorage(str(tmp_path))
+    first = _save(storage, "submissions/1/thesis.pdf", b"version one")
+    second = _save(storage, "submissions/2/thesis.pdf", b"version one")
+
+    # Re-uploading new content at the same key releases the old blob reference
+    updated = _save(storage, "submissions/1/thesis.pdf", b"version two")
+    storage.replace(first.path, first.sha256, updated)
+    assert storage.reference_count(first.sha256) == 1
+    assert open(first.path, "rb").read() == b"version two"
+
+    storage.delete(second.path, second.sha256)
+    assert not os.path.exists(storage.blob_path(first.sha256))
+    assert os.path.exists(storage.blob_path(updated.sha256))
+
+    storage.delete(updated.path, updated.sha256)
+    assert storage.stats()["blobs"] == 0
+
+def test_content_addressed_storage_deletes_files_saved_before_it(tmp_path):
+    storage = ContentAddressedStorage(str(tmp_path))
+    legacy = LocalStorage(str(tmp_path))
+    old = _save(legacy, "submissions/1/thesis.pdf", b"saved by local storage")
+
+    storage.delete(old.path, old.sha256)
+    assert not os.path.exists(old.path)
+
+class _FailingCommitSession:
+    def commit(self):
+        raise RuntimeError("commit failed")
+
+    def rollback(self):
+        pass
+
+def test_attach_file_keeps_previous_file_when_commit_fails(tmp_path):
+    storage = ContentAddressedStorage(str(tmp_path))
+    previous = _save(storage, "submissions/1/v1.pdf", b"version one")
+    submission = Submission(id=1, file_path=previous.path, file_sha256=previous.sha256)
+    replacement = _save(storage, "submissions/1/v2.pdf", b"version two")
+
+    with pytest.raises(RuntimeError):
+        SubmissionService.attach_file(_FailingCommitSession(), submission, storage, replacement, "v2.pdf", None)
+
+    assert open(previous.path, "rb").read() == b"version one"
+    assert not os.path.exists(replacement.path)
+    assert storage.reference_count(replacement.sha256) == 0
@@ -1,3 +1,4 @@
+from sqlalchemy import event
 from app.models.user import User
 from app.models.student import Student
 from app.core.security import create_access_token, get_password_hash
@@ -177,3 +178,142 @@ def test_update_student(client, db_session):
     assert data["mode"] == "Full-time"
     assert data["programme_of_study"] == "Updated PhD Programme"
     assert data["forename"] == "Update"
+
+def test_get_students_cursor_pagination(client, db_session):
+    admin = User(
+        username="admin_pages",
+        email="admin_pages@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin)
+    db_session.add_all([
+        Student(student_number=f"EH90{i:03d}", forename="Page", surname=f"Student {i}", programme_of_study="PhD")
+        for i in (4, 1, 3, 5, 2)
+    ])
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin.username, "role": admin.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/students/", params=params, headers=headers)
+        assert response.status_code == 200
+        seen.extend(student["student_number"] for student in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == [f"EH90{i:03d}" for i in range(1, 6)]
+    assert cursor is None
+
+    response = client.get("/api/v1/students/", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert response.status_code == 400
+
+def test_get_students_bounded_with_total_and_stream(client, db_session, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "MAX_PAGE_SIZE", 3)
+
+    admin = User(
+        username="admin_bounded",
+        email="admin_bounded@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin)
+    db_session.add_all([
+        Student(student_number=f"EH91{i:03d}", forename="Bulk", surname=f"Student {i}", programme_of_study="History PhD")
+        for i in range(1, 6)
+    ])
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin.username, "role": admin.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Oversized limits are clamped rather than rejected
+    response = client.get("/api/v1/students/", params={"programme": "History", "limit": 5000, "with_total": True}, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert response.headers["X-Total-Count"] == "5"
+    assert response.headers["X-Next-Cursor"]
+
+    response = client.get("/api/v1/students/", params={"search": "Bulk"}, headers=headers)
+    assert "X-Total-Count" not in response.headers
+
+    response = client.get("/api/v1/students/", params={"programme": "History", "stream": True}, headers=headers)
+    assert response.status_code == 200
+    assert [student["student_number"] for student in response.json()] == [f"EH91{i:03d}" for i in range(1, 6)]
+
+def test_search_students_ranked(client, db_session):
+    admin = User(
+        username="admin_search",
+        email="admin_search@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin)
+    db_session.add_all([
+        Student(student_number="EH92001", forename="Mary", surname="Goldsmith", programme_of_study="PhD"),
+        Student(student_number="EH92002", forename="Tom", surname="Smithson", programme_of_study="PhD"),
+        Student(student_number="EH92003", forename="Ann", surname="Smith", programme_of_study="PhD"),
+        Student(student_number="EH92004", forename="Joe", surname="Bloggs", programme_of_study="PhD"),
+    ])
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin.username, "role": admin.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Exact, then prefix, then substring matches, paged one at a time
+    seen = []
+    params = {"search": "smith", "limit": 1}
+    while True:
+        response = client.get("/api/v1/students/", params=params, headers=headers)
+        assert response.status_code == 200
+        seen.extend(student["surname"] for student in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+    assert seen == ["Smith", "Smithson", "Goldsmith"]
+
+    response = client.get("/api/v1/students/", params={"search": "Ann Sm"}, headers=headers)
+    assert [student["student_number"] for student in response.json()] == ["EH92003"]
+
+    # LIKE wildcards in the search term are matched literally
+    response = client.get("/api/v1/students/", params={"search": "%"}, headers=headers)
+    assert response.json() == []
+
+def test_student_writes_return_server_defaults_without_reselecting(client, db_session):
+    admin = User(
+        username="admin_writes",
+        email="admin_writes@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin)
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': admin.username})}"}
+    client.get("/api/v1/students/", headers=headers)  # warm the principal cache
+
+    statements = []
+
+    @event.listens_for(db_session.bind, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    try:
+        created = client.post("/api/v1/students/", json={
+            "student_number": "EH2024900", "forename": "Write", "surname": "Path"
+        }, headers=headers)
+        updated = client.put("/api/v1/students/EH2024900", json={"surname": "Paths"}, headers=headers)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    assert created.status_code == 200 and created.json()["created_date"]
+    assert updated.status_code == 200 and updated.json()["surname"] == "Paths"
+    # Create: existence check then INSERT .. RETURNING; update: lookup then UPDATE .. RETURNING
+    assert [s for s in statements if s in ("SELECT", "INSERT", "UPDATE")] == ["SELECT", "INSERT", "SELECT", "UPDATE"]
@@ -1,7 +1,15 @@
-from app.models.submission import Submission as SubmissionModel
+import asyncio
+import hashlib
+import os
+import pytest
+from fastapi import HTTPException
+from app.models.submission import Submission as SubmissionModel, SubmissionType, SubmissionStatus
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.submission import SubmissionTypeEnum, SubmissionStatusEnum
 from app.core.security import create_access_token, get_password_hash
+from app.schemas.upload_session import UploadSessionCreate
+from app.services.upload_session_service import UploadSessionService
 
 def test_create_submission(client, db_session):
     student_user = User(
@@ -450,3 +458,267 @@ def test_submission_with_deadline(client, db_session):
     
     data = response.json()
     assert data["review_deadline"] is not None
+
+def _upload_fixture(db_session, username):
+    student_user = User(
+        username=username,
+        email=f"{username.lower()}@edgehill.ac.uk",
+        hashed_password=get_password_hash("student123"),
+        role="student"
+    )
+    submission = SubmissionModel(
+        student_number=username,
+        submission_type=SubmissionType.THESIS,
+        title="PhD Thesis",
+        status=SubmissionStatus.DRAFT
+    )
+    db_session.add_all([student_user, submission])
+    db_session.commit()
+    token = create_access_token(data={"sub": student_user.username, "role": student_user.role})
+    return submission.id, {"Authorization": f"Bearer {token}"}
+
+def test_upload_streams_to_disk_with_hash(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE_BYTES", 1024)
+    submission_id, headers = _upload_fixture(db_session, "S60606060")
+    content = os.urandom(10 * 1024 + 7)
+
+    response = client.post(
+        f"/api/v1/submissions/{submission_id}/upload",
+        files={"file": ("../../thesis.pdf", content, "application/pdf")},
+        headers=headers
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    upload_dir = tmp_path / "submissions" / str(submission_id)
+    assert data["file_name"] == "thesis.pdf"
+    assert data["file_size"] == len(content)
+    assert data["file_sha256"] == hashlib.sha256(content).hexdigest()
+    assert data["mime_type"] == "application/pdf"
+    assert data["file_path"] == str(upload_dir / "thesis.pdf")
+    assert os.listdir(upload_dir) == ["thesis.pdf"]
+    assert (upload_dir / "thesis.pdf").read_bytes() == content
+
+def test_upload_over_size_limit_rejected(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE_BYTES", 1024)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_BYTES", 4096)
+    submission_id, headers = _upload_fixture(db_session, "S61616161")
+
+    response = client.post(
+        f"/api/v1/submissions/{submission_id}/upload",
+        files={"file": ("thesis.pdf", b"x" * 5000, "application/pdf")},
+        headers=headers
+    )
+    assert response.status_code == 413
+    # Neither the final file nor the temporary part file is left behind
+    assert [files for _, _, files in os.walk(tmp_path) if files] == []
+
+def test_reupload_of_identical_file_is_deduplicated(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "content_addressed")
+    thesis_id, headers = _upload_fixture(db_session, "S62626262")
+    correction = SubmissionModel(
+        student_number="S62626262",
+        submission_type=SubmissionType.CORRECTION,
+        title="Corrections",
+        status=SubmissionStatus.DRAFT
+    )
+    db_session.add(correction)
+    db_session.commit()
+    content = b"%PDF-1.7 thesis draft" * 512
+
+    responses = [
+        client.post(
+            f"/api/v1/submissions/{submission_id}/upload",
+            files={"file": ("thesis.pdf", content, "application/pdf")},
+            headers=headers
+        )
+        for submission_id in (thesis_id, correction.id)
+    ]
+    assert [response.status_code for response in responses] == [200, 200]
+
+    first, second = (response.json() for response in responses)
+    assert first["file_sha256"] == second["file_sha256"]
+    assert first["file_path"] != second["file_path"]
+    assert os.path.samefile(first["file_path"], second["file_path"])
+    blobs = [name for _, _, files in os.walk(tmp_path / "blobs") for name in files]
+    assert blobs == [first["file_sha256"]]
+
+def test_download_file_supports_range_and_conditional_get(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    submission_id, headers = _upload_fixture(db_session, "S63636363")
+    content = bytes(range(256)) * 64
+    upload = client.post(
+        f"/api/v1/submissions/{submission_id}/upload",
+        files={"file": ("thesis.pdf", content, "application/pdf")},
+        headers=headers
+    )
+    assert upload.status_code == 200
+    etag = f'"{upload.json()["file_sha256"]}"'
+
+    response = client.get(f"/api/v1/submissions/{submission_id}/file", headers=headers)
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["etag"] == etag
+    assert response.headers["content-type"] == "application/pdf"
+    last_modified = response.headers["last-modified"]
+
+    partial = client.get(
+        f"/api/v1/submissions/{submission_id}/file",
+        headers={**headers, "Range": "bytes=100-199"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == content[100:200]
+    assert partial.headers["content-range"] == f"bytes 100-199/{len(content)}"
+
+    for conditional in ({"If-None-Match": etag}, {"If-Modified-Since": last_modified}):
+        cached = client.get(f"/api/v1/submissions/{submission_id}/file", headers={**headers, **conditional})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+    changed = client.get(
+        f"/api/v1/submissions/{submission_id}/file",
+        headers={**headers, "If-None-Match": '"stale"'}
+    )
+    assert changed.status_code == 200
+
+def test_download_file_requires_access(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    submission_id, headers = _upload_fixture(db_session, "S64646464")
+    _, other_headers = _upload_fixture(db_session, "S65656565")
+
+    assert client.get(f"/api/v1/submissions/{submission_id}/file", headers=headers).status_code == 404
+    client.post(
+        f"/api/v1/submissions/{submission_id}/upload",
+        files={"file": ("thesis.pdf", b"%PDF-1.7", "application/pdf")},
+        headers=headers
+    )
+    assert client.get(f"/api/v1/submissions/{submission_id}/file", headers=other_headers).status_code == 403
+
+def test_resumable_upload_assembles_parts(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    submission_id, headers = _upload_fixture(db_session, "S66666666")
+    parts = [os.urandom(3000), os.urandom(3000), os.urandom(1234)]
+    content = b"".join(parts)
+
+    response = client.post(
+        f"/api/v1/submissions/{submission_id}/uploads",
+        json={"file_name": "thesis.pdf", "mime_type": "application/pdf", "total_size": len(content)},
+        headers=headers
+    )
+    assert response.status_code == 200
+    upload_url = f"/api/v1/submissions/{submission_id}/uploads/{response.json()['id']}"
+
+    # Parts may arrive out of order and a retried part replaces the earlier attempt
+    for part_number, body in ((3, parts[2]), (1, b"interrupted"), (1, parts[0])):
+        response = client.put(f"{upload_url}/parts/{part_number}", content=body, headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"part_number": part_number, "size": len(body)}
+
+    status = client.get(upload_url, headers=headers).json()
+    assert [part["part_number"] for part in status["parts"]] == [1, 3]
+    assert status["received_bytes"] == len(parts[0]) + len(parts[2])
+
+    response = client.post(f"{upload_url}/complete", headers=headers)
+    assert response.status_code == 400
+    assert "Missing parts: [2]" in response.json()["detail"]
+
+    client.put(f"{upload_url}/parts/2", content=parts[1], headers=headers)
+    response = client.post(f"{upload_url}/complete", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["file_size"] == len(content)
+    assert data["file_sha256"] == hashlib.sha256(content).hexdigest()
+    assert data["mime_type"] == "application/pdf"
+
+    download = client.get(f"/api/v1/submissions/{submission_id}/file", headers=headers)
+    assert download.content == content
+    assert client.get(upload_url, headers=headers).json()["status"] == "completed"
+    assert client.put(f"{upload_url}/parts/4", content=b"late", headers=headers).status_code == 409
+    assert not (tmp_path / ".parts" / str(status["id"])).exists()
+
+def test_resumable_upload_limits_total_bytes_across_parts(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_BYTES", 5000)
+    submission_id, headers = _upload_fixture(db_session, "S69696969")
+
+    declared = client.post(
+        f"/api/v1/submissions/{submission_id}/uploads",
+        json={"file_name": "thesis.pdf", "total_size": 4000},
+        headers=headers
+    ).json()["id"]
+    upload_url = f"/api/v1/submissions/{submission_id}/uploads/{declared}"
+    assert client.put(f"{upload_url}/parts/1", content=os.urandom(3000), headers=headers).status_code == 200
+    assert client.put(f"{upload_url}/parts/2", content=os.urandom(1001), headers=headers).status_code == 413
+    # Re-sending a part is measured against the other parts only
+    assert client.put(f"{upload_url}/parts/1", content=os.urandom(3500), headers=headers).status_code == 200
+    assert client.put(f"{upload_url}/parts/2", content=os.urandom(500), headers=headers).status_code == 200
+    assert client.get(upload_url, headers=headers).json()["received_bytes"] == 4000
+
+    undeclared = client.post(
+        f"/api/v1/submissions/{submission_id}/uploads",
+        json={"file_name": "thesis.pdf"},
+        headers=headers
+    ).json()["id"]
+    upload_url = f"/api/v1/submissions/{submission_id}/uploads/{undeclared}"
+    for part_number in (1, 2):
+        assert client.put(f"{upload_url}/parts/{part_number}", content=os.urandom(2500), headers=headers).status_code == 200
+    assert client.put(f"{upload_url}/parts/3", content=b"x", headers=headers).status_code == 413
+    assert [part["part_number"] for part in client.get(upload_url, headers=headers).json()["parts"]] == [1, 2]
+
+def test_resumable_upload_reserves_parts_before_streaming(db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    submission_id, _ = _upload_fixture(db_session, "S61616161")
+    student = db_session.query(User).filter(User.username == "S61616161").one()
+    upload = UploadSessionService.initiate(
+        db_session, submission_id, UploadSessionCreate(file_name="thesis.pdf", total_size=4000), student
+    )
+    first_started = asyncio.Event()
+    release_first = asyncio.Event()
+
+    async def slow_part():
+        first_started.set()
+        await release_first.wait()
+        yield os.urandom(3000)
+
+    async def fast_part():
+        yield os.urandom(3000)
+
+    async def upload_in_parallel():
+        first = asyncio.create_task(UploadSessionService.upload_part(
+            db_session, submission_id, upload.id, 1, slow_part(), student, content_length=3000
+        ))
+        await first_started.wait()
+        # Nothing of part 1 is on disk yet, but its bytes are already spoken for
+        with pytest.raises(HTTPException) as rejected:
+            await UploadSessionService.upload_part(
+                db_session, submission_id, upload.id, 2, fast_part(), student, content_length=3000
+            )
+        release_first.set()
+        await first
+        return rejected.value
+
+    assert asyncio.run(upload_in_parallel()).status_code == 413
+    status = UploadSessionService.get_session(db_session, submission_id, upload.id, student)
+    assert [(part.part_number, part.size) for part in status.parts] == [(1, 3000)]
+
+def test_resumable_upload_abort_and_access(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    submission_id, headers = _upload_fixture(db_session, "S67676767")
+    _, other_headers = _upload_fixture(db_session, "S68686868")
+
+    upload_id = client.post(
+        f"/api/v1/submissions/{submission_id}/uploads",
+        json={"file_name": "thesis.pdf"},
+        headers=headers
+    ).json()["id"]
+    upload_url = f"/api/v1/submissions/{submission_id}/uploads/{upload_id}"
+    client.put(f"{upload_url}/parts/1", content=b"part one", headers=headers)
+
+    assert client.get(upload_url, headers=other_headers).status_code == 403
+    assert client.delete(upload_url, headers=headers).status_code == 200
+    assert client.put(f"{upload_url}/parts/2", content=b"part two", headers=headers).status_code == 409
+    assert not (tmp_path / ".parts" / str(upload_id)).exists()
@@ -208,3 +208,32 @@ def test_supervisor_not_found(client, db_session):
     
     response = client.get("/api/v1/supervisors/99999", headers=headers)
     assert response.status_code == 404
+
+def test_search_supervisors_paginated(client, db_session):
+    admin_user = User(
+        username="admin",
+        email="admin@edgehill.ac.uk",
+        hashed_password=get_password_hash("admin123"),
+        role="system_admin"
+    )
+    db_session.add(admin_user)
+    db_session.add_all([
+        Supervisor(supervisor_name=f"Dr. Search {i}", email=f"search{i}@edgehill.ac.uk", department="History")
+        for i in range(3)
+    ] + [Supervisor(supervisor_name="Dr. Other", email="other@edgehill.ac.uk", department="History")])
+    db_session.commit()
+
+    token = create_access_token(data={"sub": admin_user.username, "role": admin_user.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/api/v1/supervisors/", params={"search": "Search", "limit": 2, "with_total": True}, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count"] == "3"
+
+    response = client.get(
+        "/api/v1/supervisors/",
+        params={"search": "Search", "cursor": response.headers["X-Next-Cursor"]},
+        headers=headers
+    )
+    assert [supervisor["supervisor_name"] for supervisor in response.json()] == ["Dr. Search 2"]